@@ -0,0 +1,208 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Contains the DiskCache class which is used to keep fetched
+Stack Overflow pages on disk, so that repeat errors don't have to go
+over the network.
+'''
+
+import hashlib
+import os
+import threading
+import time
+import zlib
+
+DEFAULT_TTL = 60 * 60 * 24 * 7  # One week.
+DEFAULT_MAX_SIZE = 100 * 1024 * 1024  # 100 MB.
+
+# After an eviction, the cache is shrunk to this fraction of its max
+# size, so that every set doesn't trigger another eviction.
+LOW_WATER_MARK = 0.9
+
+
+class DiskCache:
+    '''
+    A content-addressed cache of strings on disk.
+
+    Each key (typically a url) is hashed, and the value is stored,
+    compressed, in a file named after the hash. Entries older than the
+    time to live are discarded on read, and once the cache grows past
+    its max size, the least recently used entries are evicted.
+    '''
+
+    def __init__(self, path, ttl=DEFAULT_TTL, max_size=DEFAULT_MAX_SIZE):
+        '''
+        Initializes a disk cache rooted at a directory.
+
+        Parameter {str} path: the directory to store entries in.
+        Parameter {int} ttl: seconds an entry is valid for.
+        Parameter {int} max_size: the max size of the cache, in bytes.
+        '''
+
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self._size = None
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        '''
+        Gets the value stored for a key.
+
+        Parameter {str} key: the key to look up.
+        Returns {str}: the cached value, or None, if the key isn't
+        cached or its entry has expired.
+        '''
+
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path, 'rb') as entry:
+                created = float(entry.readline())
+                data = entry.read()
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - created > self.ttl:
+            self.delete(key)
+            return None
+
+        try:
+            # The mtime of an entry is its last access time.
+            os.utime(entry_path, None)
+            return zlib.decompress(data).decode('utf-8')
+        except (OSError, zlib.error):
+            return None
+
+    def set(self, key, value):
+        '''
+        Stores a value for a key, evicting old entries if the cache
+        has grown too large.
+
+        Parameter {str} key: the key to store the value under.
+        Parameter {str} value: the value to store.
+        '''
+
+        entry_path = self._entry_path(key)
+        tmp_path = '{}.{}.tmp'.format(entry_path, threading.get_ident())
+        data = '{:.6f}\n'.format(time.time()).encode('ascii') + \
+            zlib.compress(value.encode('utf-8'))
+
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+
+            with open(tmp_path, 'wb') as entry:
+                entry.write(data)
+
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+
+            if self._size > self.max_size:
+                self._evict()
+
+    def delete(self, key):
+        '''
+        Removes the entry for a key, if it exists.
+
+        Parameter {str} key: the key to remove.
+        '''
+
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        '''
+        Removes every entry from the cache.
+        '''
+
+        with self._lock:
+            for entry_path, _, _ in self._entries():
+                try:
+                    os.remove(entry_path)
+                except OSError:
+                    pass
+
+            self._size = 0
+
+    def _entry_path(self, key):
+        '''
+        Builds the path of the file an entry is stored in. Entries are
+        sharded into sub-directories by the first two characters of
+        their hash.
+
+        Parameter {str} key: the key of the entry.
+        Returns {str}: the path of the entry.
+        '''
+
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+        return os.path.join(self.path, digest[:2], digest)
+
+    def _entries(self):
+        '''
+        A generator that yields every entry in the cache.
+
+        Yields {tuple}: the path, size and mtime of each entry.
+        '''
+
+        if not os.path.isdir(self.path):
+            return
+
+        for shard in os.listdir(self.path):
+            shard_path = os.path.join(self.path, shard)
+
+            if not os.path.isdir(shard_path):
+                continue
+
+            for name in os.listdir(shard_path):
+                if name.endswith('.tmp'):
+                    continue
+
+                entry_path = os.path.join(shard_path, name)
+
+                try:
+                    stat = os.stat(entry_path)
+                except OSError:
+                    continue
+
+                yield entry_path, stat.st_size, stat.st_mtime
+
+    def _scan_size(self):
+        '''
+        Returns {int}: the total size of every entry, in bytes.
+        '''
+
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        '''
+        Removes the least recently used entries until the cache is
+        under its low water mark.
+        '''
+
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(entry[1] for entry in entries)
+        target = self.max_size * LOW_WATER_MARK
+
+        for entry_path, entry_size, _ in entries:
+            if size <= target:
+                break
+
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+
+            size -= entry_size
+
+        self._size = size
@@ -0,0 +1,110 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the cache package.
+'''
+
+import os
+import time
+
+from autostack.cache import DiskCache
+
+
+def test_get_missing_key(tmp_path):
+    '''
+    Ensures that None is returned for a key that isn't cached.
+    '''
+
+    # 1. Given.
+    cache = DiskCache(str(tmp_path))
+
+    # 2. When.
+    value = cache.get('https://stackoverflow.com/questions/1')
+
+    # 3. Then.
+    assert value is None
+
+
+def test_set_then_get(tmp_path):
+    '''
+    Ensures that a stored value is returned for its key.
+    '''
+
+    # 1. Given.
+    cache = DiskCache(str(tmp_path))
+    url = 'https://stackoverflow.com/questions/1'
+
+    # 2. When.
+    cache.set(url, u'<html>\U0001F95E</html>')
+
+    # 3. Then.
+    assert cache.get(url) == u'<html>\U0001F95E</html>'
+    assert cache.get(url + '/other') is None
+
+
+def test_get_expired_entry(tmp_path, monkeypatch):
+    '''
+    Ensures that an entry older than the time to live is discarded.
+    '''
+
+    # 1. Given.
+    cache = DiskCache(str(tmp_path), ttl=60)
+    url = 'https://stackoverflow.com/questions/1'
+    cache.set(url, '<html></html>')
+    now = time.time()
+
+    monkeypatch.setattr('time.time', lambda: now + 61)
+
+    # 2. When.
+    value = cache.get(url)
+
+    # 3. Then.
+    # pylint: disable=protected-access
+    assert value is None
+    assert not os.path.exists(cache._entry_path(url))
+
+
+def test_set_evicts_least_recently_used(tmp_path):
+    '''
+    Ensures that once the cache is too large, the least recently used
+    entries are evicted first.
+    '''
+
+    # 1. Given.
+    value = os.urandom(512).hex()
+    cache = DiskCache(str(tmp_path), max_size=1500)
+    cache.set('a', value)
+    cache.set('b', value)
+
+    # Make 'a' the most recently used entry.
+    # pylint: disable=protected-access
+    past = time.time() - 100
+    os.utime(cache._entry_path('b'), (past, past))
+    cache.get('a')
+
+    # 2. When.
+    cache.set('c', value)
+
+    # 3. Then.
+    assert cache.get('a') == value
+    assert cache.get('b') is None
+    assert cache.get('c') == value
+
+
+def test_clear(tmp_path):
+    '''
+    Ensures that clear removes every entry.
+    '''
+
+    # 1. Given.
+    cache = DiskCache(str(tmp_path))
+    cache.set('a', 'a')
+    cache.set('b', 'b')
+
+    # 2. When.
+    cache.clear()
+
+    # 3. Then.
+    assert cache.get('a') is None
+    assert cache.get('b') is None
@@ -0,0 +1,274 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Captures a terminal session. A shell is run in a pseudo
+terminal, and proxied: input is passed to it, and its output is passed
+to the terminal. The output is also prefiltered, inline, and only the
+regions that may hold an error, i.e. tracebacks and syntax errors, are
+sent to the display, instead of every byte of the session (prompts,
+editors, redraws).
+'''
+
+import fcntl
+import os
+import pty
+import select
+import signal
+import termios
+import tty
+
+from autostack.error.detector import (
+    EXCEPTION,
+    MAX_TRACEBACK_LINES,
+    SYNTAX_ERROR,
+    TRACEBACK,
+    classify_line
+)
+from autostack.transport import CONNECT_INTERVAL, Sender
+
+# The number of bytes read from the terminal, or the shell, at once.
+READ_SIZE = 64 * 1024
+
+# A line longer than this, e.g. an editor's redraw, is dropped.
+MAX_LINE_LENGTH = 64 * 1024
+
+
+class Prefilter:
+    '''
+    Splits output into lines, and keeps only the regions that may hold
+    an error: each traceback, from its first line through the exception
+    that ends it, and syntax errors. Everything else is dropped.
+
+    e.g.:
+        prefilter = Prefilter()
+
+        for chunk in output:
+            forward(prefilter.feed(chunk))
+    '''
+
+    def __init__(self, max_lines=MAX_TRACEBACK_LINES,
+                 max_line_length=MAX_LINE_LENGTH):
+        '''
+        Initializes a prefilter.
+
+        Parameter {int} max_lines: the number of lines after which an
+        open traceback region is closed.
+        Parameter {int} max_line_length: the length after which a line
+        that hasn't ended is dropped.
+        '''
+
+        self.max_lines = max_lines
+        self.max_line_length = max_line_length
+        self._partial = b''
+        self._dropping = False
+
+        # The number of tracebacks open in the current region, e.g. two
+        # for "During handling of the above exception...", and the
+        # number of lines in it.
+        self._depth = 0
+        self._region_lines = 0
+
+    def feed(self, chunk):
+        '''
+        Feeds a chunk of output to the prefilter.
+
+        Parameter {bytes} chunk: raw output.
+        Returns {list}: the lines of the chunk that may be part of an
+        error, as bytes, with their line endings.
+        '''
+
+        lines = (self._partial + chunk).split(b'\n')
+        self._partial = lines.pop()
+
+        # The rest of a line that was too long, up to where it ends.
+        if self._dropping:
+            if not lines:
+                self._partial = b''
+                return []
+
+            del lines[0]
+            self._dropping = False
+
+        if len(self._partial) > self.max_line_length:
+            self._partial = b''
+            self._dropping = True
+
+        candidates = []
+
+        for line in lines:
+            line += b'\n'
+
+            if self.is_candidate(line):
+                candidates.append(line)
+
+        return candidates
+
+    def is_candidate(self, line):
+        '''
+        Checks whether a line may be part of an error, and keeps track
+        of the region it's in.
+
+        Parameter {bytes} line: a raw line.
+        Returns {bool}: True if the line should be forwarded.
+        '''
+
+        line_kind = classify_line(line)
+        kind = line_kind[0] if line_kind else None
+
+        if not self._depth:
+            if kind == TRACEBACK:
+                self._depth = 1
+                self._region_lines = 1
+
+                return True
+
+            return kind == SYNTAX_ERROR
+
+        self._region_lines += 1
+
+        if kind == TRACEBACK:
+            self._depth += 1
+        elif kind in (EXCEPTION, SYNTAX_ERROR):
+            self._depth -= 1
+
+        if self._region_lines >= self.max_lines:
+            self._depth = 0
+
+        return True
+
+
+def capture_terminal(socket_path, argv=None, stdin=0, stdout=1):
+    '''
+    Runs a shell in a pseudo terminal, and proxies it until it exits,
+    sending the regions of its output that may hold an error to the
+    display, as a session of its own.
+
+    Parameter {str} socket_path: the path to the display's socket.
+    Parameter {list} argv: the command to run, by default the user's
+    shell.
+    Parameter {int} stdin: the file descriptor input is read from.
+    Parameter {int} stdout: the file descriptor output is written to.
+    Returns {int}: the exit status of the shell.
+    '''
+
+    if argv is None:
+        argv = [os.environ.get('SHELL', '/bin/sh')]
+
+    pid, master = pty.fork()
+
+    # The shell.
+    if pid == 0:
+        try:
+            os.execvp(argv[0], argv)
+        finally:
+            os._exit(127)  # pylint: disable=protected-access
+
+    writer = Sender(socket_path)
+    terminal_mode = None
+
+    if os.isatty(stdin):
+        terminal_mode = termios.tcgetattr(stdin)
+        tty.setraw(stdin)
+        copy_window_size(stdin, master)
+        signal.signal(
+            signal.SIGWINCH,
+            lambda signum, frame: copy_window_size(stdin, master)
+        )
+
+    try:
+        proxy(master, stdin, stdout, writer)
+    finally:
+        if terminal_mode is not None:
+            signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+            termios.tcsetattr(stdin, termios.TCSAFLUSH, terminal_mode)
+
+        writer.close()
+        os.close(master)
+
+    _, status = os.waitpid(pid, 0)
+
+    if os.WIFSIGNALED(status):
+        return 128 + os.WTERMSIG(status)
+
+    return os.WEXITSTATUS(status)
+
+
+def proxy(master, stdin, stdout, writer):
+    '''
+    Passes input to a pseudo terminal, and its output to the terminal,
+    and its prefiltered output to the display, until the pseudo
+    terminal closes.
+
+    Parameter {int} master: the pseudo terminal's file descriptor.
+    Parameter {int} stdin: the file descriptor input is read from.
+    Parameter {int} stdout: the file descriptor output is written to.
+    Parameter {autostack.transport.Sender} writer: the sender.
+    '''
+
+    prefilter = Prefilter()
+    readers = [master, stdin]
+
+    while True:
+        writers = [writer.fd] if writer.pending() else []
+        timeout = None if writer.connect() else CONNECT_INTERVAL
+
+        try:
+            readable, writable, _ = select.select(
+                readers,
+                writers,
+                [],
+                timeout
+            )
+        except InterruptedError:
+            continue
+
+        if master in readable:
+            try:
+                output = os.read(master, READ_SIZE)
+            except OSError:
+                # The shell exited.
+                output = b''
+
+            if not output:
+                break
+
+            write_all(stdout, output)
+            writer.write(prefilter.feed(output))
+            writer.flush()
+
+        if stdin in readable:
+            data = os.read(stdin, READ_SIZE)
+
+            if data:
+                write_all(master, data)
+            else:
+                readers.remove(stdin)
+
+        if writable:
+            writer.flush()
+
+
+def write_all(fd, data):
+    '''
+    Writes all of data to a file descriptor.
+
+    Parameter {int} fd: the file descriptor.
+    Parameter {bytes} data: the data.
+    '''
+
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def copy_window_size(source, target):
+    '''
+    Copies the window size of a terminal to another, e.g. when the
+    terminal being captured is resized.
+
+    Parameter {int} source: the terminal's file descriptor.
+    Parameter {int} target: the other terminal's file descriptor.
+    '''
+
+    size = fcntl.ioctl(source, termios.TIOCGWINSZ, b'\0' * 8)
+    fcntl.ioctl(target, termios.TIOCSWINSZ, size)
@@ -0,0 +1,148 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the capture package.
+'''
+
+import os
+import sys
+
+from autostack.capture import Prefilter, capture_terminal
+from autostack.transport import Listener
+
+TRACEBACK = (
+    b'Traceback (most recent call last):\r\n'
+    b'  File "app.py", line 1, in <module>\r\n'
+    b'    xyz\r\n'
+    b'NameError: name \'xyz\' is not defined\r\n'
+)
+
+
+def test_prefilter_forwards_error_regions():
+    '''
+    Ensures that tracebacks, and syntax errors, are forwarded, and
+    everything else is dropped.
+    '''
+
+    # 1. Given.
+    prefilter = Prefilter()
+    output = (
+        b'$ ls\r\nREADME.md  setup.py\r\n' + TRACEBACK +
+        b'$ vim app.py\r\n\x1b[2J\x1b[H~\r\n' +
+        b'IndentationError: unexpected indent\r\n'
+    )
+
+    # 2. When.
+    lines = prefilter.feed(output)
+
+    # 3. Then.
+    assert b''.join(lines) == (
+        TRACEBACK + b'IndentationError: unexpected indent\r\n'
+    )
+
+
+def test_prefilter_lines_split_across_chunks():
+    '''
+    Ensures that a line split across chunks is forwarded once it ends.
+    '''
+
+    # 1. Given.
+    prefilter = Prefilter()
+
+    # 2. When.
+    first = prefilter.feed(b'noise\r\nSyntaxErr')
+    second = prefilter.feed(b'or: invalid syntax\r\n')
+
+    # 3. Then.
+    assert first == []
+    assert second == [b'SyntaxError: invalid syntax\r\n']
+
+
+def test_prefilter_drops_long_lines():
+    '''
+    Ensures that a line that's too long is dropped.
+    '''
+
+    # 1. Given.
+    prefilter = Prefilter(max_line_length=10)
+
+    # 2. When.
+    lines = prefilter.feed(b'SyntaxError: ' + b'x' * 20)
+    lines += prefilter.feed(b'x\nSyntaxError: short\n')
+
+    # 3. Then.
+    assert lines == [b'SyntaxError: short\n']
+
+
+def test_prefilter_drops_long_partial_lines():
+    '''
+    Ensures that a line that's too long, following lines in the same
+    chunk, is dropped through its end, and the lines before it aren't.
+    '''
+
+    # 1. Given.
+    prefilter = Prefilter(max_line_length=100)
+
+    # 2. When.
+    lines = prefilter.feed(
+        b'Traceback (most recent call last):\n' + b'x' * 200
+    )
+    lines += prefilter.feed(b'x' * 200)
+    lines += prefilter.feed(b'x\nKeyError: 1\n')
+
+    # 3. Then.
+    assert lines == [
+        b'Traceback (most recent call last):\n',
+        b'KeyError: 1\n',
+    ]
+
+
+def test_prefilter_closes_long_regions():
+    '''
+    Ensures that a traceback that never ends stops being forwarded.
+    '''
+
+    # 1. Given.
+    prefilter = Prefilter(max_lines=3)
+
+    # 2. When.
+    lines = prefilter.feed(
+        b'Traceback (most recent call last):\n' + b'output\n' * 5
+    )
+
+    # 3. Then.
+    assert len(lines) == 3
+
+
+def test_capture_terminal(tmp_path):
+    '''
+    Ensures that a command's output is passed through, and only its
+    errors are sent to the listener.
+    '''
+
+    # 1. Given.
+    path = str(tmp_path / 'autostack.sock')
+    listener = Listener(path, until_idle=True)
+    stdin, stdin_writer = os.pipe()
+    os.close(stdin_writer)
+    stdout_path = str(tmp_path / 'stdout')
+    stdout = os.open(stdout_path, os.O_WRONLY | os.O_CREAT)
+    argv = [sys.executable, '-c', 'print("noise"); xyz']
+
+    # 2. When.
+    status = capture_terminal(path, argv, stdin, stdout)
+
+    with listener:
+        forwarded = b''.join(line for _, _, line in listener if line)
+
+    for fd in (stdin, stdout):
+        os.close(fd)
+
+    # 3. Then.
+    with open(stdout_path, 'rb') as output:
+        assert output.read().startswith(b'noise\r\n')
+    assert status == 1
+    assert forwarded.startswith(b'Traceback (most recent call last):\r\n')
+    assert forwarded.endswith(b"NameError: name 'xyz' is not defined\r\n")
+    assert b'noise' not in forwarded
@@ -9,8 +9,10 @@ import click
 
 from autostack.cli.capture import capture
 # from autostack.cli.config import config
+from autostack.cli.daemon import daemon
 from autostack.cli.display import display
-# from autostack.cli.error import error
+from autostack.cli.error import error
+from autostack.cli.import_dump import import_dump
 # from autostack.cli.init import init
 
 
@@ -22,6 +24,8 @@ def cli():
 
 cli.add_command(capture)
 # cli.add_command(config)
+cli.add_command(daemon)
 cli.add_command(display)
-# cli.add_command(error)
+cli.add_command(error)
+cli.add_command(import_dump)
 # cli.add_command(init)
@@ -0,0 +1,108 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the cli package.
+'''
+
+import importlib
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from autostack.cli.constants import BACKENDS
+from autostack.cli.error import error
+import autostack.so_web_scraper.backends
+
+# The most time, in microseconds, importing the cli may take.
+IMPORT_TIME_BUDGET = 100 * 1000
+
+HEAVY_MODULES = ('bs4', 'lxml', 'pygments', 'requests', 'termcolor')
+
+
+def import_times(module):
+    '''
+    Imports a module in a new interpreter, with -X importtime.
+
+    Returns {dict}: the cumulative import time, in microseconds, of
+    every module imported.
+    '''
+
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True
+    ).stderr
+    times = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_cli_defers_heavy_imports():
+    '''
+    Ensures that the cli doesn't import the scraper's dependencies, and
+    is imported within its budget.
+    '''
+
+    # 1. Given.
+    module = 'autostack.main'
+
+    # 2. When.
+    times = import_times(module)
+
+    # 3. Then.
+    assert not [name for name in HEAVY_MODULES if name in times]
+    assert times[module] < IMPORT_TIME_BUDGET
+
+
+def test_backends():
+    '''
+    Ensures that the cli offers the scraper's backends.
+    '''
+
+    # 1. Given.
+    backends = autostack.so_web_scraper.backends
+
+    # 2. When.
+    offered = backends.BACKENDS
+
+    # 3. Then.
+    assert BACKENDS == offered
+
+
+def test_error_backend(monkeypatch):
+    '''
+    Ensures that the error command searches with the given backend,
+    when the daemon isn't running.
+    '''
+
+    # 1. Given.
+    # The module, which the command of the same name shadows in cli.
+    module = importlib.import_module('autostack.cli.error')
+    calls = []
+    monkeypatch.setattr(module, 'connect_daemon', lambda: None)
+    monkeypatch.setattr(
+        module,
+        'configure_scraper',
+        lambda **kwargs: calls.append(kwargs)
+    )
+    monkeypatch.setattr(
+        'autostack.error.handle_exception',
+        calls.append
+    )
+
+    # 2. When.
+    result = CliRunner().invoke(error, ['KeyError', '--backend', 'offline'])
+
+    # 3. Then.
+    assert result.exit_code == 0
+    assert calls == [{'backend': 'offline'}, 'KeyError']
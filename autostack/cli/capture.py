@@ -5,16 +5,12 @@ Date: 12/05/2019
 Overview: TODO: Write overview.
 '''
 
-import subprocess
 import sys
 
 import click
 
 from autostack.cli.constants import (
-    PIPE_PATH
-)
-from autostack.pipe import (
-    create_pipe
+    SOCKET_PATH
 )
 
 
@@ -25,9 +21,7 @@ def capture():
     languages.
     '''
 
-    create_pipe(PIPE_PATH)
+    # pylint: disable=import-outside-toplevel
+    from autostack.capture import capture_terminal
 
-    if sys.platform.startswith('darwin'):  # Mac
-        subprocess.run(['script', '-q', '-F', '/tmp/monitorPipe'], check=True)
-    else:
-        subprocess.run(['script', '-q', '-f', '/tmp/monitorPipe'], check=True)
+    sys.exit(capture_terminal(SOCKET_PATH))
@@ -5,4 +5,20 @@ Date: 12/05/2019
 Overview: TODO: Write overview.
 '''
 
-PIPE_PATH = '/tmp/monitorPipe'
+import os
+
+DATA_PATH = os.path.join(os.path.expanduser('~'), '.autostack')
+CACHE_PATH = os.path.join(DATA_PATH, 'cache')
+
+# The local index of the posts fetched, searched before Stack Overflow.
+INDEX_PATH = os.path.join(DATA_PATH, 'index.sqlite3')
+
+# The socket capture sessions send their output to the display over.
+SOCKET_PATH = os.path.join(DATA_PATH, 'autostack.sock')
+
+# The socket the daemon serves its clients, e.g. the display, on.
+DAEMON_PATH = os.path.join(DATA_PATH, 'daemon.sock')
+
+# The backends posts can be gotten from, see
+# so_web_scraper.backends.BACKENDS.
+BACKENDS = ('html', 'api', 'offline')
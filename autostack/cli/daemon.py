@@ -0,0 +1,36 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: The daemon command, which runs the autostack daemon.
+'''
+
+import click
+
+from autostack.cli.constants import DAEMON_PATH, SOCKET_PATH
+from autostack.cli.scraper import (
+    backend_option,
+    configure_scraper,
+    no_cache_option
+)
+
+
+@click.command()
+@no_cache_option
+@backend_option
+def daemon(no_cache, backend):
+    '''
+    Run the daemon, which detects the errors captured with the 'capture'
+    command, and fetches posts for the 'display' and 'error' commands,
+    keeping its connections and caches warm between them.
+    '''
+
+    # pylint: disable=import-outside-toplevel
+    from autostack.daemon.server import run_daemon
+
+    configure_scraper(no_cache, backend)
+
+    try:
+        run_daemon(SOCKET_PATH, DAEMON_PATH)
+    except FileExistsError:
+        print('The daemon, or "autostack display", is already running.')
@@ -4,27 +4,50 @@ Emails: elijahsawyers@gmail.com
 Date: 12/05/2019
 Overview: TODO: Write overview.
 '''
-import os
+from contextlib import closing
 
 import click
 
-from autostack.cli.constants import (
-    PIPE_PATH
-)
-from autostack.error import (
-    listen_for_errors
+from autostack.cli.constants import SOCKET_PATH
+from autostack.cli.scraper import (
+    backend_option,
+    configure_scraper,
+    connect_daemon,
+    no_cache_option
 )
 
 
 @click.command()
-def display():
+@no_cache_option
+@backend_option
+def display(no_cache, backend):
     '''
     Display posts for all error messages captured with the 'capture' command.
+
+    If the daemon is running, errors, and posts, are gotten from it, and
+    the daemon's options apply instead.
     '''
 
-    if not os.path.exists(PIPE_PATH):
-        print('Execute "autostack capture" in another terminal window first.')
+    # pylint: disable=import-outside-toplevel
+    from autostack.error import display_errors, listen_for_errors
+
+    client = connect_daemon()
+
+    if client is not None:
+        with closing(client):
+            display_errors(client.errors())
+
         return
 
-    with open(PIPE_PATH) as pipe:
-        listen_for_errors(pipe)
+    from autostack.transport import Listener
+
+    try:
+        listener = Listener(SOCKET_PATH, until_idle=True)
+    except FileExistsError:
+        print('"autostack display" is already running in another terminal.')
+        return
+
+    configure_scraper(no_cache, backend)
+
+    with listener:
+        listen_for_errors(listener)
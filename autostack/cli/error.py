@@ -5,14 +5,38 @@ Date: 12/05/2019
 Overview: TODO: Write overview.
 '''
 
+from contextlib import closing
+
 import click
 
+from autostack.cli.scraper import (
+    backend_option,
+    configure_scraper,
+    connect_daemon
+)
+
 
 @click.command()
 @click.argument('message')
-def error():
+@backend_option
+def error(message, backend):
     '''
     Query for a given error message, and dislay posts for that query.
+
+    If the daemon is running, posts are gotten from it, and the daemon's
+    options apply instead.
     '''
 
-    return
+    # pylint: disable=import-outside-toplevel
+    from autostack.error import handle_exception
+
+    client = connect_daemon()
+
+    if client is not None:
+        with closing(client):
+            handle_exception(message)
+
+        return
+
+    configure_scraper(backend=backend)
+    handle_exception(message)
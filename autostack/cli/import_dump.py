@@ -0,0 +1,49 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: The import-dump command, which imports a Stack Exchange data
+dump into the local index.
+'''
+
+import click
+
+from autostack.cli.constants import INDEX_PATH
+
+
+@click.command('import-dump')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    '--tag',
+    'tags',
+    multiple=True,
+    help='Only import questions with this tag, e.g. python. May be given '
+    'more than once.'
+)
+def import_dump(path, tags):
+    '''
+    Import the questions with accepted answers of a Stack Exchange data
+    dump's Posts.xml, and their accepted answers, into the local index,
+    which is searched before Stack Overflow, or instead of it, with the
+    offline backend.
+    '''
+
+    # pylint: disable=import-outside-toplevel
+    from autostack.index import PostIndex
+    from autostack.index.dump import import_dump as import_posts
+
+    def progress(imported):
+        '''
+        Shows the number of posts imported so far.
+        '''
+
+        click.echo('\rImported {} posts...'.format(imported), nl=False)
+
+    index = PostIndex(INDEX_PATH)
+
+    try:
+        imported = import_posts(path, index, tags, progress)
+    finally:
+        index.close()
+
+    click.echo('\rImported {} posts.   '.format(imported))
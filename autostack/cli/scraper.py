@@ -0,0 +1,99 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: The options of the commands that fetch posts, and how they
+get posts: from the daemon, if it's running, or else from the scraper.
+'''
+
+import click
+
+from autostack.cli.constants import (
+    BACKENDS,
+    CACHE_PATH,
+    DAEMON_PATH,
+    INDEX_PATH
+)
+
+
+def no_cache_option(command):
+    '''
+    Adds the --no-cache option to a command.
+
+    Parameter {click.Command} command: the command.
+    Returns {click.Command}: the command, with the option.
+    '''
+
+    return click.option(
+        '--no-cache',
+        is_flag=True,
+        help='Always fetch posts from Stack Overflow, instead of from disk.'
+    )(command)
+
+
+def backend_option(command):
+    '''
+    Adds the --backend option to a command.
+
+    Parameter {click.Command} command: the command.
+    Returns {click.Command}: the command, with the option.
+    '''
+
+    return click.option(
+        '--backend',
+        type=click.Choice(BACKENDS),
+        default='html',
+        help='Scrape Stack Overflow (html), use the Stack Exchange API '
+        '(api), or only search the local index (offline).'
+    )(command)
+
+
+def connect_daemon():
+    '''
+    Connects to the daemon, if it's running, and gets posts from it,
+    instead of from the scraper.
+
+    Returns {autostack.daemon.Client}: the client, or None, if the
+    daemon isn't running.
+    '''
+
+    # pylint: disable=import-outside-toplevel
+    from autostack.daemon import Client
+    from autostack.error import set_client
+
+    try:
+        client = Client(DAEMON_PATH)
+    except OSError:
+        return None
+
+    set_client(client)
+
+    return client
+
+
+def configure_scraper(no_cache=False, backend='html'):
+    '''
+    Sets the scraper's cache, index, and backend.
+
+    The scraper, and its dependencies, are imported here, instead of at
+    the top of the module, so that commands start quickly.
+
+    Parameter {bool} no_cache: whether to always fetch posts, instead of
+    reading them from the cache, and the index.
+    Parameter {str} backend: one of BACKENDS.
+    '''
+
+    # pylint: disable=import-outside-toplevel
+    from autostack.cache import DiskCache
+    from autostack.index import PostIndex
+    from autostack.so_web_scraper import set_cache
+    from autostack.so_web_scraper.backends import set_backend, set_index
+
+    if not no_cache:
+        set_cache(DiskCache(CACHE_PATH))
+
+    # The offline backend only has the index to search.
+    if not no_cache or backend == 'offline':
+        set_index(PostIndex(INDEX_PATH))
+
+    set_backend(backend)
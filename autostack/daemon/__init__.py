@@ -0,0 +1,168 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: The client of the autostack daemon, a long-lived process that
+owns the scraper's sessions, its caches, and the detection of errors in
+captured output, see autostack.daemon.server. Clients, e.g. the display,
+subscribe to the errors it detects, and get rendered posts from it, so
+that they start, and show posts, quickly.
+
+Payloads of the frames exchanged with the daemon are JSON:
+    ERROR: {"id", "name", "message", "frame"}
+    QUERY: {"query", "index", "error", "width"}, where error is the id
+    of the error the query is for, or null, and width is the width, in
+    columns, of the client's terminal, which posts are rendered for.
+    POST: {"post", "count"}, where post is the rendered post at the
+    index, or null, if there are no more, and count is the number of
+    times the error occurred, or null.
+'''
+
+from contextlib import closing
+import json
+import shutil
+
+from autostack.error.detector import DetectedError
+from autostack.transport import (
+    ERROR,
+    POST,
+    QUERY,
+    SUBSCRIBE,
+    connect,
+    read_frames,
+    send_frame
+)
+
+
+class RemoteError(DetectedError):
+    '''
+    An error detected by the daemon, and the id it knows it by.
+    '''
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('error_id',)
+
+    def __init__(self, error_id, name, message='', frame=None):
+        '''
+        Initializes a remote error.
+
+        Parameter {int} error_id: the id of the error.
+        Parameter {str} name: the name of the error, e.g. 'KeyError'.
+        Parameter {str} message: the error's message.
+        Parameter {str} frame: the innermost frame of the error's
+        traceback, or None.
+        '''
+
+        super().__init__(name, message, frame)
+        self.error_id = error_id
+
+
+class Client:
+    '''
+    A client of the daemon.
+
+    e.g.:
+        with closing(Client(DAEMON_PATH)) as client:
+            for error in client.errors():
+                for post in client.accepted_posts(query, error):
+                    ...
+    '''
+
+    def __init__(self, path):
+        '''
+        Initializes a client, and connects to the daemon.
+
+        Parameter {str} path: the path to the daemon's socket.
+        Raises {OSError}: if the daemon isn't running.
+        '''
+
+        self.path = path
+        self.sock = connect(path)
+        self._frames = read_frames(self.sock)
+
+    def errors(self):
+        '''
+        A generator that subscribes to the errors the daemon detects,
+        over a connection of its own, until the daemon exits.
+
+        Yields {RemoteError}: the errors.
+        '''
+
+        with closing(connect(self.path)) as sock:
+            send_frame(sock, SUBSCRIBE, b'')
+
+            for kind, _, _, payload in read_frames(sock):
+                if kind != ERROR:
+                    continue
+
+                fields = json.loads(payload.decode('utf-8'))
+
+                yield RemoteError(
+                    fields['id'],
+                    fields['name'],
+                    fields['message'],
+                    fields['frame']
+                )
+
+    def accepted_posts(self, query, error=None, width=None):
+        '''
+        A generator that gets the posts with accepted answers for a
+        query from the daemon, one at a time, as they're needed. The
+        daemon keeps fetching ahead meanwhile.
+
+        The error's count is updated with every post, from the daemon's.
+
+        Parameter {str} query: the query.
+        Parameter {autostack.error.detector.DetectedError} error: the
+        error the query is for, if any.
+        Parameter {int} width: the width, in columns, posts are rendered
+        for, or None for this process's terminal.
+        Yields {str}: the rendered posts.
+        '''
+
+        if width is None:
+            width = shutil.get_terminal_size().columns
+
+        index = 0
+
+        while True:
+            send_frame(self.sock, QUERY, json.dumps({
+                'query': query,
+                'index': index,
+                'error': getattr(error, 'error_id', None),
+                'width': width,
+            }).encode('utf-8'))
+
+            fields = self.receive(POST)
+
+            if fields is None or fields['post'] is None:
+                return
+
+            if fields['count'] is not None:
+                error.count = fields['count']
+
+            yield fields['post']
+            index += 1
+
+    def receive(self, kind):
+        '''
+        Receives the next frame of a kind.
+
+        Parameter {int} kind: the kind of frame.
+        Returns {dict}: the frame's payload, or None, if the daemon
+        exited.
+        '''
+
+        for frame_kind, _, _, payload in self._frames:
+            if frame_kind == kind:
+                return json.loads(payload.decode('utf-8'))
+
+        return None
+
+    def close(self):
+        '''
+        Disconnects from the daemon.
+        '''
+
+        self.sock.close()
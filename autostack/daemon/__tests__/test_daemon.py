@@ -0,0 +1,181 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the daemon package.
+'''
+
+from contextlib import closing
+import queue
+import threading
+import time
+
+import pytest
+
+from autostack.daemon import Client, RemoteError
+from autostack.daemon.server import Daemon
+from autostack.error.detector import DetectedError
+from autostack.transport import QUERY, connect, send_frame
+
+
+@pytest.fixture(name='daemon_path')
+def fixture_daemon_path(tmp_path, monkeypatch):
+    '''
+    Runs a daemon whose posts for a query are 'query 1', and 'query 2'.
+
+    Yields {tuple}: the path to the daemon's socket, and the daemon.
+    '''
+
+    def mock_accepted_posts(query):
+        '''
+        Mocks the accepted_posts function.
+        '''
+
+        yield from ('{} 1'.format(query), '{} 2'.format(query))
+
+    def mock_render_accepted_post(post, width):
+        # pylint: disable=unused-argument
+        '''
+        Mocks the render_accepted_post function.
+        '''
+
+        return 'rendered ' + post
+
+    monkeypatch.setattr(
+        'autostack.daemon.server.accepted_posts',
+        mock_accepted_posts
+    )
+    monkeypatch.setattr(
+        'autostack.daemon.server.render_accepted_post',
+        mock_render_accepted_post
+    )
+
+    path = str(tmp_path / 'daemon.sock')
+    daemon = Daemon(path)
+    threading.Thread(target=daemon.serve, daemon=True).start()
+
+    yield path, daemon
+
+    daemon.close()
+
+
+def test_client_accepted_posts(daemon_path):
+    '''
+    Ensures that the daemon's rendered posts are gotten, one at a time,
+    until there are no more.
+    '''
+
+    # 1. Given.
+    path, _ = daemon_path
+
+    # 2. When.
+    with closing(Client(path)) as client:
+        posts = list(client.accepted_posts('KeyError'))
+
+    # 3. Then.
+    assert posts == ['rendered KeyError 1', 'rendered KeyError 2']
+
+
+def test_client_errors(daemon_path):
+    '''
+    Ensures that subscribers get the errors the daemon detects, and
+    how many times they occurred, with each post.
+    '''
+
+    # 1. Given.
+    path, daemon = daemon_path
+    errors = queue.Queue()
+    detected = DetectedError('KeyError', "'id'", 'File "app.py", line 1')
+    received = []
+
+    # 2. When.
+    with closing(Client(path)) as client:
+        receiver = threading.Thread(
+            target=lambda: received.append(next(client.errors()))
+        )
+        receiver.start()
+
+        # The error is published once the client has subscribed.
+        while not daemon._subscribers:  # pylint: disable=protected-access
+            time.sleep(0.01)
+
+        errors.put(detected)
+        errors.put(None)
+        daemon.publish(errors)
+        receiver.join(timeout=5)
+        detected.count = 3
+        posts = list(client.accepted_posts('KeyError', received[0]))
+
+    # 3. Then.
+    error = received[0]
+    assert isinstance(error, RemoteError)
+    assert (error.name, error.message, error.frame) == (
+        'KeyError',
+        "'id'",
+        'File "app.py", line 1'
+    )
+    assert posts == ['rendered KeyError 1', 'rendered KeyError 2']
+    assert error.count == 3
+
+
+def test_client_width(daemon_path, monkeypatch):
+    '''
+    Ensures that posts are rendered for the client's terminal, instead
+    of the daemon's.
+    '''
+
+    # 1. Given.
+    path, _ = daemon_path
+    widths = []
+
+    def mock_render_accepted_post(post, width):
+        '''
+        Mocks the render_accepted_post function, recording the width.
+        '''
+
+        widths.append(width)
+
+        return 'rendered ' + post
+
+    monkeypatch.setattr(
+        'autostack.daemon.server.render_accepted_post',
+        mock_render_accepted_post
+    )
+
+    # 2. When.
+    with closing(Client(path)) as client:
+        narrow = next(client.accepted_posts('KeyError', width=40))
+        wide = next(client.accepted_posts('KeyError', width=120))
+
+    # 3. Then.
+    assert narrow == wide == 'rendered KeyError 1'
+    assert widths == [40, 120]
+
+
+def test_malformed_query(daemon_path, monkeypatch):
+    '''
+    Ensures that a client sending a malformed query is disconnected,
+    without an exception escaping its handler, and that the daemon
+    keeps serving others.
+    '''
+
+    # 1. Given.
+    path, _ = daemon_path
+    exceptions = []
+    monkeypatch.setattr('threading.excepthook', exceptions.append)
+
+    # 2. When.
+    replies = []
+
+    for payload in (b'not json', b'{"query": "KeyError"}'):
+        with closing(connect(path)) as sock:
+            send_frame(sock, QUERY, payload)
+            replies.append(sock.recv(1))
+
+    with closing(Client(path)) as client:
+        posts = list(client.accepted_posts('KeyError'))
+
+    # 3. Then.
+    assert replies == [b'', b'']
+    assert not exceptions
+    assert posts == ['rendered KeyError 1', 'rendered KeyError 2']
@@ -0,0 +1,293 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: The autostack daemon. It listens for capture sessions, detects
+the errors in their output, and passes them on to its subscribers, and
+answers queries for posts with posts rendered with the scraper, whose
+sessions, prefetches and caches stay warm between queries.
+'''
+
+from collections import OrderedDict
+from contextlib import closing
+from itertools import count
+import json
+import os
+import queue
+import threading
+
+from autostack.error import QUEUE_SIZE, detect_errors
+from autostack.so_web_scraper import render_accepted_post
+from autostack.so_web_scraper.backends import accepted_posts
+from autostack.transport import (
+    ERROR,
+    POST,
+    QUERY,
+    SUBSCRIBE,
+    Listener,
+    bind,
+    read_frames,
+    send_frame
+)
+
+# The number of errors the daemon remembers, by id, to tell clients how
+# many times they occurred.
+MAX_ERRORS = 1000
+
+
+class PostCursor:
+    '''
+    The posts with accepted answers for a query, rendered for a client's
+    terminal as they're asked for. The posts after them keep being
+    prefetched.
+    '''
+
+    def __init__(self, query, width, render_lock):
+        '''
+        Initializes a post cursor, and starts fetching posts.
+
+        Parameter {str} query: the query.
+        Parameter {int} width: the width, in columns, of the client's
+        terminal.
+        Parameter {threading.Lock} render_lock: held while rendering,
+        since the rendered posts are shared by every client.
+        '''
+
+        self.query = query
+        self.width = width
+        self.render_lock = render_lock
+        self._posts = accepted_posts(query)
+        self._rendered = []
+
+    def get(self, index):
+        '''
+        Gets a rendered post.
+
+        Parameter {int} index: the index of the post.
+        Returns {str}: the post, or None, if there are no more.
+        '''
+
+        while len(self._rendered) <= index:
+            post = next(self._posts, None)
+
+            if post is None:
+                return None
+
+            with self.render_lock:
+                self._rendered.append(
+                    render_accepted_post(post, self.width)
+                )
+
+        return self._rendered[index]
+
+    def close(self):
+        '''
+        Cancels the posts still being prefetched.
+        '''
+
+        self._posts.close()
+
+
+class Daemon:
+    '''
+    Serves the daemon's clients, each over a connection, in a thread of
+    its own.
+    '''
+
+    def __init__(self, path):
+        '''
+        Initializes a daemon, and starts listening for clients.
+
+        Parameter {str} path: the path to the daemon's socket.
+        Raises {FileExistsError}: if a daemon is already running.
+        '''
+
+        self.path = path
+        self._server = bind(path)
+        self._server.setblocking(True)
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._subscribers = []
+        self._ids = count(1)
+
+        # Recently detected errors, by id.
+        self._errors = OrderedDict()
+
+    def serve(self):
+        '''
+        Accepts clients until the daemon is closed.
+        '''
+
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+
+            threading.Thread(
+                target=self.handle,
+                args=(connection,),
+                daemon=True
+            ).start()
+
+    def publish(self, errors):
+        '''
+        Passes each error on to the subscribers, until None. Errors are
+        dropped for subscribers that are too far behind.
+
+        Parameter {queue.Queue} errors: the errors.
+        '''
+
+        for error in iter(errors.get, None):
+            with self._lock:
+                error_id = next(self._ids)
+                self._errors[error_id] = error
+
+                if len(self._errors) > MAX_ERRORS:
+                    self._errors.popitem(last=False)
+
+                for subscriber in self._subscribers:
+                    try:
+                        subscriber.put_nowait((error_id, error))
+                    except queue.Full:
+                        pass
+
+    def handle(self, connection):
+        '''
+        Serves a client, until it disconnects, or sends a malformed
+        frame.
+
+        Parameter {socket.socket} connection: the client's connection.
+        '''
+
+        cursor = None
+
+        with closing(connection):
+            try:
+                for kind, _, _, payload in read_frames(connection):
+                    if kind == SUBSCRIBE:
+                        self.stream_errors(connection)
+                        return
+
+                    if kind == QUERY:
+                        cursor = self.answer(
+                            connection,
+                            json.loads(payload.decode('utf-8')),
+                            cursor
+                        )
+            except (OSError, ValueError, KeyError):
+                # The client went away, or its frames are malformed,
+                # e.g. a query that isn't JSON, or lacks a field.
+                pass
+            finally:
+                if cursor is not None:
+                    cursor.close()
+
+    def stream_errors(self, connection):
+        '''
+        Sends every error detected to a subscriber, until it
+        disconnects.
+
+        Parameter {socket.socket} connection: the subscriber's
+        connection.
+        '''
+
+        subscriber = queue.Queue(QUEUE_SIZE)
+
+        with self._lock:
+            self._subscribers.append(subscriber)
+
+        try:
+            while True:
+                error_id, error = subscriber.get()
+                send_frame(connection, ERROR, json.dumps({
+                    'id': error_id,
+                    'name': error.name,
+                    'message': error.message,
+                    'frame': error.frame,
+                }).encode('utf-8'))
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+
+    def answer(self, connection, fields, cursor):
+        '''
+        Answers a query for a post.
+
+        Parameter {socket.socket} connection: the client's connection.
+        Parameter {dict} fields: the query, see autostack.daemon.
+        Parameter {PostCursor} cursor: the client's last query's posts,
+        if any.
+        Returns {PostCursor}: the query's posts.
+        '''
+
+        query, width = fields['query'], fields['width']
+
+        if cursor is None or (cursor.query, cursor.width) != (query, width):
+            if cursor is not None:
+                cursor.close()
+
+            cursor = PostCursor(query, width, self._render_lock)
+
+        post = cursor.get(fields['index'])
+
+        with self._lock:
+            error = self._errors.get(fields['error'])
+            error_count = None if error is None else error.count
+
+        send_frame(connection, POST, json.dumps({
+            'post': post,
+            'count': error_count,
+        }).encode('utf-8'))
+
+        return cursor
+
+    def close(self):
+        '''
+        Stops accepting clients, and removes the daemon's socket.
+        '''
+
+        self._server.close()
+
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def run_daemon(socket_path, daemon_path):
+    '''
+    Runs the daemon until interrupted: errors are detected in the output
+    of capture sessions connecting to one socket, and clients are served
+    on the other.
+
+    Parameter {str} socket_path: the path to the socket capture sessions
+    connect to.
+    Parameter {str} daemon_path: the path to the daemon's socket.
+    Raises {FileExistsError}: if a daemon, or a display, is already
+    running.
+    '''
+
+    daemon = Daemon(daemon_path)
+
+    try:
+        listener = Listener(socket_path)
+    except FileExistsError:
+        daemon.close()
+        raise
+
+    errors = queue.Queue(QUEUE_SIZE)
+
+    for target, args in (
+            (detect_errors, (listener, errors)),
+            (daemon.publish, (errors,)),
+    ):
+        threading.Thread(target=target, args=args, daemon=True).start()
+
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+        listener.close()
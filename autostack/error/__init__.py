@@ -6,46 +6,101 @@ Overview: TODO: Write overview.
 '''
 
 from __future__ import absolute_import, division, print_function
+from contextlib import closing
+import queue
+import sys
+import threading
 
 from autostack import print_logo
-from autostack.so_web_scraper import (
-    accepted_posts,
-    print_accepted_post
-)
+from autostack.error.coalesce import Coalescer
+from autostack.error.detector import ErrorDetector
+from autostack.error.query import build_query
 
-SYNTAX_ERRORS = [
-    'SyntaxError',
-    'IndentationError',
-    'TabError',
-]
+# The most errors that wait to be displayed. Errors detected while the
+# queue is full are dropped, so that reading the pipe never waits on
+# the display.
+QUEUE_SIZE = 100
+
+# The daemon posts are gotten from, if any, see set_client.
+_CLIENT = None
+
+
+def get_client():
+    '''
+    Gets the client of the daemon posts are gotten from.
+
+    Returns {autostack.daemon.Client}: the client, or None, if posts
+    are gotten from the scraper.
+    '''
+
+    return _CLIENT
+
+
+def set_client(client):
+    '''
+    Sets the client of the daemon posts are gotten from, instead of
+    from the scraper, in this process.
+
+    Parameter {autostack.daemon.Client} client: the client, or None.
+    '''
+
+    global _CLIENT  # pylint: disable=global-statement
+    _CLIENT = client
 
 
 def listen_for_errors(pipe):
     '''
-    Reads output from a pipe until EOF, indicated by empty string. The
-    output is parsed for errors.
+    Reads output from a pipe until it closes, and displays posts for
+    each error found in it.
+
+    The pipe is read, and errors detected, in a thread of its own, so
+    that the terminals being captured are never held up while posts are
+    fetched or displayed. Detected errors are queued, and displayed
+    in order, see display_errors.
 
-    Parameter {File}: the pipe to read output from.
+    Parameter {autostack.transport.Listener}: the pipe to read output
+    from.
     '''
 
-    print_logo()
-    print_listening_for_errors()
+    errors = queue.Queue(QUEUE_SIZE)
+    detector = threading.Thread(
+        target=detect_errors,
+        args=(pipe, errors),
+        daemon=True
+    )
+    detector.start()
 
-    while True:
-        output = pipe.readline()
+    # Until the pipe closes.
+    display_errors(iter(errors.get, None))
 
-        # Pipe closed.
-        if output == '':
-            break
+    detector.join()
 
-        parse_output_for_error(output, pipe)
 
+def display_errors(errors):
+    '''
+    Displays posts for each error, in order.
+
+    Posts are searched for with the error's name and its stripped
+    message, see autostack.error.query.build_query, or, if none are
+    found, its name alone.
+
+    Parameter {iterable} errors: the errors, e.g. those detected in a
+    pipe, or received from the daemon.
+    '''
+
+    print_logo()
+    print_listening_for_errors()
+
+    for error in errors:
+        handle_exception(build_query(error), error)
 
-def parse_output_for_error(output, pipe):
+
+def detect_errors(pipe, errors):
     '''
-    Parses a line of output, and determines whether or not it is
-    an error message. There are two types of errors, syntax errors
-    and runtime errors. Syntax errors do not have a traceback but
+    Reads output from a pipe until it closes. The output of each capture
+    session is fed, line by line, to an error detector of its own, and
+    each error detected is queued. There are two types of errors, syntax
+    errors and runtime errors. Syntax errors do not have a traceback but
     runtime errors do.
 
     e.g. without traceback:
@@ -55,75 +110,131 @@ def parse_output_for_error(output, pipe):
             File "<stdin>", line 1, in <module>
         NameError: name 'xyz' is not defined
 
-    Parameter {str} output: line of output from a pipe.
-    Parameter {File} pipe: pipe to read output from, in case of traceback.
+    Repeats of an error, from any session, are coalesced into the first
+    one, which counts them. Errors are dropped when the queue is full.
+    None is queued once the pipe closes.
+
+    Parameter {autostack.transport.Listener} pipe: the pipe to read
+    output from, which yields (session, timestamp, line), and
+    (session, None, None) when a session ends.
+    Parameter {queue.Queue} errors: the queue to put errors in.
     '''
 
+    detectors = {}
+    coalescer = Coalescer()
+
     try:
-        # Syntax errors - no traceback.
-        if output.split()[0][:-1] in SYNTAX_ERRORS:
-            error = output.split()[0][:-1]
-            handle_exception(error)
-        # Runtime error - has traceback.
-        elif 'Traceback' in output.split():
-            error = get_error_from_traceback(pipe)
-            handle_exception(error)
-    except IndexError:
-        pass
+        for session, timestamp, line in pipe:
+            if line is None:
+                detectors.pop(session, None)
+                continue
 
+            detector = detectors.get(session)
 
-def get_error_from_traceback(pipe):
-    '''
-    Gets the error description from a traceback.
+            if detector is None:
+                detector = detectors[session] = ErrorDetector()
 
-    e.g.:
-        Traceback (most recent call last):
-            File "<stdin>", line 1, in <module>
-        NameError: name 'xyz' is not defined
-    would return 'NameError'.
+            error = detector.feed(line, timestamp)
 
-    Parameter {File} pipe: the pipe to read the traceback from.
-    Returns {str}: the error description.
-    '''
+            if error is None or not coalescer.add(error):
+                continue
 
-    output = pipe.readline()
+            try:
+                errors.put_nowait(error)
+            except queue.Full:
+                pass
+    finally:
+        errors.put(None)
 
-    while (
-            output.split()[0][-1] != ':'
-    ):
-        output = pipe.readline()
 
-    return output.split()[0][:-1]
-
-
-def handle_exception(query):
+def handle_exception(query, error=None):
     '''
     When passed a query, this function loops over each accepted
     Stack Overflow post, and displays them, until the user inputs
     'Y'.
 
+    If no posts are found for an error's query, posts are searched for
+    with the error's name alone.
+
     Parameter {str} query: the query to display posts for.
+    Parameter {autostack.error.detector.DetectedError} error: the error
+    the query is for, if any, to show how many times it occurred.
     '''
 
-    for post in accepted_posts(query):
-        # Display Stack Overflow posts for the error.
-        clear_terminal()
-        print_accepted_post(post)
-
-        user_input = handle_user_input()
+    custom_query = None
+    found = False
 
-        # Custom query.
-        if user_input not in (True, False):
-            handle_exception(user_input)
-            return
+    # Closing the posts cancels any posts still being prefetched.
+    with closing(accepted_posts(query, error)) as posts:
+        for post in posts:
+            found = True
 
-        # Error solved, break out of the loop.
-        if user_input is True:
+            # Display Stack Overflow posts for the error.
             clear_terminal()
-            print_listening_for_errors()
-            return
+            print_accepted_post(post)
+
+            if error is not None and error.count > 1:
+                print_error_count(error)
+
+            user_input = handle_user_input()
+
+            # Custom query.
+            if user_input not in (True, False):
+                custom_query = user_input
+                break
+
+            # Error solved, break out of the loop.
+            if user_input is True:
+                clear_terminal()
+                print_listening_for_errors()
+                return
+
+            # Otherwise, the question wasn't answered, keep looping.
+
+    if custom_query is not None:
+        handle_exception(custom_query)
+    elif not found and error is not None and query != error.name:
+        # The message may be too specific to match any post.
+        handle_exception(error.name, error)
+
+
+def accepted_posts(query, error=None):
+    '''
+    Gets the posts with accepted answers for a query: from the daemon,
+    rendered, if a client is set, or else from the scraper.
+
+    Parameter {str} query: the query.
+    Parameter {autostack.error.detector.DetectedError} error: the error
+    the query is for, if any.
+    Returns {generator}: a generator that yields posts.
+    '''
+
+    if _CLIENT is not None:
+        return _CLIENT.accepted_posts(query, error)
 
-        # Otherwise, the question wasn't answered, keep looping.
+    # pylint: disable=import-outside-toplevel
+    from autostack.so_web_scraper import backends
+
+    return backends.accepted_posts(query)
+
+
+def print_accepted_post(post):
+    '''
+    Prints a post gotten with accepted_posts.
+
+    Parameter {autostack.post.Post} post: the post, or, from the
+    daemon, the rendered post.
+    '''
+
+    if _CLIENT is not None:
+        sys.stdout.write(post)
+        sys.stdout.flush()
+        return
+
+    # pylint: disable=import-outside-toplevel
+    from autostack import so_web_scraper
+
+    so_web_scraper.print_accepted_post(post)
 
 
 def handle_user_input():
@@ -148,6 +259,17 @@ def handle_user_input():
     return False
 
 
+def print_error_count(error):
+    '''
+    Prints the number of times an error occurred, e.g.
+    "KeyError occurred 200 times."
+
+    Parameter {autostack.error.detector.DetectedError} error: the error.
+    '''
+
+    print('{} occurred {} times.'.format(error.name, error.count))
+
+
 def print_listening_for_errors():
     '''
     Prints "🥞 Listening for Python errors..."
@@ -30,6 +30,20 @@ class MockPipe:
         self.readline_call_count += 1
         return readline_val
 
+    def __iter__(self):
+        '''
+        Yields the readline values, as bytes, as the output of a single
+        session, until empty string is returned.
+        '''
+
+        while True:
+            line = self.readline()
+
+            if line == '':
+                return
+
+            yield 0, None, line.encode('utf-8')
+
     def get_readline_call_count(self):
         '''
         Returns the readline method call count.
@@ -0,0 +1,90 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the error.coalesce module.
+'''
+
+from autostack.error.coalesce import (
+    Coalescer,
+    fingerprint,
+    normalize_message,
+)
+from autostack.error.detector import DetectedError
+
+
+def test_normalize_message():
+    '''
+    Ensures that addresses, numbers and whitespace are normalized.
+    '''
+
+    # 1. Given.
+    message = "'<Foo object at 0x7f3a2c>'  has no attribute 'x2' on line 12"
+
+    # 2. When.
+    normalized = normalize_message(message)
+
+    # 3. Then.
+    assert normalized == \
+        "'<Foo object at 0x?>' has no attribute 'x2' on line #"
+
+
+def test_fingerprint():
+    '''
+    Ensures that errors differing only in addresses have the same
+    fingerprint, and errors in different frames don't.
+    '''
+
+    # 1. Given.
+    frame = 'File "app.py", line 1, in main'
+    error = DetectedError('TypeError', '<Foo at 0x1f> is not callable', frame)
+    repeat = DetectedError('TypeError', '<Foo at 0x2e> is not callable', frame)
+    elsewhere = DetectedError('TypeError', '<Foo at 0x1f> is not callable')
+
+    # 2. When.
+    fingerprints = [fingerprint(e) for e in (error, repeat, elsewhere)]
+
+    # 3. Then.
+    assert fingerprints[0] == fingerprints[1]
+    assert fingerprints[0] != fingerprints[2]
+
+
+def test_coalescer_counts_repeats():
+    '''
+    Ensures that only the first of repeated errors is reported, and
+    that it counts the repeats.
+    '''
+
+    # 1. Given.
+    coalescer = Coalescer(clock=lambda: 0)
+    errors = [DetectedError('KeyError', "'id'") for _ in range(200)]
+    other_error = DetectedError('KeyError', "'name'")
+
+    # 2. When.
+    reported = [coalescer.add(error) for error in errors]
+    other_reported = coalescer.add(other_error)
+
+    # 3. Then.
+    assert reported == [True] + [False] * 199
+    assert errors[0].count == 200
+    assert other_reported
+
+
+def test_coalescer_sliding_window():
+    '''
+    Ensures that an error is reported again once it hasn't been seen
+    for longer than the window, and that each repeat slides the window.
+    '''
+
+    # 1. Given.
+    now = 0
+    coalescer = Coalescer(window=10, clock=lambda: now)
+
+    # 2. When.
+    reported = []
+
+    for now in (0, 8, 16, 27):
+        reported.append(coalescer.add(DetectedError('KeyError', "'id'")))
+
+    # 3. Then.
+    assert reported == [True, False, False, True]
@@ -0,0 +1,291 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the error.detector module.
+'''
+
+from autostack.error.detector import (
+    EXCEPTION,
+    FRAME,
+    SYNTAX_ERROR,
+    TRACEBACK,
+    ErrorDetector,
+    classify_line,
+)
+
+
+def test_classify_line_traceback():
+    '''
+    Ensures that the start of a traceback is recognized, even when
+    colored.
+    '''
+
+    # 1. Given.
+    lines = (
+        b'Traceback (most recent call last):\n',
+        b'\x1b[31m\x1b[1mTraceback (most recent call last):\x1b[0m\r\n',
+    )
+
+    # 2. When.
+    kinds = [classify_line(line) for line in lines]
+
+    # 3. Then.
+    assert kinds == [(TRACEBACK, None, None)] * 2
+
+
+def test_classify_line_exceptions():
+    '''
+    Ensures that built-in, custom, and qualified exceptions are
+    recognized, with or without a message.
+    '''
+
+    # 1. Given.
+    lines = (
+        b"NameError: name 'xyz' is not defined\n",
+        b'KeyboardInterrupt\n',
+        b'Exception: failed\n',
+        b'requests.exceptions.ConnectionError: refused\n',
+        b'\x1b[35mmodule.ParseWarning\x1b[0m: deprecated\n',
+    )
+
+    # 2. When.
+    kinds = [classify_line(line) for line in lines]
+
+    # 3. Then.
+    assert kinds == [
+        (EXCEPTION, 'NameError', "name 'xyz' is not defined"),
+        (EXCEPTION, 'KeyboardInterrupt', ''),
+        (EXCEPTION, 'Exception', 'failed'),
+        (EXCEPTION, 'requests.exceptions.ConnectionError', 'refused'),
+        (EXCEPTION, 'module.ParseWarning', 'deprecated'),
+    ]
+
+
+def test_classify_line_syntax_errors():
+    '''
+    Ensures that syntax errors are recognized, even when indented.
+    '''
+
+    # 1. Given.
+    lines = (
+        b'SyntaxError: invalid syntax\n',
+        b'  IndentationError: unexpected indent\n',
+    )
+
+    # 2. When.
+    kinds = [classify_line(line) for line in lines]
+
+    # 3. Then.
+    assert kinds == [
+        (SYNTAX_ERROR, 'SyntaxError', 'invalid syntax'),
+        (SYNTAX_ERROR, 'IndentationError', 'unexpected indent'),
+    ]
+
+
+def test_classify_line_frame():
+    '''
+    Ensures that the frames of a traceback are recognized.
+    '''
+
+    # 1. Given.
+    lines = (
+        b'  File "app.py", line 3, in <module>\n',
+        b'  File "\x1b[35mapp.py\x1b[0m", line 3\n',
+    )
+
+    # 2. When.
+    kinds = [classify_line(line) for line in lines]
+
+    # 3. Then.
+    assert kinds == [
+        (FRAME, None, 'File "app.py", line 3, in <module>'),
+        (FRAME, None, 'File "\x1b[35mapp.py\x1b[0m", line 3'),
+    ]
+
+
+def test_classify_line_non_errors():
+    '''
+    Ensures that None is returned for lines that aren't errors.
+    '''
+
+    # 1. Given.
+    lines = (
+        b'',
+        b'\n',
+        b'collected 3 items\n',
+        b'    raise ValueError(x)\n',
+        b'    ValueError: indented, so part of a traceback\n',
+        b'E       AssertionError: assert 1 == 2\n',
+        b'Error: not an exception\n',
+        b'the Traceback is below\n',
+    )
+
+    # 2. When.
+    kinds = [classify_line(line) for line in lines]
+
+    # 3. Then.
+    assert kinds == [None] * len(lines)
+
+
+def feed_lines(detector, lines):
+    '''
+    Feeds lines to a detector.
+
+    Returns {list}: the names of the errors detected.
+    '''
+
+    return [
+        error.name
+        for error in (detector.feed(line) for line in lines)
+        if error is not None
+    ]
+
+
+def test_error_detector_traceback():
+    '''
+    Ensures that a runtime error is detected at the end of its
+    traceback, through blank lines and chained tracebacks.
+    '''
+
+    # 1. Given.
+    detector = ErrorDetector()
+    lines = (
+        b'Traceback (most recent call last):\n',
+        b'  File "app.py", line 3, in <module>\n',
+        b'    users["id"]\n',
+        b"KeyError: 'id'\n",
+        b'\n',
+        b'During handling of the above exception, another exception '
+        b'occurred:\n',
+        b'\n',
+        b'Traceback (most recent call last):\n',
+        b'  File "app.py", line 5, in <module>\n',
+        b'\n',
+        b'    raise ValueError("id")\n',
+        b'ValueError: id\n',
+    )
+
+    # 2. When.
+    errors = feed_lines(detector, lines)
+
+    # 3. Then.
+    assert errors == ['KeyError', 'ValueError']
+
+
+def test_error_detector_exception_without_traceback():
+    '''
+    Ensures that only syntax errors are detected without a traceback.
+    '''
+
+    # 1. Given.
+    detector = ErrorDetector()
+    lines = (
+        b'ValueError: logged, not raised\n',
+        b'SyntaxError: invalid syntax\n',
+    )
+
+    # 2. When.
+    errors = feed_lines(detector, lines)
+
+    # 3. Then.
+    assert errors == ['SyntaxError']
+
+
+def test_error_detector_interleaved_tracebacks():
+    '''
+    Ensures that each exception ends the latest open traceback, when
+    tracebacks are interleaved.
+    '''
+
+    # 1. Given.
+    detector = ErrorDetector()
+    lines = (
+        b'Traceback (most recent call last):\n',
+        b'  File "worker_1.py", line 1, in <module>\n',
+        b'Traceback (most recent call last):\n',
+        b'  File "worker_2.py", line 1, in <module>\n',
+        b'TypeError: worker 2\n',
+        b'  File "worker_1.py", line 2, in run\n',
+        b'OSError: worker 1\n',
+        b'IndexError: not in a traceback\n',
+    )
+
+    # 2. When.
+    errors = feed_lines(detector, lines)
+
+    # 3. Then.
+    assert errors == ['TypeError', 'OSError']
+
+
+def test_error_detector_line_limit():
+    '''
+    Ensures that a traceback is dropped after too many lines.
+    '''
+
+    # 1. Given.
+    detector = ErrorDetector(max_lines=2)
+    lines = (
+        b'Traceback (most recent call last):\n',
+        b'  File "app.py", line 1, in <module>\n',
+        b'  File "app.py", line 2, in main\n',
+        b'  File "app.py", line 3, in run\n',
+        b'ValueError: too late\n',
+    )
+
+    # 2. When.
+    errors = feed_lines(detector, lines)
+
+    # 3. Then.
+    assert not errors
+
+
+def test_error_detector_timeout():
+    '''
+    Ensures that a traceback is dropped after too long.
+    '''
+
+    # 1. Given.
+    now = 0
+    detector = ErrorDetector(timeout=10, clock=lambda: now)
+
+    # 2. When.
+    detector.feed(b'Traceback (most recent call last):\n')
+    now = 11
+    late_error = detector.feed(b'ValueError: too late\n')
+    detector.feed(b'Traceback (most recent call last):\n')
+    now = 20
+    error = detector.feed(b'ValueError: in time\n')
+
+    # 3. Then.
+    assert late_error is None
+    assert error.name == 'ValueError'
+
+
+def test_error_detector_innermost_frame():
+    '''
+    Ensures that a detected error has its message, and the innermost
+    frame of its traceback.
+    '''
+
+    # 1. Given.
+    detector = ErrorDetector()
+    lines = (
+        b'Traceback (most recent call last):\n',
+        b'  File "app.py", line 3, in <module>\n',
+        b'    main()\n',
+        b'  File "app.py", line 1, in main\n',
+        b'    users["id"]\n',
+    )
+
+    # 2. When.
+    for line in lines:
+        detector.feed(line)
+
+    error = detector.feed(b"KeyError: 'id'\r\n")
+
+    # 3. Then.
+    assert error.name == 'KeyError'
+    assert error.message == "'id'"
+    assert error.frame == 'File "app.py", line 1, in main'
+    assert error.count == 1
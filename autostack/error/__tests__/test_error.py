@@ -5,17 +5,21 @@ Date: 10/22/2019
 Overview: Tests for the error package.
 '''
 
+import queue
+import threading
+import time
+
 from autostack.error import (
     listen_for_errors,
-    parse_output_for_error,
-    get_error_from_traceback,
+    detect_errors,
     handle_exception,
     handle_user_input,
+    print_error_count,
     print_listening_for_errors,
     clear_terminal,
 )
+from autostack.error.detector import DetectedError
 from autostack.error.__tests__.mock_pipe import MockPipe
-from autostack.error.__tests__.mock_handle_exception import MockHandleException
 
 
 def test_listen_for_errors(monkeypatch):
@@ -32,10 +36,10 @@ def test_listen_for_errors(monkeypatch):
 
         return
 
-    def mock_parse_output_for_error(output, pipe):
+    def mock_handle_exception(query, error):
         # pylint: disable=unused-argument
         '''
-        Mocks the parse_output_for_error function.
+        Mocks the handle_exception function.
         '''
 
         return
@@ -51,8 +55,8 @@ def test_listen_for_errors(monkeypatch):
     )
 
     monkeypatch.setattr(
-        'autostack.error.parse_output_for_error',
-        mock_parse_output_for_error
+        'autostack.error.handle_exception',
+        mock_handle_exception
     )
 
     mockpipe = MockPipe(['output', 'output', ''])
@@ -64,135 +68,195 @@ def test_listen_for_errors(monkeypatch):
     assert mockpipe.get_readline_call_count() == 3
 
 
-def test_parse_output_for_error_non_error(monkeypatch):
+def test_listen_for_errors_handles_errors(monkeypatch):
     '''
-    Ensures that handle_exception is never called when a non-error
-    is passed into parse_output_for_error.
+    Ensures that handle_exception is called for each syntax error, and
+    at the end of each traceback.
     '''
 
     # 1. Given.
-    mock_handle_exception = MockHandleException()
-
-    monkeypatch.setattr(
-        'autostack.error.handle_exception',
-        mock_handle_exception.handle_exception
-    )
+    handled = []
 
-    output = 'Not an error.'
-
-    # 2. When.
-    parse_output_for_error(output, None)
+    def mock_print():
+        '''
+        Mocks the print_logo and print_listening_for_errors function.
+        '''
 
-    # 3. Then.
-    assert not mock_handle_exception.parameter
-    assert not mock_handle_exception.was_called
+        return
 
+    monkeypatch.setattr('autostack.error.print_logo', mock_print)
+    monkeypatch.setattr(
+        'autostack.error.print_listening_for_errors',
+        mock_print
+    )
 
-def test_parse_output_for_error_with_error(monkeypatch):
-    '''
-    Ensures that handle_exception is called when an error
-    is passed into parse_output_for_error.
-    '''
+    def mock_handle_exception(query, error):
+        # pylint: disable=unused-argument
+        '''
+        Mocks the handle_exception function.
+        '''
 
-    # 1. Given.
-    mock_handle_exception = MockHandleException()
+        handled.append(query)
 
     monkeypatch.setattr(
         'autostack.error.handle_exception',
-        mock_handle_exception.handle_exception
+        mock_handle_exception
     )
 
-    output = 'IndentationError: unexpected indent'
+    mockpipe = MockPipe([
+        '>>> xyz\n',
+        'Traceback (most recent call last):\n',
+        '  File "<stdin>", line 1, in <module>\n',
+        '\n',
+        'NameError: name \'xyz\' is not defined\n',
+        '  IndentationError: unexpected indent\n',
+        '',
+    ])
 
     # 2. When.
-    parse_output_for_error(output, None)
+    listen_for_errors(mockpipe)
 
     # 3. Then.
-    assert mock_handle_exception.parameter == 'IndentationError'
-    assert mock_handle_exception.was_called
+    assert handled == [
+        'NameError name is not defined',
+        'IndentationError unexpected indent',
+    ]
 
 
-def test_parse_output_for_error_traceback(monkeypatch):
+def test_listen_for_errors_reads_while_displaying(monkeypatch):
     '''
-    Ensures that handle_exception is called when a traceback
-    is passed into parse_output_for_error.
+    Ensures that the pipe is read to the end while an error is being
+    displayed.
     '''
 
     # 1. Given.
-    mock_pipe = MockPipe([
-        '    File "<stdin>", line 1, in <module>',
-        'NameError: name \'xyz\' is not defined'
-    ])
-    mock_handle_exception = MockHandleException()
-    output = 'Traceback (most recent call last):'
+    mockpipe = MockPipe(
+        ['SyntaxError: invalid syntax\n'] + ['output\n'] * 1000 + ['']
+    )
+    read_while_displaying = threading.Event()
+
+    def mock_print():
+        '''
+        Mocks the print_logo and print_listening_for_errors function.
+        '''
 
-    def mock_get_error_from_traceback(pipe):
+        return
+
+    def mock_handle_exception(query, error):
         # pylint: disable=unused-argument
         '''
-        Mocks the get_error_from_traceback function.
+        Mocks the handle_exception function, waiting for the pipe to
+        be read.
         '''
 
-        return 'NameError'
+        for _ in range(200):
+            if mockpipe.get_readline_call_count() == 1002:
+                read_while_displaying.set()
+                return
+
+            time.sleep(0.01)
 
+    monkeypatch.setattr('autostack.error.print_logo', mock_print)
     monkeypatch.setattr(
-        'autostack.error.handle_exception',
-        mock_handle_exception.handle_exception
+        'autostack.error.print_listening_for_errors',
+        mock_print
     )
-
     monkeypatch.setattr(
-        'autostack.error.get_error_from_traceback',
-        mock_get_error_from_traceback
+        'autostack.error.handle_exception',
+        mock_handle_exception
     )
 
     # 2. When.
-    parse_output_for_error(output, mock_pipe)
+    listen_for_errors(mockpipe)
 
     # 3. Then.
-    assert mock_handle_exception.parameter == 'NameError'
-    assert mock_handle_exception.was_called
+    assert read_while_displaying.is_set()
 
 
-def test_parse_output_for_error_index_error(monkeypatch):
+def test_detect_errors_queue_full():
     '''
-    Ensures that parse_output_for_error catches index errors.
+    Ensures that errors are dropped, instead of waiting, when the queue
+    is full, and that None is queued once the pipe closes.
     '''
 
     # 1. Given.
-    mock_handle_exception = MockHandleException()
+    errors = queue.Queue(2)
+    mockpipe = MockPipe([
+        'SyntaxError: first\n',
+        'IndentationError: second\n',
+        'TabError: dropped\n',
+        '',
+    ])
 
-    monkeypatch.setattr(
-        'autostack.error.handle_exception',
-        mock_handle_exception.handle_exception
-    )
+    # 2. When.
+    detector = threading.Thread(target=detect_errors, args=(mockpipe, errors))
+    detector.start()
+    queued = [errors.get(timeout=1) for _ in range(3)]
+    detector.join(timeout=1)
 
-    output = ''
+    # 3. Then.
+    assert [error.name for error in queued[:2]] == [
+        'SyntaxError',
+        'IndentationError',
+    ]
+    assert queued[2] is None
+    assert mockpipe.get_readline_call_count() == 4
+
+
+def test_detect_errors_coalesces_repeats():
+    '''
+    Ensures that a traceback printed many times is queued once, with
+    the number of times it was printed.
+    '''
+
+    # 1. Given.
+    errors = queue.Queue()
+    traceback = [
+        'Traceback (most recent call last):\n',
+        '  File "test_app.py", line 4, in test_user\n',
+        'KeyError: \'id\'\n',
+    ]
+    mockpipe = MockPipe(traceback * 200 + [''])
 
     # 2. When.
-    parse_output_for_error(output, None)
+    detect_errors(mockpipe, errors)
 
     # 3. Then.
-    assert not mock_handle_exception.parameter
-    assert not mock_handle_exception.was_called
+    error = errors.get_nowait()
+    assert error.name == 'KeyError'
+    assert error.count == 200
+    assert errors.get_nowait() is None
 
 
-def test_get_error_from_traceback():
+def test_detect_errors_sessions():
     '''
-    Ensures that the error description is returned from a
-    traceback.
+    Ensures that the tracebacks of sessions whose output is interleaved
+    are detected separately, and that a session's open traceback is
+    dropped once it ends.
     '''
 
     # 1. Given.
-    mock_pipe = MockPipe([
-        '    File "<stdin>", line 1, in <module>',
-        'NameError: name \'xyz\' is not defined'
-    ])
+    errors = queue.Queue()
+    pipe = [
+        (1, 0.0, b'Traceback (most recent call last):\n'),
+        (2, 0.0, b'Traceback (most recent call last):\n'),
+        (1, 0.0, b'  File "one.py", line 1, in <module>\n'),
+        (2, 0.0, b'  File "two.py", line 2, in <module>\n'),
+        (2, None, None),
+        (1, 1.0, b'KeyError: 1\n'),
+        (2, 1.0, b'NameError: name \'x\' is not defined\n'),
+    ]
 
     # 2. When.
-    error = get_error_from_traceback(mock_pipe)
+    detect_errors(pipe, errors)
 
     # 3. Then.
-    assert error == 'NameError'
-    assert mock_pipe.get_readline_call_count() == 2
+    error = errors.get_nowait()
+    assert (error.name, error.frame) == (
+        'KeyError',
+        'File "one.py", line 1, in <module>'
+    )
+    assert errors.get_nowait() is None
 
 
 def test_handle_exception(capsys, monkeypatch):
@@ -295,6 +359,50 @@ def test_handle_exception(capsys, monkeypatch):
     assert captured.out == u'\U0001F95E Listening for Python errors...\n'
 
 
+def test_handle_exception_falls_back_to_name(monkeypatch):
+    '''
+    Ensures that posts are searched for with the error's name alone
+    when none are found for its query.
+    '''
+
+    # 1. Given.
+    queries = []
+
+    def mock_accepted_posts(query, error=None):
+        # pylint: disable=unused-argument
+        '''
+        Mocks the accepted_posts function, which only finds posts for
+        the error's name.
+        '''
+
+        queries.append(query)
+
+        if query == 'KeyError':
+            yield 'post'
+
+    monkeypatch.setattr(
+        'autostack.error.accepted_posts',
+        mock_accepted_posts
+    )
+    monkeypatch.setattr(
+        'autostack.error.print_accepted_post',
+        lambda post: None
+    )
+    monkeypatch.setattr('autostack.error.handle_user_input', lambda: True)
+    monkeypatch.setattr('autostack.error.clear_terminal', lambda: None)
+    monkeypatch.setattr(
+        'autostack.error.print_listening_for_errors',
+        lambda: None
+    )
+
+    # 2. When.
+    handle_exception('KeyError unlikely words', DetectedError('KeyError'))
+    handle_exception('nothing')
+
+    # 3. Then.
+    assert queries == ['KeyError unlikely words', 'KeyError', 'nothing']
+
+
 def test_handle_user_input_y(monkeypatch):
     '''
     Ensures that when 'Y' is inputted, handle_user_input returns True.
@@ -377,6 +485,23 @@ def test_handle_user_input_custom_query(monkeypatch):
     assert user_input == 'Custom query'
 
 
+def test_print_error_count(capsys):
+    '''
+    Ensures that print_error_count prints the proper output.
+    '''
+
+    # 1. Given.
+    error = DetectedError('KeyError', "'id'")
+    error.count = 200
+
+    # 2. When.
+    print_error_count(error)
+
+    # 3. Then.
+    captured = capsys.readouterr()
+    assert captured.out == 'KeyError occurred 200 times.\n'
+
+
 def test_print_listening_for_errors(capsys):
     '''
     Ensures that print_listening_for_errors prints the proper output.
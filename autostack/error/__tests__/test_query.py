@@ -0,0 +1,98 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the query module.
+'''
+
+import pytest
+
+from autostack.error.detector import DetectedError
+from autostack.error.query import (
+    MAX_MESSAGE_WORDS,
+    build_query,
+    strip_message,
+)
+
+
+@pytest.mark.parametrize('name, message, query', [
+    (
+        'NameError',
+        "name 'xyz' is not defined",
+        'NameError name is not defined',
+    ),
+    (
+        'TypeError',
+        "'NoneType' object is not subscriptable",
+        'TypeError NoneType object is not subscriptable',
+    ),
+    (
+        'FileNotFoundError',
+        "[Errno 2] No such file or directory: '/tmp/data.csv'",
+        'FileNotFoundError No such file or directory',
+    ),
+    (
+        'ValueError',
+        "invalid literal for int() with base 10: 'abc'",
+        'ValueError invalid literal for int with base',
+    ),
+    (
+        'OSError',
+        '/usr/lib/libfoo.so.1: cannot open shared object file',
+        'OSError cannot open shared object file',
+    ),
+    (
+        'KeyError',
+        "'id'",
+        'KeyError',
+    ),
+    (
+        'KeyboardInterrupt',
+        '',
+        'KeyboardInterrupt',
+    ),
+])
+def test_build_query(name, message, query):
+    '''
+    Ensures that queries are built from an error's name and its
+    message, without the parts specific to the program.
+    '''
+
+    # 1. Given.
+    error = DetectedError(name, message)
+
+    # 2. When.
+    built = build_query(error)
+
+    # 3. Then.
+    assert built == query
+
+
+def test_build_query_max_message_words():
+    '''
+    Ensures that only the first words of a long message are queried.
+    '''
+
+    # 1. Given.
+    error = DetectedError('RuntimeError', ' '.join(['word'] * 100))
+
+    # 2. When.
+    query = build_query(error)
+
+    # 3. Then.
+    assert query.split() == ['RuntimeError'] + ['word'] * MAX_MESSAGE_WORDS
+
+
+def test_strip_message_addresses():
+    '''
+    Ensures that object addresses, and punctuation, are stripped.
+    '''
+
+    # 1. Given.
+    message = '<Foo object at 0x7f3a2c> is not JSON serializable'
+
+    # 2. When.
+    stripped = strip_message(message)
+
+    # 3. Then.
+    assert stripped == 'Foo object at is not JSON serializable'
@@ -0,0 +1,126 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Coalesces repeated errors, e.g. the same traceback printed by
+every test of a suite, so that posts are only looked up once for them.
+'''
+
+from collections import OrderedDict
+import re
+import time
+
+# The number of seconds an error is remembered for after it was last
+# seen. Repeats within the window are coalesced into the first error.
+COALESCE_WINDOW = 60
+
+# Parts of messages that differ between repeats of the same error.
+ADDRESS = re.compile(r'\b0x[0-9a-fA-F]+\b')
+NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_message(message):
+    '''
+    Normalizes an error's message, so that repeats of an error, e.g.
+    with different object addresses, or line numbers, have the same
+    message.
+
+    e.g.:
+        '<Foo object at 0x7f3a2c>  has no attribute 2' ->
+        '<Foo object at 0x?> has no attribute #'
+
+    Parameter {str} message: the message.
+    Returns {str}: the normalized message.
+    '''
+
+    message = ADDRESS.sub('0x?', message)
+    message = NUMBER.sub('#', message)
+
+    return WHITESPACE.sub(' ', message).strip()
+
+
+def fingerprint(error):
+    '''
+    Builds the fingerprint of an error: its name, its normalized
+    message, and its innermost frame.
+
+    Parameter {autostack.error.detector.DetectedError} error: the error.
+    Returns {tuple}: the fingerprint.
+    '''
+
+    return error.name, normalize_message(error.message), error.frame
+
+
+class Coalescer:
+    '''
+    Remembers recently seen errors, by fingerprint, within a sliding
+    window. A repeat of an error in the window is counted on the first
+    error, instead of being reported again.
+
+    e.g.:
+        coalescer = Coalescer()
+
+        if coalescer.add(error):
+            report(error)
+    '''
+
+    def __init__(self, window=COALESCE_WINDOW, clock=time.monotonic):
+        '''
+        Initializes a coalescer.
+
+        Parameter {float} window: the number of seconds an error is
+        remembered for after it was last seen.
+        Parameter {function} clock: returns the current time, in
+        seconds.
+        '''
+
+        self.window = window
+        self.clock = clock
+
+        # The first error, and the time it was last seen, by
+        # fingerprint, least recently seen first.
+        self._errors = OrderedDict()
+
+    def add(self, error):
+        '''
+        Adds an error.
+
+        Parameter {autostack.error.detector.DetectedError} error: the
+        error.
+        Returns {bool}: True if the error is new, and should be
+        reported; False if it's a repeat.
+        '''
+
+        now = self.clock()
+
+        self._expire(now)
+
+        key = fingerprint(error)
+        seen = self._errors.get(key)
+
+        if seen is not None:
+            seen[0].count += 1
+            seen[1] = now
+            self._errors.move_to_end(key)
+
+            return False
+
+        self._errors[key] = [error, now]
+
+        return True
+
+    def _expire(self, now):
+        '''
+        Forgets the errors that weren't seen within the window.
+
+        Parameter {float} now: the current time, in seconds.
+        '''
+
+        while self._errors:
+            _, last_seen = next(iter(self._errors.values()))
+
+            if now - last_seen <= self.window:
+                break
+
+            self._errors.popitem(last=False)
@@ -0,0 +1,260 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Classifies raw lines of captured terminal output with a single
+precompiled regular expression. Output captured with script is full of
+ANSI escape codes (colors, cursor movement), so they're skipped wherever
+they can appear around the parts of a line that matter.
+'''
+
+import builtins
+import re
+import time
+
+# The kinds of lines classify_line recognizes.
+TRACEBACK = 'traceback'
+FRAME = 'frame'
+SYNTAX_ERROR = 'syntax_error'
+EXCEPTION = 'exception'
+
+# An open traceback is dropped after this many lines, or seconds,
+# without an exception.
+MAX_TRACEBACK_LINES = 1000
+TRACEBACK_TIMEOUT = 10
+
+SYNTAX_ERRORS = (
+    'SyntaxError',
+    'IndentationError',
+    'TabError',
+)
+
+# The names of the built-in exceptions, longest first, so that a name
+# is tried before the names it starts with, e.g. ExceptionGroup before
+# Exception.
+BUILTIN_EXCEPTIONS = tuple(sorted(
+    (
+        name
+        for name, value in vars(builtins).items()
+        if isinstance(value, type) and issubclass(value, BaseException)
+    ),
+    key=len,
+    reverse=True
+))
+
+# Any number of ANSI escape codes.
+ANSI_ESCAPE = rb'(?:\x1b\[[0-?]*[ -/]*[@-~])*'
+ANSI_ESCAPES = re.compile(ANSI_ESCAPE)
+
+# A line is only checked against the names of exceptions once it's
+# known to start with a word followed by ':', or the end of the line.
+# The word is matched in a lookahead, and then consumed by reference, so
+# that a word that isn't followed by either isn't backtracked over.
+ERROR_LINE = re.compile(
+    rb'^' + ANSI_ESCAPE + rb'(?P<indent>[ \t]*)' + ANSI_ESCAPE +
+    rb'(?:'
+    rb'(?P<traceback>Traceback \(most recent call last\):)'
+    rb'|'
+    rb'(?P<frame>File "[^"]*", line \d+(?:, in [^\s\x1b]+)?)'
+    rb'|'
+    rb'(?=(?=(?P<word>[\w.]+))(?P=word)' + ANSI_ESCAPE + rb'(?::|\s*$))'
+    rb'(?P<name>(?:[A-Za-z_]\w*\.)*(?:' +
+    b'|'.join(name.encode('ascii') for name in BUILTIN_EXCEPTIONS) +
+    rb'|[A-Za-z_]\w*(?:Error|Exception|Warning)))' + ANSI_ESCAPE +
+    rb'(?::|\s*$)(?P<message>.*)'
+    rb')'
+)
+
+
+def classify_line(line):
+    '''
+    Classifies a raw line of output.
+
+    e.g.:
+        b'Traceback (most recent call last):' -> (TRACEBACK, None, None)
+        b'  File "app.py", line 1, in <module>' ->
+            (FRAME, None, 'File "app.py", line 1, in <module>')
+        b'IndentationError: unexpected indent' ->
+            (SYNTAX_ERROR, 'IndentationError', 'unexpected indent')
+        b"NameError: name 'xyz' is not defined" ->
+            (EXCEPTION, 'NameError', "name 'xyz' is not defined")
+        b'KeyboardInterrupt' -> (EXCEPTION, 'KeyboardInterrupt', '')
+        b'collected 3 items' -> None
+
+    Exceptions are only recognized at the start of a line, as Python
+    prints them, so that e.g. code in a traceback isn't mistaken for
+    one.
+
+    Parameter {bytes} line: raw line of output from a pipe.
+    Returns {tuple}: the kind of line, the name of the error, if any,
+    and the frame, or the error's message, if any; or None, if the line
+    has nothing to do with an error.
+    '''
+
+    match = ERROR_LINE.match(line)
+
+    if match is None:
+        return None
+
+    if match.group('traceback'):
+        return TRACEBACK, None, None
+
+    if match.group('frame'):
+        return FRAME, None, match.group('frame').decode('utf-8', 'replace')
+
+    name = match.group('name').decode('ascii')
+    message = ANSI_ESCAPES.sub(b'', match.group('message')).decode(
+        'utf-8',
+        'replace'
+    ).strip()
+
+    if name in SYNTAX_ERRORS:
+        return SYNTAX_ERROR, name, message
+
+    if match.group('indent'):
+        return None
+
+    return EXCEPTION, name, message
+
+
+class DetectedError:
+    '''
+    An error detected in output: its name, its message, the innermost
+    frame of its traceback, and the number of times it's been seen.
+    '''
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('name', 'message', 'frame', 'count')
+
+    def __init__(self, name, message='', frame=None):
+        '''
+        Initializes a detected error.
+
+        Parameter {str} name: the name of the error, e.g. 'KeyError'.
+        Parameter {str} message: the error's message.
+        Parameter {str} frame: the innermost frame of the error's
+        traceback, or None, if it didn't have one.
+        '''
+
+        self.name = name
+        self.message = message
+        self.frame = frame
+        self.count = 1
+
+    def __repr__(self):
+        '''
+        Returns {str}: e.g. DetectedError('KeyError', "'id'").
+        '''
+
+        return 'DetectedError({!r}, {!r})'.format(self.name, self.message)
+
+
+class ErrorDetector:
+    '''
+    An incremental state machine that detects errors in output fed to
+    it line by line. It never reads on its own, so it can't block.
+
+    Syntax errors are detected on their own, and runtime errors at the
+    end of a traceback. Several tracebacks may be open at once, e.g.
+    when processes write to the same terminal, and each exception ends
+    the most recently started one. Tracebacks that haven't ended after
+    too many lines, or too long, are dropped, so a truncated traceback
+    can't swallow a later exception.
+
+    e.g.:
+        detector = ErrorDetector()
+
+        for line in pipe:
+            error = detector.feed(line)
+    '''
+
+    def __init__(self, max_lines=MAX_TRACEBACK_LINES,
+                 timeout=TRACEBACK_TIMEOUT, clock=time.monotonic):
+        '''
+        Initializes an error detector.
+
+        Parameter {int} max_lines: the number of lines after which an
+        open traceback is dropped.
+        Parameter {float} timeout: the number of seconds after which an
+        open traceback is dropped.
+        Parameter {function} clock: returns the current time, in
+        seconds.
+        '''
+
+        self.max_lines = max_lines
+        self.timeout = timeout
+        self.clock = clock
+        self._line_count = 0
+
+        # The [line count, time] each open traceback started at, and its
+        # innermost frame so far, oldest first.
+        self._tracebacks = []
+
+    def feed(self, line, now=None):
+        '''
+        Feeds a line of output to the detector.
+
+        Parameter {bytes} line: raw line of output from a pipe.
+        Parameter {float} now: the time the line was output, in seconds,
+        by default the clock's current time.
+        Returns {DetectedError}: the error the line ends, or None.
+        '''
+
+        self._line_count += 1
+
+        if self._tracebacks:
+            self._expire(now)
+
+        line_kind = classify_line(line)
+
+        if line_kind is None:
+            return None
+
+        kind, name, detail = line_kind
+
+        if kind == TRACEBACK:
+            self._tracebacks.append([
+                self._line_count,
+                self.clock() if now is None else now,
+                None
+            ])
+
+            return None
+
+        if kind == FRAME:
+            if self._tracebacks:
+                self._tracebacks[-1][2] = detail
+
+            return None
+
+        # An exception ends the latest traceback, and syntax errors are
+        # errors with, or without, one.
+        if self._tracebacks:
+            frame = self._tracebacks.pop()[2]
+        elif kind == SYNTAX_ERROR:
+            frame = None
+        else:
+            return None
+
+        return DetectedError(name, detail, frame)
+
+    def _expire(self, now=None):
+        '''
+        Drops the open tracebacks that are too long, or too old.
+
+        Parameter {float} now: the current time, in seconds, by default
+        the clock's.
+        '''
+
+        if now is None:
+            now = self.clock()
+
+        while self._tracebacks:
+            line_count, start, _ = self._tracebacks[0]
+
+            if self._line_count - line_count <= self.max_lines and \
+                    now - start <= self.timeout:
+                break
+
+            self._tracebacks.pop(0)
@@ -0,0 +1,89 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Builds the query posts are searched for with, from a detected
+error's name and message. Parts of the message that are specific to the
+program that raised the error (quoted values, paths, numbers) are
+stripped, so that the query matches posts about the same error.
+'''
+
+import builtins
+import re
+
+from autostack.error.coalesce import ADDRESS, NUMBER
+
+# The most words of a message that are kept in a query.
+MAX_MESSAGE_WORDS = 12
+
+# Quoted type names are kept, e.g. 'NoneType' in "'NoneType' object is
+# not subscriptable", since posts about the error mention them too.
+TYPE_NAMES = frozenset(
+    [name for name, value in vars(builtins).items() if isinstance(value, type)]
+    + ['NoneType', 'function', 'method', 'module', 'generator']
+)
+
+QUOTED = re.compile(r'\'([^\']*)\'|"([^"]*)"')
+ERRNO = re.compile(r'\[(?:Errno|WinError) -?\d+\]')
+PATH = re.compile(r'(?:[A-Za-z]:)?(?:[\\/][^\s,:;]*)+')
+PUNCTUATION = re.compile(r'[^\w\s]+')
+
+
+def build_query(error):
+    '''
+    Builds a query from an error's name and stripped message.
+
+    e.g.:
+        NameError: name 'xyz' is not defined ->
+            'NameError name is not defined'
+        TypeError: 'NoneType' object is not subscriptable ->
+            'TypeError NoneType object is not subscriptable'
+        FileNotFoundError: [Errno 2] No such file or directory: 'a.txt' ->
+            'FileNotFoundError No such file or directory'
+
+    Parameter {autostack.error.detector.DetectedError} error: the error.
+    Returns {str}: the query.
+    '''
+
+    words = strip_message(error.message).split()[:MAX_MESSAGE_WORDS]
+
+    return ' '.join([error.name] + words)
+
+
+def strip_message(message):
+    '''
+    Strips the parts of an error's message that are specific to the
+    program that raised it: quoted values (other than type names),
+    error numbers, paths, addresses, numbers and punctuation. Unlike
+    autostack.error.coalesce.normalize_message, which keeps the shape
+    of a message to tell errors apart, only the words posts about the
+    error would share are left.
+
+    Parameter {str} message: the message.
+    Returns {str}: the stripped message.
+    '''
+
+    message = QUOTED.sub(keep_type_name, message)
+    message = ERRNO.sub(' ', message)
+    message = PATH.sub(' ', message)
+    message = ADDRESS.sub(' ', message)
+    message = NUMBER.sub(' ', message)
+    message = PUNCTUATION.sub(' ', message)
+
+    return ' '.join(message.split())
+
+
+def keep_type_name(match):
+    '''
+    Replaces a quoted value with the type name it is, if any.
+
+    Parameter {re.Match} match: the quoted value.
+    Returns {str}: the type name, unquoted, or a space.
+    '''
+
+    value = match.group(1) if match.group(1) is not None else match.group(2)
+
+    if value in TYPE_NAMES:
+        return value
+
+    return ' '
@@ -0,0 +1,115 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Syntax highlights code blocks for the terminal. Lexers are
+created once, and reused, and each type of token is resolved to a color
+once, by walking up its token type hierarchy, so that e.g.
+Token.Literal.String.Affix is colored like Token.Literal.String.
+'''
+
+import pygments
+from pygments.lexers import get_lexer_by_name
+from pygments.token import Comment, Keyword, Name, Number, String
+from termcolor import colored
+
+DEFAULT_LANGUAGE = 'python'
+
+# The colors of token types, and, unless they have their own, of their
+# subtypes.
+TOKEN_COLORS = {
+    Keyword: 'blue',
+    Name.Builtin.Pseudo: 'blue',
+    Number: 'green',
+    Comment: 'green',
+    String: 'yellow',
+}
+
+# Lexers, by language, see get_lexer.
+_LEXERS = {}
+
+# The resolved color of every token type seen, see get_color.
+_COLORS = {}
+
+
+def highlight(code, language=DEFAULT_LANGUAGE):
+    '''
+    A generator that syntax highlights code.
+
+    Consecutive tokens of the same color are colored as one chunk.
+
+    Parameter {str} code: the code to highlight.
+    Parameter {str} language: the name of the code's language.
+    Yields {str}: chunks of the code, with ANSI color codes.
+    '''
+
+    run = []
+    run_color = None
+
+    for token, content in pygments.lex(code, get_lexer(language)):
+        color = get_color(token)
+
+        if color != run_color and run:
+            yield colorize(''.join(run), run_color)
+            run = []
+
+        run.append(content)
+        run_color = color
+
+    if run:
+        yield colorize(''.join(run), run_color)
+
+
+def colorize(text, color):
+    '''
+    Colors text, unless there's no color.
+
+    Parameter {str} text: the text to color.
+    Parameter {str} color: the color, or None.
+    Returns {str}: the text, with ANSI color codes.
+    '''
+
+    if color is None:
+        return text
+
+    return colored(text, color)
+
+
+def get_lexer(language=DEFAULT_LANGUAGE):
+    '''
+    Gets the lexer of a language, creating it the first time.
+
+    Parameter {str} language: the name of the language.
+    Returns {pygments.lexer.Lexer}: the lexer.
+    '''
+
+    lexer = _LEXERS.get(language)
+
+    if lexer is None:
+        lexer = _LEXERS[language] = get_lexer_by_name(language)
+
+    return lexer
+
+
+def get_color(token):
+    '''
+    Gets the color of a token type: its own, or that of its nearest
+    ancestor with a color. The result is memoized.
+
+    Parameter {pygments.token._TokenType} token: the token type.
+    Returns {str}: the color, or None, if the token isn't colored.
+    '''
+
+    try:
+        return _COLORS[token]
+    except KeyError:
+        pass
+
+    ancestor = token
+
+    while ancestor is not None and ancestor not in TOKEN_COLORS:
+        ancestor = ancestor.parent
+
+    color = _COLORS[token] = TOKEN_COLORS.get(ancestor)
+
+    return color
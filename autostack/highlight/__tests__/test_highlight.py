@@ -0,0 +1,81 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the highlight package.
+'''
+
+import re
+
+from pygments.token import Keyword, Name, String, Token
+
+from autostack.highlight import (
+    get_color,
+    get_lexer,
+    highlight,
+)
+
+ANSI_ESCAPE = re.compile(r'\x1B[@-_][0-?]*[ -/]*[@-~]')
+
+
+def test_get_color_inherits_parent_color():
+    '''
+    Ensures that token types without a color of their own are colored
+    like their nearest ancestor with a color.
+    '''
+
+    # 1. Given.
+    tokens = (String.Affix, Keyword.Constant, Name.Builtin.Pseudo)
+
+    # 2. When.
+    colors = [get_color(token) for token in tokens]
+
+    # 3. Then.
+    assert colors == ['yellow', 'blue', 'blue']
+
+
+def test_get_color_uncolored():
+    '''
+    Ensures that None is returned for token types that aren't colored.
+    '''
+
+    # 1. Given.
+    tokens = (Token, Token.Text, Name.Builtin)
+
+    # 2. When.
+    colors = [get_color(token) for token in tokens]
+
+    # 3. Then.
+    assert colors == [None, None, None]
+
+
+def test_get_lexer_reused():
+    '''
+    Ensures that a language's lexer is only created once.
+    '''
+
+    # 1. Given.
+    lexer = get_lexer('python')
+
+    # 2. When.
+    same_lexer = get_lexer('python')
+
+    # 3. Then.
+    assert lexer is same_lexer
+
+
+def test_highlight():
+    '''
+    Ensures that all of the code is returned, with consecutive tokens
+    of the same color in one chunk.
+    '''
+
+    # 1. Given.
+    code = 'if x:\n    return b"a" "b"\n'
+
+    # 2. When.
+    chunks = list(highlight(code))
+
+    # 3. Then.
+    assert ANSI_ESCAPE.sub('', ''.join(chunks)) == code
+    assert len(chunks) < len(list(get_lexer().get_tokens(code)))
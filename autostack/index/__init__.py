@@ -0,0 +1,270 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Contains the PostIndex class, a local full-text index of posts,
+in SQLite, with FTS5. Posts fetched from Stack Overflow are added to it,
+and it's searched before Stack Overflow is, so that errors seen before
+are resolved locally.
+'''
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from autostack.post import CODE, Post, Segment
+
+# The number of posts a search returns, at most.
+SEARCH_LIMIT = 10
+
+# The weights of the title, question, answer, code, and tags columns, in
+# the relevance of a post.
+COLUMN_WEIGHTS = (10.0, 2.0, 1.0, 1.0, 5.0)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS posts (
+    post_id INTEGER PRIMARY KEY,
+    url TEXT,
+    title TEXT NOT NULL,
+    score INTEGER,
+    tags TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    indexed REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_text USING fts5(
+    title,
+    question,
+    answer,
+    code,
+    tags
+);
+'''
+
+WORD = re.compile(r'\w+')
+
+
+class PostIndex:
+    '''
+    A full-text index of posts, stored in a SQLite database.
+
+    Each post is stored whole, so that it can be displayed without
+    being fetched again, and its title, question text, answer text,
+    code, and tags are indexed for full-text search. The index may be
+    used from any thread.
+
+    e.g.:
+        index = PostIndex(INDEX_PATH)
+        index.add(post)
+        posts = index.search('IndexError list index out of range')
+    '''
+
+    def __init__(self, path):
+        '''
+        Initializes a post index, creating its database, if needed.
+
+        Parameter {str} path: the path to the database, or ':memory:'.
+        '''
+
+        directory = os.path.dirname(path)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def add(self, post):
+        '''
+        Adds a post to the index, replacing the post with its id, if
+        any. Posts without an id aren't indexed.
+
+        Parameter {autostack.post.Post} post: the post.
+        '''
+
+        self.add_many([post])
+
+    def add_many(self, posts):
+        '''
+        Adds posts to the index, in a single transaction.
+
+        Parameter {iterable} posts: the posts.
+        '''
+
+        now = time.time()
+
+        with self._lock, self._connection:
+            for post in posts:
+                if post.post_id is None:
+                    continue
+
+                self._connection.execute(
+                    'DELETE FROM posts_text WHERE rowid = ?',
+                    (post.post_id,)
+                )
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO posts VALUES '
+                    '(?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        post.post_id,
+                        post.url,
+                        post.title,
+                        post.score,
+                        json.dumps(post.tags),
+                        dump_segments(post.question),
+                        dump_segments(post.answer),
+                        now,
+                    )
+                )
+                self._connection.execute(
+                    'INSERT INTO posts_text '
+                    '(rowid, title, question, answer, code, tags) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (
+                        post.post_id,
+                        post.title,
+                        segments_text(post.question),
+                        segments_text(post.answer),
+                        segments_text(post.question + post.answer, CODE),
+                        ' '.join(post.tags),
+                    )
+                )
+
+    def search(self, query, limit=SEARCH_LIMIT, any_word=False):
+        '''
+        Searches for the posts that contain every word of a query, or
+        any word, most relevant first.
+
+        Parameter {str} query: the query.
+        Parameter {int} limit: the most posts returned.
+        Parameter {bool} any_word: whether posts need only contain any
+        word of the query.
+        Returns {list}: the posts.
+        '''
+
+        match = build_match(query, ' OR ' if any_word else ' ')
+
+        if not match:
+            return []
+
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT posts.post_id, url, posts.title, score, '
+                'posts.question, posts.answer, posts.tags '
+                'FROM posts_text JOIN posts '
+                'ON posts.post_id = posts_text.rowid '
+                'WHERE posts_text MATCH ? '
+                'ORDER BY bm25(posts_text, {}), score DESC '
+                'LIMIT ?'.format(', '.join(map(str, COLUMN_WEIGHTS))),
+                (match, limit)
+            ).fetchall()
+
+        return [
+            Post(
+                post_id=post_id,
+                url=url,
+                title=title,
+                score=score,
+                question=load_segments(question),
+                answer=load_segments(answer),
+                tags=json.loads(tags)
+            )
+            for post_id, url, title, score, question, answer, tags in rows
+        ]
+
+    def __len__(self):
+        '''
+        Returns {int}: the number of posts in the index.
+        '''
+
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM posts'
+            ).fetchone()[0]
+
+    def close(self):
+        '''
+        Closes the index's database.
+        '''
+
+        with self._lock:
+            self._connection.close()
+
+
+def build_match(query, operator=' '):
+    '''
+    Builds an FTS5 query that matches every word of a query, or, with
+    the ' OR ' operator, any word. Each word is quoted, so that words
+    such as 'NOT', or punctuation, aren't taken for FTS5 syntax.
+
+    e.g. "NameError: name 'x' is not defined" ->
+        '"nameerror" "name" "x" "is" "not" "defined"'
+
+    Parameter {str} query: the query.
+    Parameter {str} operator: the operator words are joined with.
+    Returns {str}: the FTS5 query, or an empty string, if the query has
+    no words.
+    '''
+
+    return operator.join(
+        '"{}"'.format(word)
+        for word in WORD.findall(query.lower())
+    )
+
+
+def segments_text(segments, kind=None):
+    '''
+    Joins the text of segments, either every segment but code, or only
+    the segments of a kind.
+
+    Parameter {tuple} segments: the segments.
+    Parameter {str} kind: the kind of segments to join, or None.
+    Returns {str}: the text.
+    '''
+
+    texts = []
+
+    for segment in segments:
+        if (segment.kind == kind) if kind else (segment.kind != CODE):
+            if isinstance(segment.content, str):
+                texts.append(segment.content)
+            else:
+                texts.extend(segment.content)
+
+    return '\n'.join(texts)
+
+
+def dump_segments(segments):
+    '''
+    Serializes segments.
+
+    Parameter {tuple} segments: the segments.
+    Returns {str}: the segments, as JSON.
+    '''
+
+    return json.dumps([
+        [segment.kind, segment.content]
+        for segment in segments
+    ])
+
+
+def load_segments(data):
+    '''
+    Deserializes segments.
+
+    Parameter {str} data: the segments, as JSON.
+    Returns {tuple}: the segments.
+    '''
+
+    return tuple(
+        Segment(kind, content if isinstance(content, str) else
+                tuple(content))
+        for kind, content in json.loads(data)
+    )
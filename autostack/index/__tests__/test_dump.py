@@ -0,0 +1,72 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for importing Stack Exchange data dumps.
+'''
+
+import os
+
+from autostack.index import PostIndex, segments_text
+from autostack.index.dump import import_dump, parse_tags
+
+DUMP_PATH = os.path.join(os.path.dirname(__file__), 'data', 'Posts.xml')
+
+
+def test_import_dump():
+    '''
+    Ensures that only questions with accepted answers are imported, each
+    with its accepted answer.
+    '''
+
+    # 1. Given.
+    index = PostIndex(':memory:')
+    progress = []
+
+    # 2. When.
+    imported = import_dump(DUMP_PATH, index, progress=progress.append)
+    posts = index.search('IndexError list index')
+
+    # 3. Then.
+    assert imported == 3
+    assert len(index) == 3
+    assert progress == [3]
+    assert [post.post_id for post in posts] == [1]
+    assert posts[0].url == 'https://stackoverflow.com/questions/1'
+    assert posts[0].score == 12
+    assert posts[0].tags == ('python', 'list')
+    assert segments_text(posts[0].answer) == 'The list is empty.'
+    assert not index.search('Unanswered')
+    assert not index.search('accepted')
+
+
+def test_import_dump_tags():
+    '''
+    Ensures that only questions with one of the tags are imported.
+    '''
+
+    # 1. Given.
+    index = PostIndex(':memory:')
+
+    # 2. When.
+    imported = import_dump(DUMP_PATH, index, tags=['python'])
+
+    # 3. Then.
+    assert imported == 2
+    assert not index.search('NullPointerException')
+    assert [post.post_id for post in index.search('NameError')] == [6]
+
+
+def test_parse_tags():
+    '''
+    Ensures that tags are parsed in both of the formats of dumps.
+    '''
+
+    # 1. Given.
+    tags = ('<python><list>', '|python|list|', '')
+
+    # 2. When.
+    parsed = [parse_tags(tag) for tag in tags]
+
+    # 3. Then.
+    assert parsed == [('python', 'list'), ('python', 'list'), ()]
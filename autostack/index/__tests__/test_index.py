@@ -0,0 +1,125 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the index package.
+'''
+
+import pytest
+
+from autostack.index import PostIndex, build_match
+from autostack.post import CODE, LIST, TEXT, Post, Segment
+
+
+def make_post(post_id, title, score=0, code='x = []', tags=('python',)):
+    '''
+    Makes a post.
+    '''
+
+    return Post(
+        post_id=post_id,
+        url='https://stackoverflow.com/questions/{}'.format(post_id),
+        title=title,
+        score=score,
+        question=(
+            Segment(TEXT, 'Why does this fail?'),
+            Segment(CODE, code),
+        ),
+        answer=(
+            Segment(TEXT, 'Check the length first.'),
+            Segment(LIST, ('len(x)', 'x[-1]')),
+        ),
+        tags=tags
+    )
+
+
+@pytest.fixture(name='index')
+def fixture_index(tmp_path):
+    '''
+    Yields {PostIndex}: an empty index.
+    '''
+
+    index = PostIndex(str(tmp_path / 'index' / 'index.sqlite3'))
+
+    yield index
+
+    index.close()
+
+
+def test_search_round_trip(index):
+    '''
+    Ensures that a post found in the index is the post that was added.
+    '''
+
+    # 1. Given.
+    post = make_post(1, 'IndexError: list index out of range')
+    index.add(post)
+
+    # 2. When.
+    found = index.search('IndexError list index out of range')
+
+    # 3. Then.
+    assert len(found) == 1
+    assert (found[0].post_id, found[0].url, found[0].title) == (
+        post.post_id,
+        post.url,
+        post.title,
+    )
+    assert found[0].question == post.question
+    assert found[0].answer == post.answer
+    assert found[0].tags == post.tags
+    assert found[0].revision == post.revision
+
+
+def test_search_every_word(index):
+    '''
+    Ensures that only posts with every word of the query are found,
+    in any column, most relevant first.
+    '''
+
+    # 1. Given.
+    index.add_many([
+        make_post(1, 'IndexError: list index out of range', score=5),
+        make_post(2, 'IndexError: string index out of range', score=50),
+        make_post(3, 'Loop fails', code='IndexError: list index out of range'),
+    ])
+
+    # 2. When.
+    found = index.search('IndexError: list index out of range')
+
+    # 3. Then.
+    assert [post.post_id for post in found] == [1, 3]
+
+
+def test_add_replaces(index):
+    '''
+    Ensures that adding a post again replaces it.
+    '''
+
+    # 1. Given.
+    index.add(make_post(1, 'KeyError in a dict'))
+
+    # 2. When.
+    index.add(make_post(1, 'KeyError when reading a dictionary'))
+
+    # 3. Then.
+    assert len(index) == 1
+    assert index.search('KeyError dict') == []
+    assert index.search('KeyError dictionary')[0].title == (
+        'KeyError when reading a dictionary'
+    )
+
+
+def test_build_match():
+    '''
+    Ensures that every word is quoted, so that it isn't FTS5 syntax.
+    '''
+
+    # 1. Given.
+    query = 'TypeError: unsupported operand NOT "int"'
+
+    # 2. When.
+    match = build_match(query)
+
+    # 3. Then.
+    assert match == '"typeerror" "unsupported" "operand" "not" "int"'
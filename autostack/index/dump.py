@@ -0,0 +1,248 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Imports the posts of a Stack Exchange data dump (Posts.xml)
+into the local index, so that posts can be searched for without access
+to Stack Overflow. The dump, which is many GB, is streamed with
+iterparse, and each row is cleared once it's been read, so that memory
+use stays constant. Questions with accepted answers wait for their
+answers in a temporary database on disk, instead of in memory.
+'''
+
+import os
+import re
+import sqlite3
+import tempfile
+from urllib.parse import urljoin
+
+from lxml import etree
+
+from autostack.post import Post
+from autostack.so_web_scraper import BASE_URL
+from autostack.so_web_scraper.api import parse_body
+
+# The types of rows in Posts.xml.
+QUESTION = '1'
+ANSWER = '2'
+
+# The number of posts added to the index in a single transaction.
+BATCH_SIZE = 1000
+
+# Tags are either '<python><list>', or, in newer dumps, '|python|list|'.
+TAG = re.compile(r'[^<>|]+')
+
+
+def import_dump(path, index, tags=None, progress=None):
+    '''
+    Imports the questions with accepted answers of a Posts.xml, and
+    their accepted answers, into an index.
+
+    Parameter {str} path: the path to Posts.xml.
+    Parameter {autostack.index.PostIndex} index: the index.
+    Parameter {set} tags: the tags a question needs one of to be
+    imported, or None, to import every question.
+    Parameter {function} progress: called with the number of posts
+    imported so far, after every batch, if any.
+    Returns {int}: the number of posts imported.
+    '''
+
+    tags = set(tags) if tags else None
+    imported = 0
+    batch = []
+
+    with tempfile.TemporaryDirectory() as directory, \
+            PendingQuestions(os.path.join(directory, 'pending')) as pending:
+        for row in iter_rows(path):
+            post_type = row.get('PostTypeId')
+
+            if post_type == QUESTION:
+                question_tags = parse_tags(row.get('Tags', ''))
+
+                if row.get('AcceptedAnswerId') and \
+                        (tags is None or tags.intersection(question_tags)):
+                    pending.add(row, question_tags)
+            elif post_type == ANSWER:
+                question = pending.pop(row.get('Id'))
+
+                if question is not None:
+                    batch.append(build_post(question, row.get('Body', '')))
+
+            if len(batch) >= BATCH_SIZE:
+                imported += flush(index, batch, progress, imported)
+                batch = []
+
+        imported += flush(index, batch, progress, imported)
+
+    return imported
+
+
+def flush(index, batch, progress, imported):
+    '''
+    Adds a batch of posts to an index.
+
+    Parameter {autostack.index.PostIndex} index: the index.
+    Parameter {list} batch: the posts.
+    Parameter {function} progress: called with the number of posts
+    imported, if any.
+    Parameter {int} imported: the number of posts imported before.
+    Returns {int}: the number of posts in the batch.
+    '''
+
+    if batch:
+        index.add_many(batch)
+
+        if progress is not None:
+            progress(imported + len(batch))
+
+    return len(batch)
+
+
+def iter_rows(path):
+    '''
+    A generator that streams the rows of a Posts.xml. Each row, and the
+    rows before it, are cleared once the next row is read.
+
+    Parameter {str} path: the path to Posts.xml.
+    Yields {lxml.etree._Element}: the rows.
+    '''
+
+    for _, row in etree.iterparse(
+            path,
+            events=('end',),
+            tag='row',
+            huge_tree=True
+    ):
+        yield row
+
+        row.clear()
+
+        while row.getprevious() is not None:
+            del row.getparent()[0]
+
+
+def parse_tags(tags):
+    '''
+    Parses the tags of a question.
+
+    e.g. '<python><list>' -> ('python', 'list')
+
+    Parameter {str} tags: the tags, as they're in the dump.
+    Returns {tuple}: the tags.
+    '''
+
+    return tuple(TAG.findall(tags))
+
+
+def build_post(question, answer_body):
+    '''
+    Builds a post from a question, and its accepted answer's body.
+
+    Parameter {tuple} question: the (id, title, score, tags, body) of
+    the question.
+    Parameter {str} answer_body: the html body of the answer.
+    Returns {autostack.post.Post}: the post.
+    '''
+
+    post_id, title, score, tags, body = question
+
+    return Post(
+        post_id=post_id,
+        url=urljoin(BASE_URL, '/questions/{}'.format(post_id)),
+        title=title,
+        score=score,
+        question=parse_body(body),
+        answer=parse_body(answer_body),
+        tags=tags.split(' ') if tags else ()
+    )
+
+
+class PendingQuestions:
+    '''
+    Questions waiting for their accepted answers, by the id of the
+    answer, in a database on disk. Answers come after their questions
+    in the dump, but may be millions of rows later.
+    '''
+
+    def __init__(self, path):
+        '''
+        Initializes pending questions.
+
+        Parameter {str} path: the path to the database.
+        '''
+
+        self._connection = sqlite3.connect(path)
+
+        # The database is thrown away, so it needn't survive a crash.
+        self._connection.execute('PRAGMA journal_mode = OFF')
+        self._connection.execute('PRAGMA synchronous = OFF')
+        self._connection.execute(
+            'CREATE TABLE questions ('
+            'answer_id INTEGER PRIMARY KEY, '
+            'post_id INTEGER, '
+            'title TEXT, '
+            'score INTEGER, '
+            'tags TEXT, '
+            'body TEXT)'
+        )
+
+    def __enter__(self):
+        '''
+        Returns {PendingQuestions}: the pending questions.
+        '''
+
+        return self
+
+    def __exit__(self, *args):
+        '''
+        Closes the database.
+        '''
+
+        self._connection.close()
+
+    def add(self, row, tags):
+        '''
+        Adds a question.
+
+        Parameter {lxml.etree._Element} row: the question's row.
+        Parameter {tuple} tags: the question's tags.
+        '''
+
+        self._connection.execute(
+            'INSERT OR REPLACE INTO questions VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                int(row.get('AcceptedAnswerId')),
+                int(row.get('Id')),
+                row.get('Title', ''),
+                int(row.get('Score', 0)),
+                ' '.join(tags),
+                row.get('Body', ''),
+            )
+        )
+
+    def pop(self, answer_id):
+        '''
+        Removes the question an answer is the accepted answer of.
+
+        Parameter {str} answer_id: the id of the answer.
+        Returns {tuple}: the (id, title, score, tags, body) of the
+        question, or None, if the answer isn't an accepted answer of a
+        question that's been added.
+        '''
+
+        if answer_id is None:
+            return None
+
+        question = self._connection.execute(
+            'SELECT post_id, title, score, tags, body FROM questions '
+            'WHERE answer_id = ?',
+            (int(answer_id),)
+        ).fetchone()
+
+        if question is not None:
+            self._connection.execute(
+                'DELETE FROM questions WHERE answer_id = ?',
+                (int(answer_id),)
+            )
+
+        return question
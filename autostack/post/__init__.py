@@ -0,0 +1,109 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Contains the Post and Segment classes, a compact representation
+of a Stack Overflow post with an accepted answer. Posts are built once,
+when a post is parsed, so that displaying them doesn't need the post's
+html document.
+'''
+
+import hashlib
+
+# The kinds of segments a question or answer is made of.
+TEXT = 'text'
+QUOTE = 'quote'
+LIST = 'list'
+CODE = 'code'
+
+
+class Segment:
+    '''
+    A block of a question or answer: a paragraph or header of text, a
+    quote, an unordered list, or a code block.
+    '''
+
+    __slots__ = ('kind', 'content')
+
+    def __init__(self, kind, content):
+        '''
+        Initializes a segment.
+
+        Parameter {str} kind: TEXT, QUOTE, LIST or CODE.
+        Parameter {str:tuple} content: the text of the segment, or, for
+        a LIST, a tuple of the text of each item.
+        '''
+
+        self.kind = kind
+        self.content = content
+
+    def __eq__(self, other):
+        '''
+        Segments are equal when their kind and content are equal.
+        '''
+
+        if not isinstance(other, Segment):
+            return NotImplemented
+
+        return (self.kind, self.content) == (other.kind, other.content)
+
+    def __repr__(self):
+        '''
+        Returns {str}: e.g. Segment('code', 'print(x)').
+        '''
+
+        return 'Segment({!r}, {!r})'.format(self.kind, self.content)
+
+
+class Post:
+    '''
+    A Stack Overflow question, and its accepted answer.
+    '''
+
+    # pylint: disable=too-few-public-methods, too-many-arguments
+
+    __slots__ = (
+        'post_id',
+        'url',
+        'title',
+        'score',
+        'question',
+        'answer',
+        'revision',
+        'tags',
+    )
+
+    def __init__(self, post_id, url, title, score, question, answer,
+                 revision=None, tags=()):
+        '''
+        Initializes a post.
+
+        Parameter {int} post_id: the id of the question.
+        Parameter {str} url: the url of the question.
+        Parameter {str} title: the title of the question.
+        Parameter {int} score: the score of the question.
+        Parameter {tuple} question: the question's segments.
+        Parameter {tuple} answer: the accepted answer's segments.
+        Parameter {str} revision: identifies the version of the post;
+        by default, a hash of its title, question and answer, so that
+        an edited post gets a new revision.
+        Parameter {tuple} tags: the question's tags, e.g. ('python',).
+        '''
+
+        self.post_id = post_id
+        self.url = url
+        self.title = title
+        self.score = score
+        self.question = tuple(question)
+        self.answer = tuple(answer)
+        self.revision = revision or hashlib.sha1(repr(
+            (self.title, self.question, self.answer)
+        ).encode('utf-8')).hexdigest()
+        self.tags = tuple(tags)
+
+    def __repr__(self):
+        '''
+        Returns {str}: e.g. Post(27695157, 'Python - IndexError').
+        '''
+
+        return 'Post({!r}, {!r})'.format(self.post_id, self.title)
@@ -0,0 +1,58 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the post package.
+'''
+
+import pytest
+
+from autostack.post import (
+    CODE,
+    TEXT,
+    Post,
+    Segment,
+)
+
+
+def test_post_has_no_instance_dict():
+    '''
+    Ensures that posts, and their segments, don't carry a __dict__.
+    '''
+
+    # 1. Given.
+    post = Post(
+        1,
+        'https://stackoverflow.com/q/1',
+        'Title',
+        2,
+        [Segment(TEXT, 'Question')],
+        [Segment(CODE, 'print(1)')]
+    )
+
+    # 2. When.
+    with pytest.raises(AttributeError):
+        post.extra = None
+
+    # 3. Then.
+    assert not hasattr(post, '__dict__')
+    assert not hasattr(post.question[0], '__dict__')
+    assert isinstance(post.question, tuple)
+    assert isinstance(post.answer, tuple)
+
+
+def test_segment_equality():
+    '''
+    Ensures that segments are equal when their kind and content are.
+    '''
+
+    # 1. Given.
+    segment = Segment(CODE, 'print(1)')
+
+    # 2. When.
+    equal = segment == Segment(CODE, 'print(1)')
+    not_equal = segment == Segment(TEXT, 'print(1)')
+
+    # 3. Then.
+    assert equal
+    assert not not_equal
@@ -7,64 +7,349 @@ scrape Stack Overflow for posts with accepted answers for a given query.
 '''
 
 from __future__ import absolute_import, division, print_function
-from bs4 import BeautifulSoup
-import pygments
-from pygments.lexers import PythonLexer  # pylint: disable=no-name-in-module
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from email.message import Message
+from itertools import chain
+import shutil
+import sys
+from urllib.parse import quote_plus, urljoin
+
+from bs4 import BeautifulSoup, NavigableString
+from lxml import etree
+import lxml.html
 import requests
+from requests.adapters import HTTPAdapter
 from termcolor import colored
 
+from autostack.highlight import highlight
+from autostack.post import (
+    CODE,
+    LIST,
+    QUOTE,
+    TEXT,
+    Post,
+    Segment,
+)
+
 BASE_URL = 'https://stackoverflow.com'
 
+# Matches the question's header, the question, and the accepted answer,
+# on a post's page.
+POST_XPATH = etree.XPath(
+    "//div[@id='question-header'] | "
+    "//div[@id='question'] | "
+    "//div[contains(concat(' ', normalize-space(@class), ' '), "
+    "' accepted-answer ')]"
+)
+
+# The kinds of segments elements of post-text become.
+ELEMENT_SEGMENTS = {
+    'h1': TEXT,
+    'h2': TEXT,
+    'h3': TEXT,
+    'p': TEXT,
+    'blockquote': QUOTE,
+}
+
+# The colors TEXT and QUOTE segments are printed in.
+SEGMENT_COLORS = {
+    TEXT: 'white',
+    QUOTE: 'yellow',
+}
+
+# The rule printed around questions and answers.
+RULE = colored('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~', 'red')
+
+# The name of the colors posts are rendered in. It's part of the key
+# rendered posts are cached under, so it must change with the colors.
+THEME = 'default'
+
+# The number of rendered posts kept in memory.
+RENDER_CACHE_SIZE = 64
+
+# Connections kept alive per host, and the (connect, read) timeouts,
+# in seconds, of the default session.
+POOL_SIZE = 10
+TIMEOUT = (3.05, 10)
+
+# The size, in bytes, of the chunks pages of search results are
+# streamed in.
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# The number of posts scrape_accepted_posts has left, at most, before it
+# fetches the next page of search results.
+PREFETCH_COUNT = 3
+
+# The session requests are made with, see set_session.
+_SESSION = None
+
+# The cache requests go through, see set_cache.
+_CACHE = None
+
+# Rendered posts, by render_key, least recently used first.
+_RENDERED = OrderedDict()
+
+
+class PooledSession(requests.Session):
+    '''
+    A requests.Session that keeps a pool of connections alive per host,
+    and applies a default timeout to every request.
+    '''
+
+    def __init__(self, pool_size=POOL_SIZE, timeout=TIMEOUT):
+        '''
+        Initializes a pooled session.
+
+        Parameter {int} pool_size: the number of connections to keep
+        alive per host.
+        Parameter {tuple} timeout: the default (connect, read) timeouts
+        of requests, in seconds.
+        '''
+
+        super().__init__()
+
+        self.timeout = timeout
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
+        )
+
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        # pylint: disable=arguments-differ
+        '''
+        Makes a request, with the session's timeout, unless a timeout
+        is given.
+        '''
+
+        kwargs.setdefault('timeout', self.timeout)
+
+        return super().request(method, url, *args, **kwargs)
+
+
+def get_session():
+    '''
+    Returns the session requests are made with, creating a
+    PooledSession the first time it's called.
+
+    Returns {requests.Session}: the session.
+    '''
+
+    global _SESSION  # pylint: disable=global-statement
+
+    if _SESSION is None:
+        _SESSION = PooledSession()
+
+    return _SESSION
+
 
-def accepted_posts(query):
+def set_session(session):
     '''
-    A generator that queries Stack Overflow and yields posts with
+    Sets the session requests are made with.
+
+    Parameter {requests.Session} session: the session, or None to use
+    a default PooledSession.
+    '''
+
+    global _SESSION  # pylint: disable=global-statement
+    _SESSION = session
+
+
+def get_cache():
+    '''
+    Returns {autostack.cache.DiskCache}: the cache requests go through,
+    or None, if requests aren't cached.
+    '''
+
+    return _CACHE
+
+
+def set_cache(cache):
+    '''
+    Sets the cache requests go through. Any object with get and set
+    methods, like autostack.cache.DiskCache, can be used.
+
+    Parameter {autostack.cache.DiskCache} cache: the cache, or None to
+    stop caching requests.
+    '''
+
+    global _CACHE  # pylint: disable=global-statement
+    _CACHE = cache
+
+
+def scrape_accepted_posts(query, prefetch=PREFETCH_COUNT, stream=True):
+    '''
+    A generator that scrapes Stack Overflow and yields posts with
     accepted answers.
 
+    Post summaries without an accepted answer are skipped, and the
+    accepted posts of each page of search results are fetched as one
+    concurrent batch, in a thread pool. Posts are still yielded in
+    order of relevance, and once only a few are left, the next page of
+    search results is fetched in the background. When streaming, each
+    accepted post starts being fetched as soon as its summary has been
+    downloaded, while the rest of the search results are still
+    arriving. Closing the generator cancels the fetches that haven't
+    started.
+
     Parameter {str} query: the string to query Stack Overflow with.
-    Yields {bs4.BeautifulSoup}: accepted posts html documents.
+    Parameter {int} prefetch: the number of posts left, at most,
+    before the next page of search results is fetched.
+    Parameter {bool} stream: whether to stream pages of search results.
+    Yields {autostack.post.Post}: accepted posts.
     '''
 
-    for result_set in get_post_summaries(query):
-        for post_summary in result_set:
-            post = post_soup(post_summary)
+    pages = iter(get_post_summaries(query, stream))
+    next_page = None
+    has_next_page = True
+    executor = ThreadPoolExecutor(max_workers=POOL_SIZE)
+    pending = deque()
+
+    try:
+        while pending or has_next_page:
+            if next_page is None and has_next_page and \
+                    len(pending) <= prefetch:
+                next_page = executor.submit(
+                    submit_accepted_posts,
+                    pages,
+                    executor
+                )
+
+            # Only wait on the next page when there's nothing to yield.
+            if next_page is not None and \
+                    (not pending or next_page.done()):
+                futures = next_page.result()
+                next_page = None
+
+                if futures is None:
+                    has_next_page = False
+                else:
+                    pending.extend(futures)
+
+                continue
+
+            post = pending.popleft().result()
 
             if post:
                 yield post
+    finally:
+        if next_page is not None:
+            next_page.add_done_callback(cancel_accepted_posts)
+            next_page.cancel()
+
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+
+def submit_accepted_posts(pages, executor):
+    '''
+    Gets the next page of post summaries, and submits a fetch of each
+    post with an accepted answer, as soon as its summary is available.
+
+    The whole page is consumed in the calling thread, since a streamed
+    page's parser can't be shared between threads.
+
+    Parameter {iterator} pages: the pages of post summaries, from
+    get_post_summaries.
+    Parameter {concurrent.futures.Executor} executor: the executor to
+    fetch posts with.
+    Returns {list}: the futures of the posts, in order of relevance, or
+    None, if there are no more pages.
+    '''
+
+    result_set = next(pages, None)
+
+    if result_set is None:
+        return None
 
+    return [
+        executor.submit(get_post, post_summary)
+        for post_summary in result_set
+        if has_accepted_answer(post_summary)
+    ]
 
-def get_post_summaries(query):
+
+def cancel_accepted_posts(page):
+    '''
+    Cancels the fetches of a page's posts, from submit_accepted_posts,
+    that haven't started.
+
+    Parameter {concurrent.futures.Future} page: the future of the page.
+    '''
+
+    if page.cancelled() or page.exception() is not None:
+        return
+
+    for future in page.result() or []:
+        future.cancel()
+
+
+def get_post_summaries(query, stream=False):
     '''
     A generator that queries Stack Overflow and yields a ResultSet
     of post summaries.
 
+    When streaming, each page is yielded as soon as its first post
+    summary has been downloaded, as an iterator that yields the rest
+    of the page's post summaries as they arrive. Each page has to be
+    consumed before the next one is requested.
+
     Parameter {str} query: the string to query Stack Overflow with.
-    Yields {bs4.element.ResultSet}: ResultSet of post summaries.
+    Parameter {bool} stream: whether to stream each page.
+    Yields {bs4.element.ResultSet}: ResultSet of post summaries, or an
+    iterator of post summaries, when streaming.
     '''
 
     page = 1
 
     while True:
         query_url = build_query_url(query, page)
-        query_soup = query_stack_overflow(query_url)
 
-        if not query_soup:
-            break
+        if stream:
+            post_summaries = stream_post_summaries(query_url)
+            first_post_summary = next(post_summaries, None)
 
-        post_summaries = query_soup.find_all(
-            attrs={
-                'class': 'question-summary'
-            }
-        )
+            if first_post_summary is None:
+                break
 
-        if not post_summaries:
-            break
+            yield chain([first_post_summary], post_summaries)
+        else:
+            query_soup = query_stack_overflow(query_url)
 
-        yield post_summaries
+            if not query_soup:
+                break
+
+            post_summaries = find_post_summaries(query_soup)
+
+            if not post_summaries:
+                break
+
+            yield post_summaries
 
         page += 1
 
 
+def find_post_summaries(query_soup):
+    '''
+    Finds the post summaries on a page of search results.
+
+    Parameter {bs4.BeautifulSoup} query_soup: the search results.
+    Returns {bs4.element.ResultSet}: ResultSet of post summaries.
+    '''
+
+    return query_soup.find_all(
+        attrs={
+            'class': 'question-summary'
+        }
+    )
+
+
 def build_query_url(query, page):
     '''
     Builds a URL to query Stack Overflow with.
@@ -72,6 +357,9 @@ def build_query_url(query, page):
     e.g. query == 'Test Query' and page == 1 then the url will be:
     https://stackoverflow.com/search?page=1&tab=Relevance&q=%5Bpython%5D+Test+Query
 
+    Words of the query are URL encoded, since queries built from
+    error messages may contain e.g. '&', or '#'.
+
     Parameter {str} query: the string to query Stack Overflow with.
     Parameter {int} page: the page to select in the query.
     '''
@@ -81,8 +369,8 @@ def build_query_url(query, page):
         page
     )
 
-    for query_string in query.split(' '):
-        query_url = '{}+{}'.format(query_url, query_string)
+    for query_string in query.split():
+        query_url = '{}+{}'.format(query_url, quote_plus(query_string))
 
     return query_url
 
@@ -96,35 +384,197 @@ def query_stack_overflow(url):
     Returns {bs4.BeautifulSoup}: the BeautifulSoup of the request.
     '''
 
+    return parse_search_page(fetch(url))
+
+
+def stream_post_summaries(url):
+    '''
+    A generator that requests a page of search results, and yields
+    each post summary as soon as it has been downloaded, by feeding the
+    response into an incremental parser. Once the whole page has been
+    downloaded, it's stored in the cache, if one is set.
+
+    Parameter {str} url: the url of the page of search results.
+    Yields {bs4.Tag}: the post summaries, until the request fails, if
+    it does.
+    '''
+
+    cache = get_cache()
+    html = cache.get(url) if cache is not None else None
+
+    if html is not None:
+        parser = etree.HTMLPullParser(events=('end',), tag='div')
+        parser.feed(html)
+        parser.close()
+        yield from read_post_summaries(parser)
+        return
+
     try:
-        response = requests.get(url)
+        response = get_session().get(url, stream=True)
         response.raise_for_status()
-    except requests.exceptions.HTTPError:
+    except requests.exceptions.RequestException:
+        return
+
+    # The response is fed as bytes, which lxml would otherwise decode
+    # as Latin-1, unless the page declares its charset.
+    response.encoding = get_charset(response)
+    parser = etree.HTMLPullParser(
+        events=('end',),
+        tag='div',
+        encoding=response.encoding
+    )
+    chunks = []
+
+    with closing(response):
+        try:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                parser.feed(chunk)
+                yield from read_post_summaries(parser)
+        except requests.exceptions.RequestException:
+            # The download broke off, so the page is incomplete, and
+            # isn't cached.
+            return
+
+    parser.close()
+    yield from read_post_summaries(parser)
+
+    if cache is not None:
+        cache.set(
+            url,
+            b''.join(chunks).decode(response.encoding, 'replace')
+        )
+
+
+def read_post_summaries(parser):
+    '''
+    A generator that yields the post summaries an incremental parser
+    has finished parsing. Each one is cleared from the parser's tree
+    once it's yielded, so a page's tree doesn't build up in memory.
+
+    Parameter {lxml.etree.HTMLPullParser} parser: the parser, which
+    reports the end of div elements.
+    Yields {bs4.Tag}: the post summaries.
+    '''
+
+    for _, element in parser.read_events():
+        if 'question-summary' not in element.get('class', '').split():
+            continue
+
+        yield BeautifulSoup(
+            lxml.html.tostring(element, with_tail=False),
+            'lxml'
+        ).find(attrs={'class': 'question-summary'})
+
+        element.clear()
+
+
+def parse_search_page(html):
+    '''
+    Parses a page of search results.
+
+    Parameter {str} html: the html of the page, or None.
+    Returns {bs4.BeautifulSoup}: the BeautifulSoup of the page, or None,
+    if there's no html.
+    '''
+
+    if html is None:
         return None
 
-    return BeautifulSoup(response.text, 'lxml')
+    return BeautifulSoup(html, 'lxml')
 
 
-def post_soup(post_summary):
+def parse_post_page(html):
     '''
-    Given a post summary, query Stack Overflow, and return the
-    BeautifulSoup of the post, if it has an accepted answer.
+    Parses the question, and accepted answer, of a post's page.
+
+    The page is parsed with lxml, which is much faster than bs4, and
+    only the question and accepted answer are handed to BeautifulSoup,
+    instead of the whole page (sidebar, comments, related questions).
+
+    Parameter {str} html: the html of the page, or None.
+    Returns {autostack.post.Post}: the post, or None, if there's no
+    html, or the page doesn't have a question and accepted answer.
+    '''
+
+    if not html:
+        return None
+
+    try:
+        page = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+    return parse_post(BeautifulSoup(
+        b''.join(lxml.html.tostring(div) for div in POST_XPATH(page)),
+        'lxml'
+    ))
+
+
+def fetch(url):
+    '''
+    Requests a url, and returns the text of the response. If a cache
+    is set, the response is read from the cache when possible, and
+    stored in the cache otherwise.
+
+    Parameter {str} url: the url to request.
+    Returns {str}: the text of the response, or None, if the request
+    failed, timed out, or couldn't connect.
+    '''
+
+    cache = get_cache()
+
+    if cache is not None:
+        text = cache.get(url)
+
+        if text is not None:
+            return text
+
+    try:
+        response = get_session().get(url)
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        return None
+
+    response.encoding = get_charset(response)
+
+    if cache is not None:
+        cache.set(url, response.text)
+
+    return response.text
+
+
+def get_charset(response):
+    '''
+    Gets the charset a response's Content-Type declares, or UTF-8, the
+    charset of Stack Overflow's pages, and of JSON, if it declares none.
+    requests' own response.encoding is ISO-8859-1 for any text/html
+    response without a charset.
+
+    Parameter {requests.Response} response: the response.
+    Returns {str}: the charset.
+    '''
+
+    message = Message()
+    message['Content-Type'] = response.headers.get('Content-Type', '')
+
+    return message.get_content_charset() or 'utf-8'
+
+
+def get_post(post_summary):
+    '''
+    Given a post summary, query Stack Overflow, and return the post,
+    if it has an accepted answer.
 
     Parameter {bs4.Tag} post_summary: the bs4.Tag post summary.
-    Parameter {bs4.BeautifulSoup}: the BeautifulSoup of the post,
-    if it has an accepted answer; otherwise, None.
+    Returns {autostack.post.Post}: the post, if it has an accepted
+    answer; otherwise, None.
     '''
 
     if has_accepted_answer(post_summary):
         post_url = get_post_url(post_summary)
 
-        try:
-            response = requests.get(BASE_URL + post_url)
-            response.raise_for_status()
-        except requests.exceptions.HTTPError:
-            return None
-
-        return BeautifulSoup(response.text, 'lxml')
+        return parse_post_page(fetch(BASE_URL + post_url))
 
     return None
 
@@ -171,33 +621,215 @@ def get_post_url(post_summary):
         return None
 
 
-def print_accepted_post(post):
+def parse_post(post):
     '''
-    Prints a Stack Overflow post with an accepted answer.
+    Builds a Post from the BeautifulSoup of a post's question and
+    accepted answer.
 
-    Parameter {bs4.BeautifulSoup} post: The 'soup' of the post
-    to print.
+    Parameter {bs4.BeautifulSoup} post: the post to parse.
+    Returns {autostack.post.Post}: the post, or None, if the question
+    or accepted answer couldn't be found.
     '''
 
     question = get_post_text(post, 'question')
     accepted_answer = get_post_text(post, 'accepted-answer')
 
     if question is None or accepted_answer is None:
-        return
+        return None
+
+    question_div = post.find(id='question')
+    title_link = post.find(
+        attrs={
+            'class': 'question-hyperlink'
+        },
+        href=True
+    )
+
+    try:
+        post_id = int(question_div['data-questionid'])
+    except (KeyError, TypeError, ValueError):
+        post_id = None
+
+    return Post(
+        post_id=post_id,
+        url=urljoin(BASE_URL, title_link['href']) if title_link else None,
+        title=title_link.text if title_link else '',
+        score=get_post_score(question_div),
+        question=parse_post_text(question),
+        answer=parse_post_text(accepted_answer),
+        tags=[
+            tag.text
+            for tag in (question_div or post).find_all(
+                attrs={'class': 'post-tag'}
+            )
+        ]
+    )
+
+
+def get_post_score(post_div):
+    '''
+    Given a question or answer, this function returns its score.
+
+    Parameter {bs4.Tag} post_div: the question or answer.
+    Returns {int}: the score, or None, if it couldn't be found.
+    '''
+
+    try:
+        return int(post_div.find(
+            attrs={
+                'itemprop': 'upvoteCount'
+            }
+        )['data-value'])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def parse_post_text(post_text):
+    '''
+    Splits post-text from Stack Overflow into segments.
+
+    On Stack Overflow, a div with a class of 'post-text'
+    indicates that the div is either a question or an answer.
+
+    Headers and paragraphs become TEXT segments, quotes become QUOTE
+    segments, unordered lists become LIST segments, and code becomes
+    CODE segments. Anything else is skipped.
+
+    Parameter {bs4.Tag} post_text: HTML 'div' element from a Stack Overflow
+    post with class of 'post-text.'
+    Returns {tuple}: the post-text's segments.
+    '''
+
+    segments = []
+
+    for element in post_text:
+        if element.name in ELEMENT_SEGMENTS:
+            segments.append(
+                Segment(ELEMENT_SEGMENTS[element.name], element.text)
+            )
+        elif element.name == 'ul':  # Lists.
+            segments.append(Segment(LIST, tuple(
+                item.text for item in element.find_all('li')
+            )))
+        elif element.name == 'pre':  # Code.
+            segments.append(Segment(
+                CODE,
+                get_src_code(element.find('code') or element)
+            ))
+
+    return tuple(segments)
+
+
+def print_accepted_post(post):
+    '''
+    Prints a Stack Overflow post with an accepted answer.
+
+    Posts are rendered once, and then written with a single write
+    whenever they're shown again.
 
-    print(colored('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~', 'red'))
-    print(colored('Question:', 'red'))
+    Parameter {autostack.post.Post} post: the post to print.
+    '''
+
+    write(render_accepted_post(post))
+
+
+def render_accepted_post(post, width=None):
+    '''
+    Renders a Stack Overflow post with an accepted answer, as it's
+    printed in the terminal.
+
+    Rendered posts are kept in memory, and in the scraper's cache, if
+    one is set, by render_key.
+
+    Parameter {autostack.post.Post} post: the post to render.
+    Parameter {int} width: the width, in columns, of the terminal the
+    post is printed in, or None for this process's terminal.
+    Returns {str}: the post, with ANSI color codes.
+    '''
+
+    key = render_key(post, width)
+    rendered = _RENDERED.get(key)
+
+    if rendered is not None:
+        _RENDERED.move_to_end(key)
+
+        return rendered
+
+    cache = get_cache()
+
+    if cache is not None:
+        rendered = cache.get(key)
+
+    if rendered is None:
+        rendered = ''.join(render_post(post))
+
+        if cache is not None:
+            cache.set(key, rendered)
+
+    _RENDERED[key] = rendered
+
+    if len(_RENDERED) > RENDER_CACHE_SIZE:
+        _RENDERED.popitem(last=False)
+
+    return rendered
+
+
+def render_key(post, width=None):
+    '''
+    Builds the key a rendered post is cached under, from the post's id
+    and revision, the width of the terminal, and the theme.
+
+    Parameter {autostack.post.Post} post: the post.
+    Parameter {int} width: the width, in columns, of the terminal the
+    post is printed in, or None for this process's terminal.
+    Returns {str}: the key.
+    '''
+
+    if width is None:
+        width = shutil.get_terminal_size().columns
+
+    return 'render:{}:{}:{}:{}'.format(
+        post.post_id,
+        post.revision,
+        width,
+        THEME
+    )
+
+
+def render_post(post):
+    '''
+    A generator that renders a Stack Overflow post with an accepted
+    answer, without going through the rendered posts.
+
+    Parameter {autostack.post.Post} post: the post to render.
+    Yields {str}: chunks of the post, with ANSI color codes.
+    '''
+
+    yield RULE + '\n'
+    yield colored('Question:', 'red') + '\n'
+
+    # Render the question.
+    yield from render_post_text(post.question)
 
-    # Print the question.
-    print_post_text(question)
+    yield RULE + '\n'
+    yield colored('Answer:', 'red') + '\n'
 
-    print(colored('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~', 'red'))
-    print(colored('Answer:', 'red'))
+    # Render the answer.
+    yield from render_post_text(post.answer)
 
-    # Print the answer.
-    print_post_text(accepted_answer)
+    yield RULE + '\n'
 
-    print(colored('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~', 'red'))
+
+def write(chunks):
+    '''
+    Writes chunks of output to stdout, with a single write, and
+    flushes it.
+
+    Parameter {iterable} chunks: the chunks, or a string.
+    '''
+
+    sys.stdout.write(''.join(chunks))
+    sys.stdout.flush()
 
 
 def get_post_text(post, html_class):
@@ -229,102 +861,87 @@ def get_post_text(post, html_class):
         return None
 
 
-def print_post_text(post_text):
+def print_post_text(segments):
     '''
-    Prints post-text from Stack Overflow.
+    Prints the segments of a question or answer, with a single write.
 
-    On Stack Overflow, a div with a class of 'post-text'
-    indicates that the div is either a question or an answer.
+    Parameter {tuple} segments: the question's or answer's segments.
+    '''
+
+    write(render_post_text(segments))
 
-    Different elements of the post-text are printed in different
-    colors.
 
-    Headers: White.
+def render_post_text(segments):
+    '''
+    A generator that renders the segments of a question or answer.
+
+    Different segments are rendered in different colors.
+
     Text: White.
     Quotes: Yellow.
-    Lists: Syntax Highlighted in print_ul.
-    Code: Syntax Highlighted in print_code_block.
+    Lists: Syntax Highlighted in render_ul.
+    Code: Syntax Highlighted in render_code_block.
 
-    Parameter {bs4.Tag} post_text: HTML 'div' element from a Stack Overflow
-    post with class of 'post-text.'
+    Parameter {tuple} segments: the question's or answer's segments.
+    Yields {str}: chunks of the segments, with ANSI color codes.
     '''
 
-    element_colors = {
-        'h1': 'white',
-        'h2': 'white',
-        'h3': 'white',
-        'p': 'white',
-        'blockquote': 'yellow',
-    }
-
-    for element in post_text:
-        if element.name in element_colors.keys():
-            print(
-                colored(element.text, element_colors[element.name])
-            )
-        elif element.name == 'ul':  # Lists.
-            print_ul(element)
-        elif element.name == 'pre':  # Code.
-            print_code_block(element.find('code'))
+    for segment in segments:
+        if segment.kind in SEGMENT_COLORS:
+            yield colored(segment.content, SEGMENT_COLORS[segment.kind])
+            yield '\n'
+        elif segment.kind == LIST:
+            yield from render_ul(segment.content)
+        elif segment.kind == CODE:
+            yield from render_code_block(segment.content)
 
 
-def print_ul(ul_element):
+def print_ul(items):
     '''
-    Prints an unordered list.
+    Prints an unordered list, with a single write.
 
-    Parameter {bs4.Tag} ul_element: the unordered list to print.
+    Parameter {tuple} items: the text of each item of the list.
     '''
 
-    for item in ul_element.find_all('li'):
-        print(
-            colored('    - ' + item.text, 'green', attrs=['bold'])
-        )
+    write(render_ul(items))
+
 
+def render_ul(items):
+    '''
+    A generator that renders an unordered list.
 
-def print_code_block(code_block):
+    Parameter {tuple} items: the text of each item of the list.
+    Yields {str}: chunks of the list, with ANSI color codes.
     '''
-    Prints a code block from Stack Overflow with syntax highlighting.
 
-    On Stack Overflow, the code in a HTML 'code' element contains
-    a 'span' element for each token. Because of this, it's necessary
-    to grab each of the 'code' element's 'span' elements' values to get
-    the actual code.
+    for item in items:
+        yield colored('    - ' + item, 'green', attrs=['bold'])
+        yield '\n'
+
 
-    Parameter {bs4.Tag} code_block: 'soup' of a HTML
-    'code' element from a Stack Overflow post.
+def print_code_block(code):
     '''
+    Prints a code block from Stack Overflow with syntax highlighting,
+    with a single write.
 
-    token_colors = {
-        'Token.Keyword': 'blue',
-        'Token.Name.Builtin.Pseudo': 'blue',
-        'Token.Literal.Number.Integer': 'green',
-        'Token.Literal.Number.Float': 'green',
-        'Token.Comment.Single': 'green',
-        'Token.Comment.Hashbang': 'green',
-        'Token.Literal.String.Single': 'yellow',
-        'Token.Literal.String.Double': 'yellow',
-        'Token.Literal.String.Doc': 'yellow'
-    }
+    Parameter {str} code: the source code of the code block.
+    '''
 
-    print('')
+    write(render_code_block(code))
 
-    # Store the code's text.
-    code = get_src_code(code_block)
 
-    # Loop over code, and highlight.
-    for token, content in pygments.lex(code, PythonLexer()):
-        try:
-            print(
-                colored(content, token_colors[str(token)]),
-                end=''
-            )
-        except KeyError:
-            print(
-                content,
-                end=''
-            )
+def render_code_block(code):
+    '''
+    A generator that renders a code block from Stack Overflow with
+    syntax highlighting.
+
+    Parameter {str} code: the source code of the code block.
+    Yields {str}: chunks of the code block, with ANSI color codes.
+    '''
 
-    print('')
+    yield '\n'
+    yield from highlight(code)
+    yield '\n'
 
 
 def get_src_code(code_block):
@@ -332,17 +949,25 @@ def get_src_code(code_block):
     Loops over a code block and grabs the 'source code'
     (i.e. text).
 
+    Nested spans are walked with a stack, instead of recursion, and
+    the text is joined once, so big code blocks take linear time.
+
     Parameter {bs4.Tag} code_block: the source code (or text).
     Returns {str}: the source code (or text).
     '''
 
-    code = ''
-
-    # Loop through code spans.
-    for token in code_block:
-        try:  # bs4.NavigableString
-            code += token
-        except TypeError:  # bs4.Tag
-            code += get_src_code(token.contents)
-
-    return code
+    fragments = []
+    stack = [iter(code_block)]
+
+    while stack:
+        # Loop through code spans.
+        for token in stack[-1]:
+            if isinstance(token, NavigableString):
+                fragments.append(token)
+            else:  # bs4.Tag
+                stack.append(iter(token.contents))
+                break
+        else:
+            stack.pop()
+
+    return ''.join(fragments)
@@ -21,6 +21,8 @@ class MockResponse:
 
         self.text = open(path_to_html).read()
         self.status = status
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        self.encoding = None
 
     def raise_for_status(self):
         '''
@@ -51,7 +53,7 @@ def build_mock_get(mock_response):
     Builds a mock requests get method.
     '''
 
-    def mock_get(*args):
+    def mock_get(*args, **kwargs):
         # pylint: disable=unused-argument
         '''
         Mocks requests get method.
@@ -63,3 +65,44 @@ def build_mock_get(mock_response):
         return mock_response
 
     return mock_get
+
+
+class MockStreamResponse(MockResponse):
+    '''
+    A mock streamed requests Response object, which counts the chunks
+    that have been read.
+    '''
+
+    def __init__(self, path_to_html, status, chunk_size):
+        '''
+        Initializes a mock streamed response with html text, a HTTP
+        status, and the size of its chunks.
+        '''
+
+        super().__init__(path_to_html, status)
+
+        content = self.text.encode('utf-8')
+
+        self.chunks = [
+            content[i:i + chunk_size]
+            for i in range(0, len(content), chunk_size)
+        ]
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, *args):
+        # pylint: disable=unused-argument
+        '''
+        Yields the response's chunks.
+        '''
+
+        for chunk in self.chunks:
+            self.chunks_read += 1
+            yield chunk
+
+    def close(self):
+        '''
+        Closes the response.
+        '''
+
+        self.closed = True
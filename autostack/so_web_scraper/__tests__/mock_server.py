@@ -0,0 +1,181 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: A local stand-in for Stack Overflow, served over HTTP.
+'''
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+import threading
+import time
+
+from bs4 import BeautifulSoup
+
+from autostack.so_web_scraper import (
+    build_query_url,
+    find_post_summaries,
+    get_post_url,
+    has_accepted_answer,
+)
+
+DATA = 'autostack/so_web_scraper/__tests__/data/'
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    '''
+    A HTTP server that handles each connection in its own thread.
+    '''
+
+    daemon_threads = True
+
+
+class MockServer:
+    '''
+    A local HTTP server that responds to GET requests from a
+    dictionary of routes. Use it as a context manager.
+    '''
+
+    def __init__(self, routes, connection_latency=0, stall=0, headers=None):
+        '''
+        Initializes a mock server.
+
+        Parameter {dict} routes: maps a path (including the query
+        string) to a (status, body) tuple. Unknown paths respond 404.
+        Parameter {float} connection_latency: seconds to wait before
+        serving a new connection, standing in for TCP and TLS
+        handshakes.
+        Parameter {float} stall: seconds to wait between sending the
+        headers of a response, and its body, standing in for a slow
+        server.
+        Parameter {dict} headers: headers sent with every response, in
+        addition to Content-Length.
+        '''
+
+        self.routes = routes
+        self.connection_latency = connection_latency
+        self.stall = stall
+        self.headers = headers or {}
+        self.connection_count = 0
+        self.request_paths = []
+        self.url = None
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        '''
+        Starts serving on a free port.
+        '''
+
+        mock_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            '''
+            Serves the mock server's routes, keeping connections alive.
+            '''
+
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                '''
+                Counts, and delays, each new connection.
+                '''
+
+                mock_server.connection_count += 1
+                time.sleep(mock_server.connection_latency)
+                BaseHTTPRequestHandler.setup(self)
+
+            def do_GET(self):
+                # pylint: disable=invalid-name
+                '''
+                Responds with the route for the requested path.
+                '''
+
+                mock_server.request_paths.append(self.path)
+                status, body = mock_server.routes.get(
+                    self.path,
+                    (404, '')
+                )
+
+                if isinstance(body, str):
+                    body = body.encode('utf-8')
+
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+
+                for name, value in mock_server.headers.items():
+                    self.send_header(name, value)
+
+                self.end_headers()
+                self.wfile.flush()
+                time.sleep(mock_server.stall)
+
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up waiting.
+                    self.close_connection = True
+
+            def log_message(self, *args):
+                # pylint: disable=arguments-differ
+                '''
+                Silences request logging.
+                '''
+
+                return
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = 'http://127.0.0.1:{}'.format(self._server.server_port)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            args=(0.05,)
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def __exit__(self, *args):
+        '''
+        Stops serving.
+        '''
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+# A post page, with its path as the question.
+POST_HTML = (
+    '<div class="question" id="question">'
+    '<div class="post-text"><p>{}</p></div>'
+    '</div>'
+    '<div class="answer accepted-answer">'
+    '<div class="post-text"><p>Answer</p></div>'
+    '</div>'
+)
+
+
+def build_scraper_routes(query):
+    '''
+    Builds mock server routes for one page of search results, and a
+    post page, with its path as the question, for each accepted post.
+
+    Parameter {str} query: the query the search results are for.
+    Returns {tuple}: the routes, and the expected post paths in order.
+    '''
+
+    html = open(DATA + 'query_post_summaries.html').read()
+    post_paths = [
+        get_post_url(post_summary).split('#')[0]
+        for post_summary in find_post_summaries(BeautifulSoup(html, 'lxml'))
+        if has_accepted_answer(post_summary)
+    ]
+    routes = {
+        path: (200, POST_HTML.format(path))
+        for path in post_paths
+    }
+    routes[build_query_url(query, 1).split('.com')[1]] = (200, html)
+
+    return routes, post_paths
@@ -0,0 +1,353 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the so_web_scraper.aio module.
+'''
+
+import asyncio
+import threading
+
+import pytest
+from bs4 import BeautifulSoup
+
+from autostack.index import PostIndex
+from autostack.post import TEXT, Post, Segment
+from autostack.so_web_scraper import (
+    find_post_summaries,
+    set_cache,
+)
+from autostack.so_web_scraper.backends import (
+    set_backend,
+    set_index,
+)
+from autostack.so_web_scraper.__tests__.mock_server import (
+    DATA,
+    MockServer,
+    build_scraper_routes,
+)
+
+aio = pytest.importorskip('autostack.so_web_scraper.aio')
+
+
+def run(coroutine):
+    '''
+    Runs a coroutine in a new event loop.
+    '''
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def use_mock_server(monkeypatch, server):
+    '''
+    Points the scraper at a mock server.
+    '''
+
+    monkeypatch.setattr('autostack.so_web_scraper.BASE_URL', server.url)
+    monkeypatch.setattr('autostack.so_web_scraper.aio.BASE_URL', server.url)
+
+
+async def collect_posts(query):
+    '''
+    Collects the question of every accepted post for a query.
+    '''
+
+    async with aio.create_session() as session:
+        return [
+            post.question[0].content
+            async for post in aio.accepted_posts(session, query)
+        ]
+
+
+class MockCache:
+    '''
+    Mocks a cache with a dictionary, recording the threads it's used
+    from.
+    '''
+
+    def __init__(self):
+        '''
+        Initializes an empty mock cache.
+        '''
+
+        self.entries = {}
+        self.threads = set()
+
+    def get(self, key):
+        '''
+        Returns the entry for a key, or None.
+        '''
+
+        self.threads.add(threading.get_ident())
+
+        return self.entries.get(key)
+
+    def set(self, key, value):
+        '''
+        Stores an entry for a key.
+        '''
+
+        self.threads.add(threading.get_ident())
+        self.entries[key] = value
+
+
+class MockIndex:
+    '''
+    Mocks an index with a list of posts, recording the threads it's
+    used from.
+    '''
+
+    def __init__(self, posts):
+        '''
+        Initializes a mock index with posts.
+        '''
+
+        self.posts = list(posts)
+        self.threads = set()
+
+    def search(self, query):
+        # pylint: disable=unused-argument
+        '''
+        Returns every post.
+        '''
+
+        self.threads.add(threading.get_ident())
+
+        return list(self.posts)
+
+    def add(self, post):
+        '''
+        Adds a post.
+        '''
+
+        self.threads.add(threading.get_ident())
+        self.posts.append(post)
+
+
+def test_accepted_posts(monkeypatch):
+    '''
+    Ensures that accepted posts are yielded in order, until there are
+    no more pages of search results.
+    '''
+
+    # 1. Given.
+    routes, post_paths = build_scraper_routes('IndexError')
+
+    # 2. When.
+    with MockServer(routes) as server:
+        use_mock_server(monkeypatch, server)
+        posts = run(collect_posts('IndexError'))
+
+    # 3. Then.
+    assert len(post_paths) == 6
+    assert posts == post_paths
+
+
+def test_accepted_posts_concurrent_queries(monkeypatch):
+    '''
+    Ensures that one session can service several queries at once.
+    '''
+
+    # 1. Given.
+    routes, post_paths = build_scraper_routes('IndexError')
+
+    async def first_post(session):
+        '''
+        Gets the question of the first accepted post, then closes the
+        generator.
+        '''
+
+        posts = aio.accepted_posts(session, 'IndexError')
+
+        try:
+            return (await posts.__anext__()).question[0].content
+        finally:
+            await posts.aclose()
+
+    async def query_concurrently():
+        '''
+        Gets the first post of three queries concurrently.
+        '''
+
+        async with aio.create_session() as session:
+            return await asyncio.gather(
+                *[first_post(session) for _ in range(3)]
+            )
+
+    # 2. When.
+    with MockServer(routes, connection_latency=0.05) as server:
+        use_mock_server(monkeypatch, server)
+        posts = run(query_concurrently())
+
+    # 3. Then.
+    assert posts == [post_paths[0]] * 3
+
+
+def test_accepted_posts_cache_off_loop(monkeypatch):
+    '''
+    Ensures that the cache is read, and written, outside of the event
+    loop's thread.
+    '''
+
+    # 1. Given.
+    routes, post_paths = build_scraper_routes('IndexError')
+    cache = MockCache()
+    set_cache(cache)
+
+    # 2. When.
+    try:
+        with MockServer(routes) as server:
+            use_mock_server(monkeypatch, server)
+            posts = run(collect_posts('IndexError'))
+            cached_posts = run(collect_posts('IndexError'))
+            request_count = len(server.request_paths)
+    finally:
+        set_cache(None)
+
+    # 3. Then.
+    # The second page of search results isn't found, so isn't cached.
+    assert posts == cached_posts == post_paths
+    assert request_count == len(post_paths) + 3
+    assert threading.get_ident() not in cache.threads
+
+
+def test_accepted_posts_index(monkeypatch):
+    '''
+    Ensures that indexed posts are yielded first, and that fetched
+    posts are indexed, outside of the event loop's thread.
+    '''
+
+    # 1. Given.
+    routes, post_paths = build_scraper_routes('IndexError')
+    index = MockIndex([
+        Post(1, None, 'IndexError', 0, (Segment(TEXT, 'Indexed'),), ())
+    ])
+    set_index(index)
+
+    # 2. When.
+    try:
+        with MockServer(routes) as server:
+            use_mock_server(monkeypatch, server)
+            posts = run(collect_posts('IndexError'))
+    finally:
+        set_index(None)
+
+    # 3. Then.
+    assert posts == ['Indexed'] + post_paths
+    assert [post.question[0].content for post in index.posts] == posts
+    assert threading.get_ident() not in index.threads
+
+
+def test_accepted_posts_offline(monkeypatch):
+    '''
+    Ensures that the offline backend only searches the index.
+    '''
+
+    # 1. Given.
+    async def mock_fetch(*args):
+        # pylint: disable=unused-argument
+        '''
+        Fails, since nothing may be fetched.
+        '''
+
+        raise AssertionError('Fetched while offline.')
+
+    monkeypatch.setattr('autostack.so_web_scraper.aio.fetch', mock_fetch)
+    index = PostIndex(':memory:')
+    index.add(Post(1, None, 'IndexError', 0, (Segment(TEXT, 'Indexed'),), ()))
+    set_backend('offline')
+    set_index(index)
+
+    # 2. When.
+    try:
+        posts = run(collect_posts('IndexError'))
+    finally:
+        set_backend('html')
+        set_index(None)
+
+    # 3. Then.
+    assert posts == ['Indexed']
+
+
+def test_accepted_posts_api(monkeypatch):
+    '''
+    Ensures that the api backend's posts are gotten outside of the
+    event loop's thread.
+    '''
+
+    # 1. Given.
+    threads = []
+
+    def mock_accepted_posts(query):
+        '''
+        Mocks the api backend's accepted_posts function.
+        '''
+
+        threads.append(threading.get_ident())
+
+        yield Post(1, None, query, 0, (Segment(TEXT, 'From the API'),), ())
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.api.accepted_posts',
+        mock_accepted_posts
+    )
+    set_backend('api')
+
+    # 2. When.
+    try:
+        posts = run(collect_posts('IndexError'))
+    finally:
+        set_backend('html')
+
+    # 3. Then.
+    assert posts == ['From the API']
+    assert threading.get_ident() not in threads
+
+
+def test_get_post_no_accepted_answer():
+    '''
+    Ensures that None is returned, without a request, when there's no
+    accepted answer.
+    '''
+
+    # 1. Given.
+    html = open(DATA + 'query_post_summaries.html').read()
+    post_summary = find_post_summaries(BeautifulSoup(html, 'lxml'))[0]
+
+    # 2. When.
+    post = run(aio.get_post(None, post_summary))
+
+    # 3. Then.
+    assert post is None
+
+
+def test_fetch_bad_status():
+    '''
+    Ensures that None is returned when the request status is bad, or
+    the server stalls until the request times out.
+    '''
+
+    # 1. Given.
+    async def fetch(url):
+        '''
+        Fetches a url with a new session.
+        '''
+
+        async with aio.create_session(timeout=(1, 0.1)) as session:
+            return await aio.fetch(session, url)
+
+    # 2. When.
+    with MockServer({}) as server:
+        not_found = run(fetch(server.url + '/questions/1'))
+
+    with MockServer({'/': (200, 'Late')}, stall=0.5) as server:
+        stalled = run(fetch(server.url + '/'))
+
+    # 3. Then.
+    assert not_found is None
+    assert stalled is None
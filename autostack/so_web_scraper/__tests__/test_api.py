@@ -0,0 +1,197 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the so_web_scraper.api module, against a local
+stand-in for the Stack Exchange API.
+'''
+
+import json
+
+from autostack.so_web_scraper.api import (
+    build_answers_url,
+    build_post,
+    build_search_url,
+)
+from autostack.so_web_scraper.backends import (
+    accepted_posts,
+    set_backend,
+)
+from autostack.so_web_scraper.__tests__.mock_server import MockServer
+
+
+def route(server, url, body, status=200):
+    '''
+    Adds a route, for a url, to a mock server.
+    '''
+
+    server.routes[url[len(server.url):]] = (status, json.dumps(body))
+
+
+def question(question_id, answer_id=None):
+    '''
+    Builds a question, as returned by the API.
+    '''
+
+    item = {
+        'question_id': question_id,
+        'title': 'Question {}'.format(question_id),
+        'link': 'https://stackoverflow.com/q/{}'.format(question_id),
+        'body': '<p>Question {}</p>'.format(question_id),
+    }
+
+    if answer_id:
+        item['accepted_answer_id'] = answer_id
+
+    return item
+
+
+def answer(answer_id):
+    '''
+    Builds an answer, as returned by the API.
+    '''
+
+    return {
+        'answer_id': answer_id,
+        'is_accepted': True,
+        'body': '<p>Answer {}</p>'.format(answer_id),
+    }
+
+
+def collect_posts(query):
+    '''
+    Collects the question and answer text of every post, from the api
+    backend.
+    '''
+
+    set_backend('api')
+
+    try:
+        return [
+            (
+                post.question[0].content,
+                post.answer[0].content,
+            )
+            for post in accepted_posts(query)
+        ]
+    finally:
+        set_backend('html')
+
+
+def test_accepted_posts(monkeypatch):
+    '''
+    Ensures that posts are yielded in order of relevance, with two
+    requests per page, until there are no more pages.
+    '''
+
+    # 1. Given.
+    with MockServer({}) as server:
+        monkeypatch.setattr(
+            'autostack.so_web_scraper.api.API_URL',
+            server.url
+        )
+
+        route(server, build_search_url('NameError', 1), {
+            'items': [question(1, 11), question(2), question(3, 33)],
+            'has_more': True,
+        })
+        route(server, build_answers_url([11, 33]), {
+            'items': [answer(33), answer(11)],
+        })
+        route(server, build_search_url('NameError', 2), {
+            'items': [question(4, 44)],
+            'has_more': False,
+        })
+        route(server, build_answers_url([44]), {
+            'items': [answer(44)],
+        })
+
+        # 2. When.
+        posts = collect_posts('NameError')
+
+    # 3. Then.
+    assert posts == [
+        ('Question 1', 'Answer 11'),
+        ('Question 3', 'Answer 33'),
+        ('Question 4', 'Answer 44'),
+    ]
+    assert len(server.request_paths) == 4
+
+
+def test_accepted_posts_bad_status(monkeypatch):
+    '''
+    Ensures that nothing is yielded when the API responds with an
+    error, e.g. when the quota is exceeded.
+    '''
+
+    # 1. Given.
+    with MockServer({}) as server:
+        monkeypatch.setattr(
+            'autostack.so_web_scraper.api.API_URL',
+            server.url
+        )
+
+        route(server, build_search_url('NameError', 1), {
+            'error_id': 502,
+            'error_name': 'throttle_violation',
+        }, status=400)
+
+        # 2. When.
+        posts = collect_posts('NameError')
+
+    # 3. Then.
+    assert not posts
+
+
+def test_build_search_url():
+    '''
+    Ensures that searches are for python questions with accepted
+    answers, including their bodies.
+    '''
+
+    # 1. Given.
+    query = 'Test Query'
+
+    # 2. When.
+    url = build_search_url(query, 2)
+
+    # 3. Then.
+    assert url == (
+        'https://api.stackexchange.com/2.2/search/advanced?page=2' +
+        '&pagesize=15&order=desc&sort=relevance&accepted=True' +
+        '&tagged=python&q=Test+Query&site=stackoverflow&filter=withbody'
+    )
+
+
+def test_build_answers_url():
+    '''
+    Ensures that answers are requested in one batch.
+    '''
+
+    # 1. Given.
+    answer_ids = [11, 22, 33]
+
+    # 2. When.
+    url = build_answers_url(answer_ids)
+
+    # 3. Then.
+    assert url == (
+        'https://api.stackexchange.com/2.2/answers/11;22;33' +
+        '?pagesize=3&site=stackoverflow&filter=withbody'
+    )
+
+
+def test_build_post_unescapes_title():
+    '''
+    Ensures that the html escapes in a question's title are unescaped.
+    '''
+
+    # 1. Given.
+    item = question(1, 2)
+    item['title'] = 'TypeError: &#39;NoneType&#39; in &quot;f&quot; &amp; g'
+
+    # 2. When.
+    post = build_post(item, answer(2))
+
+    # 3. Then.
+    assert post.title == 'TypeError: \'NoneType\' in "f" & g'
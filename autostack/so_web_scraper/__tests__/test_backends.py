@@ -0,0 +1,107 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the so_web_scraper.backends module.
+'''
+
+from autostack.index import PostIndex
+from autostack.post import (
+    TEXT,
+    Post,
+    Segment,
+)
+from autostack.so_web_scraper.backends import (
+    accepted_posts,
+    index_accepted_posts,
+    set_backend,
+    set_index,
+)
+
+
+def test_index_accepted_posts():
+    '''
+    Ensures that indexed posts are yielded first, that posts are only
+    fetched once those run out, without repeats, and that fetched
+    posts are indexed.
+    '''
+
+    # 1. Given.
+    def make_post(post_id, title):
+        '''
+        Makes a post.
+        '''
+
+        return Post(post_id, None, title, 0, (Segment(TEXT, title),), ())
+
+    index = PostIndex(':memory:')
+    index.add(make_post(2, 'IndexError list index out of range'))
+    fetched = []
+
+    def mock_accepted_posts():
+        '''
+        Mocks the posts fetched from Stack Overflow.
+        '''
+
+        for post_id in (1, 2, 3):
+            fetched.append(post_id)
+            yield make_post(post_id, 'IndexError {}'.format(post_id))
+
+    # 2. When.
+    posts = index_accepted_posts(
+        'IndexError list index',
+        mock_accepted_posts(),
+        index
+    )
+    first = next(posts)
+    fetched_before_first = list(fetched)
+    rest = list(posts)
+
+    # 3. Then.
+    assert first.post_id == 2
+    assert fetched_before_first == []
+    assert [post.post_id for post in rest] == [1, 3]
+    assert sorted(post.post_id for post in index.search('IndexError')) == [
+        1,
+        2,
+        3,
+    ]
+
+
+def test_offline_accepted_posts(monkeypatch):
+    '''
+    Ensures that the offline backend only searches the index, falling
+    back to posts with any word of the query.
+    '''
+
+    # 1. Given.
+    def mock_fetch(*args, **kwargs):
+        # pylint: disable=unused-argument
+        '''
+        Fails, since nothing may be fetched.
+        '''
+
+        raise AssertionError('Fetched while offline.')
+
+    monkeypatch.setattr('autostack.so_web_scraper.fetch', mock_fetch)
+    index = PostIndex(':memory:')
+
+    for post_id, title in ((1, 'IndexError list'), (2, 'KeyError dict')):
+        index.add(Post(post_id, None, title, 0, (Segment(TEXT, title),), ()))
+
+    set_backend('offline')
+    set_index(index)
+
+    # 2. When.
+    try:
+        every_word = list(accepted_posts('IndexError list'))
+        any_word = list(accepted_posts('KeyError tuple'))
+        no_word = list(accepted_posts('ValueError'))
+    finally:
+        set_backend('html')
+        set_index(None)
+
+    # 3. Then.
+    assert [post.post_id for post in every_word] == [1]
+    assert [post.post_id for post in any_word] == [2]
+    assert no_word == []
@@ -5,39 +5,70 @@ Date: 10/25/2019
 Overview: Tests for the so_web_scraper package.
 '''
 
+from collections import OrderedDict
 import re
+import sys
+import time
+
 from bs4 import BeautifulSoup
+from pygments.token import Keyword, Token
 
 from autostack.so_web_scraper import (
-    accepted_posts,
     get_post_summaries,
     build_query_url,
     query_stack_overflow,
-    post_soup,
+    stream_post_summaries,
+    find_post_summaries,
+    parse_post_page,
+    fetch,
+    set_cache,
+    PooledSession,
+    get_session,
+    set_session,
+    get_post,
     has_accepted_answer,
     get_post_url,
+    parse_post,
+    parse_post_text,
     print_accepted_post,
+    render_accepted_post,
+    render_key,
     get_post_text,
     print_post_text,
     print_ul,
     print_code_block,
     get_src_code,
 )
+from autostack.so_web_scraper.backends import accepted_posts
+from autostack.post import (
+    CODE,
+    LIST,
+    QUOTE,
+    TEXT,
+    Post,
+    Segment,
+)
 from autostack.so_web_scraper.__tests__.mock_response import (
     MockResponse,
+    MockStreamResponse,
     build_mock_get
 )
+from autostack.so_web_scraper.__tests__.mock_server import (
+    MockServer,
+    build_scraper_routes
+)
 
 ANSI_ESCAPE = re.compile(r'\x1B[@-_][0-?]*[ -/]*[@-~]')
 
 
 def test_accepted_posts(monkeypatch):
     '''
-    Ensures that accepted_posts loops over each post summary.
+    Ensures that accepted_posts only fetches the post summaries with
+    an accepted answer.
     '''
 
     # 1. Given.
-    post_soup_call_count = 0
+    get_post_call_count = 0
 
     def mock_get_post_summaries(*args):
         # pylint: disable=unused-argument
@@ -57,13 +88,13 @@ def test_accepted_posts(monkeypatch):
 
         return [post_summaries]
 
-    def mock_post_soup(*args):
+    def mock_get_post(*args):
         # pylint: disable=unused-argument
         '''
-        Mocks the post_soup function
+        Mocks the get_post function
         '''
-        nonlocal post_soup_call_count
-        post_soup_call_count += 1
+        nonlocal get_post_call_count
+        get_post_call_count += 1
         return 'SOUP'
 
     monkeypatch.setattr(
@@ -72,8 +103,8 @@ def test_accepted_posts(monkeypatch):
     )
 
     monkeypatch.setattr(
-        'autostack.so_web_scraper.post_soup',
-        mock_post_soup
+        'autostack.so_web_scraper.get_post',
+        mock_get_post
     )
 
     # 2. When.
@@ -82,7 +113,223 @@ def test_accepted_posts(monkeypatch):
         pass
 
     # 3. Then.
-    assert post_soup_call_count == 15
+    assert get_post_call_count == 6
+
+
+def test_accepted_posts_prefetch_order(monkeypatch):
+    '''
+    Ensures that prefetched posts are yielded in order of relevance,
+    even when later posts are fetched first.
+    '''
+
+    # 1. Given.
+    def mock_get_post_summaries(*args):
+        # pylint: disable=unused-argument
+        '''
+        Mocks the get_post_summaries function with two pages.
+        '''
+
+        return [[0, 1, 2, 3], [4, 5, 6]]
+
+    def mock_has_accepted_answer(post_summary):
+        '''
+        Mocks the has_accepted_answer function, where odd posts don't
+        have an accepted answer.
+        '''
+
+        return post_summary % 2 == 0
+
+    def mock_get_post(post_summary):
+        '''
+        Mocks the get_post function, where earlier posts take longer.
+        '''
+
+        assert post_summary % 2 == 0
+        time.sleep((7 - post_summary) * 0.005)
+        return str(post_summary)
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.get_post_summaries',
+        mock_get_post_summaries
+    )
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.has_accepted_answer',
+        mock_has_accepted_answer
+    )
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.get_post',
+        mock_get_post
+    )
+
+    # 2. When.
+    posts = list(accepted_posts(None, prefetch=3))
+
+    # 3. Then.
+    assert posts == ['0', '2', '4', '6']
+
+
+def test_accepted_posts_close_cancels_prefetch(monkeypatch):
+    '''
+    Ensures that closing accepted_posts cancels the posts that haven't
+    started being fetched.
+    '''
+
+    # 1. Given.
+    get_post_call_count = 0
+
+    def mock_get_post_summaries(*args):
+        # pylint: disable=unused-argument
+        '''
+        Mocks the get_post_summaries function.
+        '''
+
+        return [list(range(15))]
+
+    def mock_get_post(post_summary):
+        '''
+        Mocks the get_post function.
+        '''
+
+        nonlocal get_post_call_count
+        get_post_call_count += 1
+        time.sleep(0.01)
+        return str(post_summary)
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.get_post_summaries',
+        mock_get_post_summaries
+    )
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.get_post',
+        mock_get_post
+    )
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.has_accepted_answer',
+        lambda post_summary: True
+    )
+
+    monkeypatch.setattr('autostack.so_web_scraper.POOL_SIZE', 2)
+
+    # 2. When.
+    posts = accepted_posts(None)
+    first_post = next(posts)
+    posts.close()
+    time.sleep(0.05)
+
+    # 3. Then.
+    assert first_post == '0'
+    assert get_post_call_count <= 4
+
+
+def test_accepted_posts_fetches_next_page_lazily(monkeypatch):
+    '''
+    Ensures that the next page of search results is only fetched once
+    few posts are left.
+    '''
+
+    # 1. Given.
+    page_count = 0
+
+    def mock_get_post_summaries(*args):
+        # pylint: disable=unused-argument
+        '''
+        Mocks the get_post_summaries function, counting pages.
+        '''
+
+        nonlocal page_count
+
+        for page in ([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]):
+            page_count += 1
+            yield page
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.get_post_summaries',
+        mock_get_post_summaries
+    )
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.get_post',
+        str
+    )
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.has_accepted_answer',
+        lambda post_summary: True
+    )
+
+    # 2. When.
+    posts = accepted_posts(None, prefetch=2)
+    first_posts = [next(posts) for _ in range(2)]
+    first_page_count = page_count
+    remaining_posts = list(posts)
+
+    # 3. Then.
+    assert first_posts == ['1', '2']
+    assert first_page_count == 1
+    assert remaining_posts == [str(i) for i in range(3, 11)]
+    assert page_count == 2
+
+
+def test_accepted_posts_mock_server(monkeypatch):
+    '''
+    Ensures that accepted posts are scraped in order from a local
+    stand-in for Stack Overflow, with and without streaming.
+    '''
+
+    # 1. Given.
+    routes, post_paths = build_scraper_routes('IndexError')
+
+    # 2. When.
+    with MockServer(routes) as server:
+        monkeypatch.setattr('autostack.so_web_scraper.BASE_URL', server.url)
+        streamed_posts = [
+            post.question[0].content
+            for post in accepted_posts('IndexError')
+        ]
+        posts = [
+            post.question[0].content
+            for post in accepted_posts('IndexError', stream=False)
+        ]
+
+    # 3. Then.
+    assert streamed_posts == post_paths
+    assert posts == post_paths
+
+
+def test_accepted_posts_unreachable(monkeypatch):
+    '''
+    Ensures that no posts are yielded, instead of an exception raised,
+    when Stack Overflow stalls until requests time out, or can't be
+    connected to.
+    '''
+
+    # 1. Given.
+    routes, _ = build_scraper_routes('IndexError')
+    set_session(PooledSession(timeout=(1, 0.1)))
+
+    # 2. When.
+    try:
+        with MockServer(routes, stall=0.5) as server:
+            monkeypatch.setattr(
+                'autostack.so_web_scraper.BASE_URL',
+                server.url
+            )
+            stalled = [
+                list(accepted_posts('IndexError', stream=stream))
+                for stream in (True, False)
+            ]
+
+        unreachable = list(accepted_posts('IndexError'))
+    finally:
+        set_session(None)
+
+    # 3. Then.
+    assert stalled == [[], []]
+    assert unreachable == []
 
 
 def test_get_post_summaries(monkeypatch):
@@ -185,6 +432,166 @@ def test_get_post_summaries_no_query_soup(monkeypatch):
     assert post_count == 0
 
 
+def test_get_post_summaries_stream(monkeypatch):
+    '''
+    Ensures that, when streaming, pages are yielded until a page
+    without post summaries.
+    '''
+
+    # 1. Given.
+    urls = []
+
+    def mock_stream_post_summaries(url):
+        '''
+        Mocks the stream_post_summaries function with two pages.
+        '''
+
+        urls.append(url)
+
+        if len(urls) == 1:
+            yield from ['1', '2']
+        elif len(urls) == 2:
+            yield from ['3']
+
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.stream_post_summaries',
+        mock_stream_post_summaries
+    )
+
+    # 2. When.
+    pages = [list(page) for page in get_post_summaries('Query', True)]
+
+    # 3. Then.
+    assert pages == [['1', '2'], ['3']]
+    assert len(urls) == 3
+
+
+def test_stream_post_summaries(monkeypatch):
+    '''
+    Ensures that post summaries are yielded before the whole page has
+    been downloaded, and that the page is cached once it has.
+    '''
+
+    # 1. Given.
+    path = 'autostack/so_web_scraper/__tests__/data/query_post_summaries.html'
+    html = open(path).read()
+    mock_response = MockStreamResponse(path, 200, 4096)
+    mock_cache = MockCache()
+
+    monkeypatch.setattr(
+        'requests.Session.get',
+        build_mock_get(mock_response)
+    )
+    set_cache(mock_cache)
+
+    # 2. When.
+    try:
+        post_summaries = stream_post_summaries('https://stackoverflow.com/')
+        first_post_summary = next(post_summaries)
+        chunks_read = mock_response.chunks_read
+        post_summaries = [first_post_summary] + list(post_summaries)
+    finally:
+        set_cache(None)
+
+    # 3. Then.
+    assert chunks_read < len(mock_response.chunks)
+    assert [get_post_url(post_summary) for post_summary in post_summaries] \
+        == [
+            get_post_url(post_summary)
+            for post_summary in find_post_summaries(
+                BeautifulSoup(html, 'lxml')
+            )
+        ]
+    assert mock_response.closed
+    assert mock_cache.entries == {'https://stackoverflow.com/': html}
+
+
+def test_stream_post_summaries_encoding():
+    '''
+    Ensures that a page without a charset, with or without a
+    Content-Type, is decoded as UTF-8, streamed, fetched, or cached, and
+    that a declared charset is used.
+    '''
+
+    # 1. Given.
+    text = 'caf\u00e9 \u2014'
+    html = '<div class="question-summary"><h3>{}</h3></div>'.format(text)
+    content_types = (None, 'text/html', 'text/html; charset=utf-8')
+    texts = []
+
+    # 2. When.
+    for content_type in content_types:
+        headers = {'Content-Type': content_type} if content_type else {}
+        set_cache(MockCache())
+
+        try:
+            with MockServer({'/search': (200, html)}, headers=headers) \
+                    as server:
+                url = server.url + '/search'
+                texts.extend(
+                    summary.h3.text
+                    for _ in range(2)
+                    for summary in stream_post_summaries(url)
+                )
+                set_cache(None)
+                texts.append(BeautifulSoup(fetch(url), 'lxml').h3.text)
+        finally:
+            set_cache(None)
+
+    # 3. Then.
+    assert texts == [text] * 3 * len(content_types)
+
+
+def test_stream_post_summaries_cache_hit(monkeypatch):
+    '''
+    Ensures that a cached page is parsed without a request.
+    '''
+
+    # 1. Given.
+    path = 'autostack/so_web_scraper/__tests__/data/query_post_summaries.html'
+
+    def mock_get(*args, **kwargs):
+        # pylint: disable=unused-argument
+        '''
+        Mocks requests get method, which shouldn't be called.
+        '''
+
+        raise AssertionError('Unexpected request.')
+
+    monkeypatch.setattr('requests.Session.get', mock_get)
+    set_cache(MockCache({'https://stackoverflow.com/': open(path).read()}))
+
+    # 2. When.
+    try:
+        post_summaries = list(
+            stream_post_summaries('https://stackoverflow.com/')
+        )
+    finally:
+        set_cache(None)
+
+    # 3. Then.
+    assert len(post_summaries) == 15
+
+
+def test_stream_post_summaries_bad_status(monkeypatch):
+    '''
+    Ensures that nothing is yielded when the request status is bad.
+    '''
+
+    # 1. Given.
+    path = 'autostack/so_web_scraper/__tests__/data/query_post_summaries.html'
+
+    monkeypatch.setattr('requests.Session.get', build_mock_get(
+        MockStreamResponse(path, 400, 4096)
+    ))
+
+    # 2. When.
+    post_summaries = list(stream_post_summaries(None))
+
+    # 3. Then.
+    assert not post_summaries
+
+
 def test_build_query_url():
     '''
     Ensures that the proper URL is built with build_query_url.
@@ -205,6 +612,24 @@ def test_build_query_url():
     ) == url
 
 
+def test_build_query_url_encodes_words():
+    '''
+    Ensures that the words of a query are URL encoded.
+    '''
+
+    # 1. Given.
+    query = 'TypeError  unsupported operand type(s) for +: int & str'
+
+    # 2. When.
+    url = build_query_url(query, 1)
+
+    # 3. Then.
+    assert url.endswith(
+        'q=%5Bpython%5D+TypeError+unsupported+operand+type%28s%29+for+'
+        '%2B%3A+int+%26+str'
+    )
+
+
 def test_query_stack_overflow_good_response_status(monkeypatch):
     '''
     Ensures that BeautifulSoup is returned from query_stack_overflow.
@@ -220,7 +645,7 @@ def test_query_stack_overflow_good_response_status(monkeypatch):
     )
     mock_get = build_mock_get(mock_response)
 
-    monkeypatch.setattr('requests.get', mock_get)
+    monkeypatch.setattr('requests.Session.get', mock_get)
 
     # 2. When.
     response = query_stack_overflow(None)
@@ -241,7 +666,7 @@ def test_query_stack_overflow_bad_response_status(monkeypatch):
     )
     mock_get = build_mock_get(mock_response)
 
-    monkeypatch.setattr('requests.get', mock_get)
+    monkeypatch.setattr('requests.Session.get', mock_get)
 
     # 2. When.
     response = query_stack_overflow(None)
@@ -250,7 +675,189 @@ def test_query_stack_overflow_bad_response_status(monkeypatch):
     assert not response
 
 
-def test_post_soup_no_accepted_answer(monkeypatch):
+def test_pooled_session_reuses_connections():
+    '''
+    Ensures that a pooled session keeps its connection alive across
+    requests to the same host.
+    '''
+
+    # 1. Given.
+    routes = {
+        '/questions/{}'.format(i): (200, 'Post {}'.format(i))
+        for i in range(15)
+    }
+    session = PooledSession(pool_size=2)
+
+    # 2. When.
+    with MockServer(routes) as server:
+        texts = [
+            session.get(server.url + path).text
+            for path in sorted(routes)
+        ]
+
+    # 3. Then.
+    assert texts == [routes[path][1] for path in sorted(routes)]
+    assert server.connection_count == 1
+
+
+def test_pooled_session_default_timeout(monkeypatch):
+    '''
+    Ensures that a pooled session applies its timeout, unless a
+    timeout is given.
+    '''
+
+    # 1. Given.
+    timeouts = []
+
+    def mock_request(*args, **kwargs):
+        # pylint: disable=unused-argument
+        '''
+        Mocks requests.Session.request, recording the timeout.
+        '''
+
+        timeouts.append(kwargs['timeout'])
+
+    monkeypatch.setattr('requests.Session.request', mock_request)
+    session = PooledSession(timeout=(1, 2))
+
+    # 2. When.
+    session.get('https://stackoverflow.com')
+    session.get('https://stackoverflow.com', timeout=5)
+
+    # 3. Then.
+    assert timeouts == [(1, 2), 5]
+
+
+def test_get_session():
+    '''
+    Ensures that get_session creates one shared session, unless a
+    session is set.
+    '''
+
+    # 1. Given.
+    session = PooledSession()
+
+    # 2. When.
+    set_session(None)
+    default_session = get_session()
+    same_session = get_session()
+    set_session(session)
+    injected_session = get_session()
+    set_session(None)
+
+    # 3. Then.
+    assert isinstance(default_session, PooledSession)
+    assert default_session is same_session
+    assert injected_session is session
+
+
+class MockCache:
+    '''
+    Mocks a cache with a dictionary.
+    '''
+
+    def __init__(self, entries=None):
+        '''
+        Initializes a mock cache with entries.
+        '''
+
+        self.entries = entries or {}
+
+    def get(self, key):
+        '''
+        Returns the entry for a key, or None.
+        '''
+
+        return self.entries.get(key)
+
+    def set(self, key, value):
+        '''
+        Stores an entry for a key.
+        '''
+
+        self.entries[key] = value
+
+
+def test_fetch_cache_hit(monkeypatch):
+    '''
+    Ensures that a cached response is returned without a request.
+    '''
+
+    # 1. Given.
+    def mock_get(*args):
+        # pylint: disable=unused-argument
+        '''
+        Mocks requests get method, which shouldn't be called.
+        '''
+
+        raise AssertionError('Unexpected request.')
+
+    monkeypatch.setattr('requests.Session.get', mock_get)
+    set_cache(MockCache({'https://stackoverflow.com/': '<html></html>'}))
+
+    # 2. When.
+    try:
+        text = fetch('https://stackoverflow.com/')
+    finally:
+        set_cache(None)
+
+    # 3. Then.
+    assert text == '<html></html>'
+
+
+def test_fetch_cache_miss(monkeypatch):
+    '''
+    Ensures that a response is requested, and stored in the cache,
+    when it isn't cached.
+    '''
+
+    # 1. Given.
+    path = 'autostack/so_web_scraper/__tests__/data/post_text.html'
+    mock_cache = MockCache()
+
+    monkeypatch.setattr('requests.Session.get', build_mock_get(MockResponse(
+        path,
+        200
+    )))
+    set_cache(mock_cache)
+
+    # 2. When.
+    try:
+        text = fetch('https://stackoverflow.com/')
+    finally:
+        set_cache(None)
+
+    # 3. Then.
+    assert text == open(path).read()
+    assert mock_cache.entries == {'https://stackoverflow.com/': text}
+
+
+def test_fetch_bad_status_not_cached(monkeypatch):
+    '''
+    Ensures that failed requests aren't stored in the cache.
+    '''
+
+    # 1. Given.
+    mock_cache = MockCache()
+
+    monkeypatch.setattr('requests.Session.get', build_mock_get(MockResponse(
+        'autostack/so_web_scraper/__tests__/data/post_text.html',
+        404
+    )))
+    set_cache(mock_cache)
+
+    # 2. When.
+    try:
+        text = fetch('https://stackoverflow.com/')
+    finally:
+        set_cache(None)
+
+    # 3. Then.
+    assert text is None
+    assert not mock_cache.entries
+
+
+def test_get_post_no_accepted_answer(monkeypatch):
     '''
     Ensures that None is returned when there's no accepted answer.
     '''
@@ -270,21 +877,20 @@ def test_post_soup_no_accepted_answer(monkeypatch):
     )
 
     # 2. When.
-    response_soup = post_soup(None)
+    post = get_post(None)
 
     # 3. Then.
-    assert not response_soup
+    assert not post
 
 
-def test_post_soup_accepted_answer(monkeypatch):
+def test_get_post_accepted_answer(monkeypatch):
     '''
-    Ensures that BeautifulSoup is returned when there's an accepted answer.
+    Ensures that the post is returned when there's an accepted answer.
     '''
 
     # 1. Given.
     path = 'autostack/so_web_scraper/__tests__/data/post_accepted_answer.html'
-    html = open(path).read()
-    soup = BeautifulSoup(html, 'lxml')
+    soup = BeautifulSoup(open(path).read(), 'lxml')
 
     def mock_has_accepted_answer(*args):
         # pylint: disable=unused-argument
@@ -318,16 +924,19 @@ def test_post_soup_accepted_answer(monkeypatch):
         mock_get_post_url
     )
 
-    monkeypatch.setattr('requests.get', mock_get)
+    monkeypatch.setattr('requests.Session.get', mock_get)
 
     # 2. When.
-    response_soup = post_soup(None)
+    post = get_post(None)
 
     # 3. Then.
-    assert response_soup == soup
+    assert isinstance(post, Post)
+    assert post.question == parse_post_text(get_post_text(soup, 'question'))
+    assert post.answer == \
+        parse_post_text(get_post_text(soup, 'accepted-answer'))
 
 
-def test_post_soup_bad_status(monkeypatch):
+def test_get_post_bad_status(monkeypatch):
     '''
     Ensures that None is returned when the request status is bad.
     '''
@@ -365,15 +974,52 @@ def test_post_soup_bad_status(monkeypatch):
         mock_get_post_url
     )
 
-    monkeypatch.setattr('requests.get', mock_get)
+    monkeypatch.setattr('requests.Session.get', mock_get)
 
     # 2. When.
-    response = post_soup(None)
+    response = get_post(None)
 
     # 3. Then.
     assert not response
 
 
+def test_parse_post_page_empty():
+    '''
+    Ensures that None is returned when there's no html to parse.
+    '''
+
+    # 1. Given.
+    html = ''
+
+    # 2. When.
+    post = parse_post_page(html)
+
+    # 3. Then.
+    assert post is None
+
+
+def test_parse_post_page():
+    '''
+    Ensures that the question's id, url, title and score are parsed
+    from a post's page.
+    '''
+
+    # 1. Given.
+    path = 'autostack/so_web_scraper/__tests__/data/post_accepted_answer.html'
+    html = open(path).read()
+
+    # 2. When.
+    post = parse_post_page(html)
+
+    # 3. Then.
+    assert post.post_id == 27695157
+    assert post.url.startswith('https://stackoverflow.com/questions/27695157')
+    assert post.title == 'Python - IndexError'
+    assert post.score == -5
+    assert post.question
+    assert post.answer
+
+
 def test_has_accepted_answer_false():
     '''
     Ensures that has_accepted_answer returns False when the post
@@ -478,9 +1124,9 @@ def test_get_post_url_where_url_doesnt_exist():
     assert not url
 
 
-def test_print_accepted_post_no_question(capsys, monkeypatch):
+def test_parse_post_no_question(monkeypatch):
     '''
-    Ensures that nothing is printed when no question is found on a post.
+    Ensures that None is returned when no question is found on a post.
     '''
 
     # 1. Given.
@@ -499,16 +1145,15 @@ def test_print_accepted_post_no_question(capsys, monkeypatch):
     )
 
     # 2. When.
-    print_accepted_post(None)
+    post = parse_post(None)
 
     # 3. Then.
-    captured = capsys.readouterr()
-    assert not captured.out
+    assert post is None
 
 
-def test_print_accepted_post_no_answer(capsys, monkeypatch):
+def test_parse_post_no_answer(monkeypatch):
     '''
-    Ensures that nothing is printed when no answer is found on a post.
+    Ensures that None is returned when no answer is found on a post.
     '''
 
     # 1. Given.
@@ -527,47 +1172,37 @@ def test_print_accepted_post_no_answer(capsys, monkeypatch):
     )
 
     # 2. When.
-    print_accepted_post(None)
+    post = parse_post(None)
 
     # 3. Then.
-    captured = capsys.readouterr()
-    assert not captured.out
+    assert post is None
 
 
-def test_print_accepted_post_found_question_and_answer(capsys, monkeypatch):
+def test_print_accepted_post(capsys, monkeypatch):
     '''
-    Ensures that proper output when both a question and answer are found.
+    Ensures that proper output when a post is printed.
     '''
 
     # 1. Given.
-    def mock_get_post_text(*args):
-        # pylint: disable=unused-argument
-        '''
-        Mocks the get_post_text function.
-        '''
+    post = Post(1, None, '', 0, (), ())
 
-        return True
+    monkeypatch.setattr('autostack.so_web_scraper._RENDERED', OrderedDict())
 
-    def mock_print_post_text(*args):
+    def mock_render_post_text(*args):
         # pylint: disable=unused-argument
         '''
-        Mocks the print_post_text function.
+        Mocks the render_post_text function.
         '''
 
-        return
-
-    monkeypatch.setattr(
-        'autostack.so_web_scraper.get_post_text',
-        mock_get_post_text
-    )
+        return ()
 
     monkeypatch.setattr(
-        'autostack.so_web_scraper.print_post_text',
-        mock_print_post_text
+        'autostack.so_web_scraper.render_post_text',
+        mock_render_post_text
     )
 
     # 2. When.
-    print_accepted_post(None)
+    print_accepted_post(post)
 
     # 3. Then.
     captured = capsys.readouterr()
@@ -580,6 +1215,165 @@ def test_print_accepted_post_found_question_and_answer(capsys, monkeypatch):
     )
 
 
+def test_print_accepted_post_single_write(monkeypatch):
+    '''
+    Ensures that a post, with code, is printed with a single write.
+    '''
+
+    # 1. Given.
+    post = Post(1, None, '', 0, (
+        Segment(TEXT, 'Question'),
+        Segment(LIST, ('Item 1', 'Item 2')),
+    ), (
+        Segment(CODE, 'for i in range(10):\n    print(i)\n'),
+    ))
+    writes = []
+
+    # pylint: disable=too-few-public-methods
+    class MockStdout:
+        '''
+        Mocks stdout, recording every write.
+        '''
+
+        def write(self, text):
+            # pylint: disable=no-self-use
+            '''
+            Records a write.
+            '''
+
+            writes.append(text)
+
+        def flush(self):
+            '''
+            Mocks flushing.
+            '''
+
+    monkeypatch.setattr('autostack.so_web_scraper._RENDERED', OrderedDict())
+    monkeypatch.setattr('sys.stdout', MockStdout())
+
+    # 2. When.
+    print_accepted_post(post)
+
+    # 3. Then.
+    assert len(writes) == 1
+    assert 'Item 2' in writes[0]
+    assert 'print' in writes[0]
+
+
+def test_render_accepted_post_memoized(monkeypatch):
+    '''
+    Ensures that a post is only rendered once, and that the rendered
+    post is stored in the cache.
+    '''
+
+    # 1. Given.
+    post = Post(1, None, '', 0, (Segment(TEXT, 'Question'),), ())
+    mock_cache = MockCache()
+    render_count = 0
+
+    def mock_render_post(*args):
+        # pylint: disable=unused-argument
+        '''
+        Mocks the render_post function.
+        '''
+
+        nonlocal render_count
+        render_count += 1
+        yield 'Rendered'
+        yield '\n'
+
+    monkeypatch.setattr('autostack.so_web_scraper._RENDERED', OrderedDict())
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.render_post',
+        mock_render_post
+    )
+    set_cache(mock_cache)
+
+    # 2. When.
+    try:
+        renders = [render_accepted_post(post) for _ in range(3)]
+    finally:
+        set_cache(None)
+
+    # 3. Then.
+    assert renders == ['Rendered\n'] * 3
+    assert render_count == 1
+    assert mock_cache.entries == {render_key(post): 'Rendered\n'}
+
+
+def test_render_accepted_post_cache_hit(monkeypatch):
+    '''
+    Ensures that a post rendered by an earlier run is read from the
+    cache, instead of being rendered again.
+    '''
+
+    # 1. Given.
+    post = Post(1, None, '', 0, (Segment(TEXT, 'Question'),), ())
+    mock_cache = MockCache({render_key(post): 'Cached\n'})
+
+    def mock_render_post(*args):
+        # pylint: disable=unused-argument
+        '''
+        Mocks the render_post function.
+        '''
+
+        raise AssertionError('The post was rendered again.')
+
+    monkeypatch.setattr('autostack.so_web_scraper._RENDERED', OrderedDict())
+    monkeypatch.setattr(
+        'autostack.so_web_scraper.render_post',
+        mock_render_post
+    )
+    set_cache(mock_cache)
+
+    # 2. When.
+    try:
+        rendered = render_accepted_post(post)
+    finally:
+        set_cache(None)
+
+    # 3. Then.
+    assert rendered == 'Cached\n'
+
+
+def test_render_key_revision():
+    '''
+    Ensures that an edited post is rendered under a new key.
+    '''
+
+    # 1. Given.
+    post = Post(1, None, '', 0, (Segment(TEXT, 'Question'),), ())
+    edited_post = Post(1, None, '', 0, (Segment(TEXT, 'Edited'),), ())
+
+    # 2. When.
+    key = render_key(post)
+    edited_key = render_key(edited_post)
+
+    # 3. Then.
+    assert key != edited_key
+    assert key == render_key(
+        Post(1, None, '', 0, (Segment(TEXT, 'Question'),), ())
+    )
+
+
+def test_render_key_width():
+    '''
+    Ensures that a post is rendered under a key of its own for each
+    width of terminal.
+    '''
+
+    # 1. Given.
+    post = Post(1, None, '', 0, (Segment(TEXT, 'Question'),), ())
+
+    # 2. When.
+    narrow = render_key(post, 40)
+    wide = render_key(post, 120)
+
+    # 3. Then.
+    assert narrow != wide
+    assert narrow == render_key(post, 40)
+
+
 def test_get_post_text_question():
     '''
     Ensures that the question post-text is returned for a post.
@@ -643,47 +1437,74 @@ def test_get_post_text_invalid_html_class():
     assert not post_text
 
 
-def test_print_post_text(capsys, monkeypatch):
+def test_parse_post_text():
     '''
-    Ensures that proper output when print_post_text is called.
+    Ensures that post-text is split into segments.
     '''
 
     # 1. Given.
     path = 'autostack/so_web_scraper/__tests__/data/post_text.html'
     html = open(path).read()
     post_text = BeautifulSoup(html, 'lxml').find(
-        attrs={'class', 'post-text'}
+        attrs={'class': 'post-text'}
     )
 
-    def mock_other_print_functions(*args):
+    # 2. When.
+    segments = parse_post_text(post_text)
+
+    # 3. Then.
+    assert segments == (
+        Segment(TEXT, 'Test 1'),
+        Segment(TEXT, 'Test 2'),
+        Segment(TEXT, 'Test 3'),
+        Segment(TEXT, 'Test 4'),
+        Segment(QUOTE, 'Test 5'),
+        Segment(LIST, ('Test 6',)),
+        Segment(CODE, 'Test 7'),
+    )
+
+
+def test_print_post_text(capsys, monkeypatch):
+    '''
+    Ensures that proper output when print_post_text is called.
+    '''
+
+    # 1. Given.
+    segments = (
+        Segment(TEXT, 'Test 1'),
+        Segment(TEXT, 'Test 2'),
+        Segment(QUOTE, 'Test 3'),
+        Segment(LIST, ('Test 4',)),
+        Segment(CODE, 'Test 5'),
+    )
+
+    def mock_other_render_functions(*args):
         # pylint: disable=unused-argument
         '''
-        Mocks print_ul and print_code_block functions.
+        Mocks render_ul and render_code_block functions.
         '''
 
-        return
+        return ()
 
     monkeypatch.setattr(
-        'autostack.so_web_scraper.print_ul',
-        mock_other_print_functions
+        'autostack.so_web_scraper.render_ul',
+        mock_other_render_functions
     )
 
     monkeypatch.setattr(
-        'autostack.so_web_scraper.print_code_block',
-        mock_other_print_functions
+        'autostack.so_web_scraper.render_code_block',
+        mock_other_render_functions
     )
 
     # 2. When.
-    print_post_text(post_text)
+    print_post_text(segments)
 
     # 3. Then.
     captured = capsys.readouterr()
     assert ANSI_ESCAPE.sub('', captured.out) == (
         'Test 1\n' +
         'Test 2\n' +
-        'Test 3\n' +
-        'Test 4\n' +
-        'Test 5\n'
+        'Test 3\n'
     )
 
 
@@ -698,9 +1519,10 @@ def test_print_ul_populated(capsys):
     )
     html = open(path).read()
     unordered_list = BeautifulSoup(html, 'lxml').find('ul')
+    items = tuple(item.text for item in unordered_list.find_all('li'))
 
     # 2. When.
-    print_ul(unordered_list)
+    print_ul(items)
 
     # 3. Then.
     captured = capsys.readouterr()
@@ -720,9 +1542,10 @@ def test_print_ul_empty(capsys):
     path = 'autostack/so_web_scraper/__tests__/data/post_text_ul_empty.html'
     html = open(path).read()
     unordered_list = BeautifulSoup(html, 'lxml').find('ul')
+    items = tuple(item.text for item in unordered_list.find_all('li'))
 
     # 2. When.
-    print_ul(unordered_list)
+    print_ul(items)
 
     # 3. Then.
     captured = capsys.readouterr()
@@ -738,14 +1561,6 @@ def test_print_code_block(capsys, monkeypatch):
     line_1 = 'l = [[1, 2, 3], [4, 5, 6], [7], [8, 9]]\n'
     line_2 = 'reduce(lambda x, y: x.extend(y), l)'
 
-    def mock_get_src_code(*args):
-        # pylint: disable=unused-argument
-        '''
-        Mocks the get_src_code function.
-        '''
-
-        return
-
     def mock_lex(*args):
         # pylint: disable=unused-argument
         '''
@@ -756,22 +1571,17 @@ def test_print_code_block(capsys, monkeypatch):
         nonlocal line_2
 
         responses = [
-            ('Token.Keyword', line_1),
-            ('Other', line_2)
+            (Keyword, line_1),
+            (Token.Other, line_2)
         ]
 
         for i in range(2):
             yield responses[i]
 
-    monkeypatch.setattr(
-        'autostack.so_web_scraper.get_src_code',
-        mock_get_src_code
-    )
-
     monkeypatch.setattr('pygments.lex', mock_lex)
 
     # 2. When.
-    print_code_block(None)
+    print_code_block(line_1 + line_2)
 
     # 3. Then.
     captured = capsys.readouterr()
@@ -798,3 +1608,22 @@ def test_get_src_code():
 
     # 3. Then.
     assert src_code == line_1 + line_2
+
+
+def test_get_src_code_deeply_nested():
+    '''
+    Ensures that code nested deeper than the recursion limit is
+    returned in order.
+    '''
+
+    # 1. Given.
+    depth = sys.getrecursionlimit() + 100
+    html = '<pre><code>(' + '<span>x' * depth + '</span>' * depth + \
+        ')</code></pre>'
+    code_block = BeautifulSoup(html, 'html.parser').find('code')
+
+    # 2. When.
+    src_code = get_src_code(code_block)
+
+    # 3. Then.
+    assert src_code == '(' + 'x' * depth + ')'
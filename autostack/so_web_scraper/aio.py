@@ -0,0 +1,318 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: An asyncio variant of the scraper, built on aiohttp, so that a
+single process can query Stack Overflow for many errors at once, without
+a thread per request.
+
+Only requests are made on the event loop. Pages are parsed, and the
+scraper's cache and index are read and written, in the loop's default
+executor, so that they don't hold up other queries. Posts are gotten
+from the backend, and index, set in autostack.so_web_scraper.backends;
+only the html backend is asynchronous, the api and offline backends are
+iterated in an executor of their own.
+
+Requires the async extra (pip install autostack[async]).
+
+e.g.:
+    async with create_session() as session:
+        async for post in accepted_posts(session, 'NameError'):
+            print_accepted_post(post)
+'''
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+
+from autostack.so_web_scraper import (
+    BASE_URL,
+    POOL_SIZE,
+    PREFETCH_COUNT,
+    TIMEOUT,
+    build_query_url,
+    find_post_summaries,
+    get_cache,
+    get_charset,
+    get_post_url,
+    has_accepted_answer,
+    parse_post_page,
+    parse_search_page,
+)
+from autostack.so_web_scraper import api
+from autostack.so_web_scraper.backends import (
+    get_backend,
+    get_index,
+    offline_accepted_posts,
+)
+
+
+def create_session(pool_size=POOL_SIZE, timeout=TIMEOUT):
+    '''
+    Creates an aiohttp session that keeps a pool of connections alive
+    per host. It must be created, and used, within an event loop.
+
+    Parameter {int} pool_size: the number of connections per host.
+    Parameter {tuple} timeout: the (connect, read) timeouts of
+    requests, in seconds.
+    Returns {aiohttp.ClientSession}: the session.
+    '''
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=pool_size),
+        timeout=aiohttp.ClientTimeout(
+            sock_connect=timeout[0],
+            sock_read=timeout[1]
+        )
+    )
+
+
+def accepted_posts(session, query, prefetch=PREFETCH_COUNT):
+    '''
+    Queries Stack Overflow, with the backend set by
+    autostack.so_web_scraper.backends.set_backend, for posts with
+    accepted answers. If an index is set, the posts in it that match the
+    query are yielded first, see index_accepted_posts.
+
+    Parameter {aiohttp.ClientSession} session: the session to use.
+    Parameter {str} query: the string to query Stack Overflow with.
+    Parameter {int} prefetch: the number of posts to fetch ahead, when
+    scraping.
+    Returns {async_generator}: an async generator that yields accepted
+    posts.
+    '''
+
+    backend = get_backend()
+
+    if backend == 'offline':
+        return iterate_in_executor(offline_accepted_posts(query))
+
+    if backend == 'api':
+        posts = iterate_in_executor(api.accepted_posts(query))
+    else:
+        posts = scrape_accepted_posts(session, query, prefetch)
+
+    index = get_index()
+
+    if index is not None:
+        return index_accepted_posts(query, posts, index)
+
+    return posts
+
+
+async def iterate_in_executor(posts):
+    '''
+    An async generator that iterates a blocking generator, e.g. the api
+    backend's, in an executor of its own, so that the loop isn't held
+    up. The generator is closed in the same executor, once the post
+    being gotten, if any, has been.
+
+    Parameter {generator} posts: the generator.
+    Yields {autostack.post.Post}: the generator's posts.
+    '''
+
+    loop = asyncio.get_event_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    try:
+        while True:
+            post = await loop.run_in_executor(executor, next, posts, None)
+
+            if post is None:
+                return
+
+            yield post
+    finally:
+        executor.submit(posts.close)
+        executor.shutdown(wait=False)
+
+
+async def index_accepted_posts(query, posts, index):
+    '''
+    An async generator that yields the posts in an index that match a
+    query, and then, only once those are exhausted, the posts fetched
+    from Stack Overflow, other than those already yielded. Fetched posts
+    are added to the index. The index is searched, and added to, in the
+    loop's default executor.
+
+    Parameter {str} query: the query.
+    Parameter {async_generator} posts: the posts fetched from Stack
+    Overflow, which is only started once the indexed posts are
+    exhausted.
+    Parameter {autostack.index.PostIndex} index: the index.
+    Yields {autostack.post.Post}: accepted posts.
+    '''
+
+    loop = asyncio.get_event_loop()
+    seen = set()
+
+    try:
+        for post in await loop.run_in_executor(None, index.search, query):
+            seen.add(post.post_id)
+            yield post
+
+        async for post in posts:
+            await loop.run_in_executor(None, index.add, post)
+
+            if post.post_id not in seen:
+                yield post
+    finally:
+        await posts.aclose()
+
+
+async def scrape_accepted_posts(session, query, prefetch=PREFETCH_COUNT):
+    '''
+    An async generator that scrapes Stack Overflow and yields posts
+    with accepted answers, in order of relevance. The next posts are
+    fetched concurrently while a post is being displayed, and closing
+    the generator cancels them.
+
+    Parameter {aiohttp.ClientSession} session: the session to use.
+    Parameter {str} query: the string to query Stack Overflow with.
+    Parameter {int} prefetch: the number of posts to fetch ahead.
+    Yields {autostack.post.Post}: accepted posts.
+    '''
+
+    pending = deque()
+    post_summaries = get_post_summaries(session, query)
+
+    try:
+        async for result_set in post_summaries:
+            for post_summary in result_set:
+                pending.append(asyncio.ensure_future(
+                    get_post(session, post_summary)
+                ))
+
+                # Keep the post being waited on, plus the prefetched
+                # posts, in flight.
+                while len(pending) > prefetch:
+                    post = await pending.popleft()
+
+                    if post:
+                        yield post
+
+        while pending:
+            post = await pending.popleft()
+
+            if post:
+                yield post
+    finally:
+        for task in pending:
+            task.cancel()
+
+        await post_summaries.aclose()
+
+
+async def get_post_summaries(session, query):
+    '''
+    An async generator that queries Stack Overflow and yields a
+    ResultSet of post summaries.
+
+    Parameter {aiohttp.ClientSession} session: the session to use.
+    Parameter {str} query: the string to query Stack Overflow with.
+    Yields {bs4.element.ResultSet}: ResultSet of post summaries.
+    '''
+
+    loop = asyncio.get_event_loop()
+    page = 1
+
+    while True:
+        query_url = build_query_url(query, page)
+        query_soup = await query_stack_overflow(session, query_url)
+
+        if not query_soup:
+            break
+
+        post_summaries = await loop.run_in_executor(
+            None,
+            find_post_summaries,
+            query_soup
+        )
+
+        if not post_summaries:
+            break
+
+        yield post_summaries
+
+        page += 1
+
+
+async def query_stack_overflow(session, url):
+    '''
+    Given a url, this function returns the BeautifulSoup of the
+    request, parsed in the loop's default executor.
+
+    Parameter {aiohttp.ClientSession} session: the session to use.
+    Parameter {str} url: the url to request.
+    Returns {bs4.BeautifulSoup}: the BeautifulSoup of the request.
+    '''
+
+    html = await fetch(session, url)
+
+    return await asyncio.get_event_loop().run_in_executor(
+        None,
+        parse_search_page,
+        html
+    )
+
+
+async def get_post(session, post_summary):
+    '''
+    Given a post summary, query Stack Overflow, and return the post,
+    parsed in the loop's default executor, if it has an accepted
+    answer.
+
+    Parameter {aiohttp.ClientSession} session: the session to use.
+    Parameter {bs4.Tag} post_summary: the bs4.Tag post summary.
+    Returns {autostack.post.Post}: the post, if it has an accepted
+    answer; otherwise, None.
+    '''
+
+    if not has_accepted_answer(post_summary):
+        return None
+
+    html = await fetch(session, BASE_URL + get_post_url(post_summary))
+
+    return await asyncio.get_event_loop().run_in_executor(
+        None,
+        parse_post_page,
+        html
+    )
+
+
+async def fetch(session, url):
+    '''
+    Requests a url, and returns the text of the response, going through
+    the scraper's cache, if one is set. The cache is read, and written,
+    in the loop's default executor.
+
+    Parameter {aiohttp.ClientSession} session: the session to use.
+    Parameter {str} url: the url to request.
+    Returns {str}: the text of the response, or None, if the request
+    failed, timed out, or couldn't connect.
+    '''
+
+    loop = asyncio.get_event_loop()
+    cache = get_cache()
+
+    if cache is not None:
+        text = await loop.run_in_executor(None, cache.get, url)
+
+        if text is not None:
+            return text
+
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            body = await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+
+    text = body.decode(get_charset(response), errors='replace')
+
+    if cache is not None:
+        await loop.run_in_executor(None, cache.set, url, text)
+
+    return text
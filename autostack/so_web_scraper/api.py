@@ -0,0 +1,187 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: A backend that gets posts with accepted answers from the
+Stack Exchange API, instead of scraping Stack Overflow's pages. Each
+page of results costs two small JSON requests: one for the questions,
+and one for all of their accepted answers.
+'''
+
+import html
+import json
+from urllib.parse import urlencode
+
+from bs4 import BeautifulSoup
+
+from autostack.post import Post
+from autostack.so_web_scraper import (
+    fetch,
+    parse_post_text,
+)
+
+API_URL = 'https://api.stackexchange.com/2.2'
+SITE = 'stackoverflow'
+PAGE_SIZE = 15
+
+# A built-in filter that includes the bodies of questions and answers.
+FILTER = 'withbody'
+
+
+def accepted_posts(query):
+    '''
+    A generator that queries the Stack Exchange API and yields posts
+    with accepted answers, in order of relevance.
+
+    Parameter {str} query: the string to query Stack Overflow with.
+    Yields {autostack.post.Post}: accepted posts.
+    '''
+
+    page = 1
+
+    while True:
+        search = query_api(build_search_url(query, page))
+
+        if not search:
+            break
+
+        questions = [
+            question
+            for question in search.get('items', [])
+            if 'accepted_answer_id' in question
+        ]
+        answers = get_answers(
+            [question['accepted_answer_id'] for question in questions]
+        )
+
+        for question in questions:
+            answer = answers.get(question['accepted_answer_id'])
+
+            if answer:
+                yield build_post(question, answer)
+
+        if not search.get('has_more'):
+            break
+
+        page += 1
+
+
+def get_answers(answer_ids):
+    '''
+    Gets answers, by id, in a single request.
+
+    Parameter {list} answer_ids: the ids of the answers, at most 100.
+    Returns {dict}: the answers, keyed by id.
+    '''
+
+    if not answer_ids:
+        return {}
+
+    response = query_api(build_answers_url(answer_ids))
+
+    if not response:
+        return {}
+
+    return {
+        answer['answer_id']: answer
+        for answer in response.get('items', [])
+    }
+
+
+def build_search_url(query, page):
+    '''
+    Builds a url to search for questions, about python, with accepted
+    answers.
+
+    Parameter {str} query: the string to query Stack Overflow with.
+    Parameter {int} page: the page to select in the query.
+    Returns {str}: the url.
+    '''
+
+    return '{}/search/advanced?{}'.format(API_URL, urlencode([
+        ('page', page),
+        ('pagesize', PAGE_SIZE),
+        ('order', 'desc'),
+        ('sort', 'relevance'),
+        ('accepted', 'True'),
+        ('tagged', 'python'),
+        ('q', query),
+        ('site', SITE),
+        ('filter', FILTER),
+    ]))
+
+
+def build_answers_url(answer_ids):
+    '''
+    Builds a url to get answers by id.
+
+    Parameter {list} answer_ids: the ids of the answers.
+    Returns {str}: the url.
+    '''
+
+    return '{}/answers/{}?{}'.format(
+        API_URL,
+        ';'.join(str(answer_id) for answer_id in answer_ids),
+        urlencode([
+            ('pagesize', len(answer_ids)),
+            ('site', SITE),
+            ('filter', FILTER),
+        ])
+    )
+
+
+def query_api(url):
+    '''
+    Requests a url from the Stack Exchange API.
+
+    Parameter {str} url: the url to request.
+    Returns {dict}: the decoded response, or None, if the request
+    failed.
+    '''
+
+    text = fetch(url)
+
+    if text is None:
+        return None
+
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def build_post(question, answer):
+    '''
+    Builds a post from a question and its accepted answer.
+
+    Parameter {dict} question: the question, from the API.
+    Parameter {dict} answer: the accepted answer, from the API.
+    Returns {autostack.post.Post}: the post.
+    '''
+
+    return Post(
+        post_id=question.get('question_id'),
+        url=question.get('link'),
+        # The API's titles are html escaped, e.g. &#39; for '.
+        title=html.unescape(question.get('title', '')),
+        score=question.get('score'),
+        question=parse_body(question.get('body', '')),
+        answer=parse_body(answer.get('body', '')),
+        tags=question.get('tags', ())
+    )
+
+
+def parse_body(body):
+    '''
+    Splits the html body of a question or answer into segments.
+
+    Parameter {str} body: the body, from the API.
+    Returns {tuple}: the body's segments.
+    '''
+
+    body = BeautifulSoup(body, 'lxml').body
+
+    if body is None:
+        return ()
+
+    return parse_post_text(body)
@@ -0,0 +1,152 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Gets posts with accepted answers from the backend that's set:
+the scraper, the Stack Exchange API, or the local index alone. Unless
+the backend is offline, the posts in the index, if one is set, are
+yielded first.
+'''
+
+from contextlib import closing
+
+from autostack.so_web_scraper import (
+    PREFETCH_COUNT,
+    scrape_accepted_posts,
+)
+from autostack.so_web_scraper import api
+
+# The backends accepted_posts can get posts from: 'html' scrapes
+# Stack Overflow's pages, 'api' uses the Stack Exchange API, and
+# 'offline' only searches the index, e.g. one imported from a data dump,
+# see autostack.index.dump.
+BACKENDS = ('html', 'api', 'offline')
+
+# The number of posts the offline backend finds, at most.
+OFFLINE_SEARCH_LIMIT = 50
+
+# The backend accepted_posts gets posts from, see set_backend.
+_BACKEND = 'html'
+
+# The local index posts are searched for in first, see set_index.
+_INDEX = None
+
+
+def get_backend():
+    '''
+    Returns {str}: the backend accepted_posts gets posts from.
+    '''
+
+    return _BACKEND
+
+
+def set_backend(backend):
+    '''
+    Sets the backend accepted_posts gets posts from.
+
+    Parameter {str} backend: one of BACKENDS.
+    '''
+
+    global _BACKEND  # pylint: disable=global-statement
+
+    if backend not in BACKENDS:
+        raise ValueError('Unknown backend: {}'.format(backend))
+
+    _BACKEND = backend
+
+
+def get_index():
+    '''
+    Returns {autostack.index.PostIndex}: the local index posts are
+    searched for in first, or None, if there isn't one.
+    '''
+
+    return _INDEX
+
+
+def set_index(index):
+    '''
+    Sets the local index posts are searched for in first, and that
+    the posts fetched are added to.
+
+    Parameter {autostack.index.PostIndex} index: the index, or None to
+    always search Stack Overflow.
+    '''
+
+    global _INDEX  # pylint: disable=global-statement
+    _INDEX = index
+
+
+def accepted_posts(query, prefetch=PREFETCH_COUNT, stream=True):
+    '''
+    Queries Stack Overflow, with the backend set by set_backend, for
+    posts with accepted answers. If an index is set, the posts in it
+    that match the query are yielded first, see index_accepted_posts.
+
+    Parameter {str} query: the string to query Stack Overflow with.
+    Parameter {int} prefetch: the number of posts left, at most,
+    before the next page of search results is fetched, when scraping.
+    Parameter {bool} stream: whether to stream pages of search results,
+    when scraping.
+    Returns {generator}: a generator that yields accepted posts.
+    '''
+
+    if _BACKEND == 'offline':
+        return offline_accepted_posts(query)
+
+    if _BACKEND == 'api':
+        posts = api.accepted_posts(query)
+    else:
+        posts = scrape_accepted_posts(query, prefetch, stream)
+
+    if _INDEX is not None:
+        return index_accepted_posts(query, posts, _INDEX)
+
+    return posts
+
+
+def offline_accepted_posts(query):
+    '''
+    A generator that yields the posts in the index that match a query,
+    without going over the network. If no post has every word of the
+    query, the posts with any of them are yielded.
+
+    Parameter {str} query: the query.
+    Yields {autostack.post.Post}: accepted posts.
+    '''
+
+    if _INDEX is None:
+        return
+
+    yield from (
+        _INDEX.search(query, OFFLINE_SEARCH_LIMIT) or
+        _INDEX.search(query, OFFLINE_SEARCH_LIMIT, any_word=True)
+    )
+
+
+def index_accepted_posts(query, posts, index):
+    '''
+    A generator that yields the posts in an index that match a query,
+    and then, only once those are exhausted, the posts fetched from
+    Stack Overflow, other than those already yielded. Fetched posts
+    are added to the index.
+
+    Parameter {str} query: the query.
+    Parameter {generator} posts: the posts fetched from Stack Overflow,
+    which is only started once the indexed posts are exhausted.
+    Parameter {autostack.index.PostIndex} index: the index.
+    Yields {autostack.post.Post}: accepted posts.
+    '''
+
+    seen = set()
+
+    with closing(posts):
+        for post in index.search(query):
+            seen.add(post.post_id)
+            yield post
+
+        for post in posts:
+            index.add(post)
+
+            if post.post_id not in seen:
+                yield post
@@ -0,0 +1,514 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Carries captured output from capture sessions to the display,
+over a Unix domain socket. Each capture session connects with its own
+stream of frames, each stamped with the session's id, and the time the
+output was captured, so that one listener can tell the output of any
+number of captured terminals apart.
+'''
+
+import errno
+import os
+import selectors
+import socket
+import struct
+import time
+
+# The kinds of frames: output of a capture session, and, between the
+# daemon and its clients, a subscription to errors, an error, a query
+# for a post, and a post.
+OUTPUT = 1
+SUBSCRIBE = 2
+ERROR = 3
+QUERY = 4
+POST = 5
+
+# A frame is its header, followed by its payload. The header holds the
+# kind of frame, the id of the session, the time, in seconds since the
+# epoch, and the length of the payload.
+FRAME_HEADER = struct.Struct('!BIdI')
+
+# A longer frame is a protocol error, and closes the connection.
+MAX_FRAME_SIZE = 1024 * 1024
+
+# The number of bytes received from a connection at once.
+RECV_SIZE = 64 * 1024
+
+# The most bytes that wait to be sent. Frames written while the socket
+# is full are dropped, so that a capture session is never held up by the
+# listener.
+MAX_BUFFERED = 1024 * 1024
+
+# The least number of seconds between attempts to connect, while no
+# listener is listening.
+CONNECT_INTERVAL = 1
+
+# The errors connecting to a socket no one is listening on raises.
+NOT_LISTENING = (errno.ENOENT, errno.ECONNREFUSED)
+
+
+def pack_frame(kind, session, timestamp, payload):
+    '''
+    Packs a frame.
+
+    Parameter {int} kind: the kind of frame, e.g. OUTPUT.
+    Parameter {int} session: the id of the session.
+    Parameter {float} timestamp: the time, in seconds since the epoch.
+    Parameter {bytes} payload: the frame's payload.
+    Returns {bytes}: the frame.
+    '''
+
+    return FRAME_HEADER.pack(kind, session, timestamp, len(payload)) + \
+        payload
+
+
+def send_frame(sock, kind, payload, session=0):
+    '''
+    Sends a frame, stamped with the current time, over a blocking
+    socket.
+
+    Parameter {socket.socket} sock: the socket.
+    Parameter {int} kind: the kind of frame.
+    Parameter {bytes} payload: the frame's payload.
+    Parameter {int} session: the id of the session.
+    '''
+
+    sock.sendall(pack_frame(kind, session, time.time(), payload))
+
+
+def read_frames(sock):
+    '''
+    A generator that receives frames over a blocking socket, until it
+    closes.
+
+    Parameter {socket.socket} sock: the socket.
+    Yields {tuple}: the (kind, session, timestamp, payload) of each
+    frame.
+    '''
+
+    reader = FrameReader()
+
+    while True:
+        data = sock.recv(RECV_SIZE)
+
+        if not data:
+            return
+
+        yield from reader.feed(data)
+
+
+def connect(path):
+    '''
+    Connects to a Unix domain socket.
+
+    Parameter {str} path: the path to the socket.
+    Returns {socket.socket}: the connected, blocking, socket.
+    Raises {OSError}: if no one is listening on the socket.
+    '''
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        raise
+
+    return sock
+
+
+class FrameReader:
+    '''
+    Unpacks frames from a stream of bytes, received in any number of
+    parts.
+
+    e.g.:
+        reader = FrameReader()
+
+        for kind, session, timestamp, payload in reader.feed(data):
+            ...
+    '''
+
+    def __init__(self, max_frame_size=MAX_FRAME_SIZE):
+        '''
+        Initializes a frame reader.
+
+        Parameter {int} max_frame_size: the longest payload allowed.
+        '''
+
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        '''
+        Feeds bytes to the reader.
+
+        Parameter {bytes} data: the bytes received.
+        Returns {list}: the (kind, session, timestamp, payload) of each
+        frame completed.
+        Raises {ValueError}: if a frame is too long.
+        '''
+
+        self._buffer += data
+        frames = []
+        start = 0
+
+        while len(self._buffer) - start >= FRAME_HEADER.size:
+            kind, session, timestamp, length = FRAME_HEADER.unpack_from(
+                self._buffer,
+                start
+            )
+
+            if length > self.max_frame_size:
+                raise ValueError('Frame of {} bytes is too long.'.format(
+                    length
+                ))
+
+            end = start + FRAME_HEADER.size + length
+
+            if len(self._buffer) < end:
+                break
+
+            frames.append((
+                kind,
+                session,
+                timestamp,
+                bytes(self._buffer[start + FRAME_HEADER.size:end])
+            ))
+            start = end
+
+        del self._buffer[:start]
+
+        return frames
+
+
+class Sender:
+    '''
+    Sends the output of a capture session to the listener without ever
+    blocking. The socket is connected once a listener is listening, and
+    reconnected if the listener goes away; output written meanwhile is
+    dropped.
+    '''
+
+    def __init__(self, path, session=None, max_buffered=MAX_BUFFERED,
+                 clock=time.monotonic):
+        '''
+        Initializes a sender.
+
+        Parameter {str} path: the path to the listener's socket.
+        Parameter {int} session: the id of the session, by default the
+        id of the process.
+        Parameter {int} max_buffered: the most bytes that wait to be
+        sent.
+        Parameter {function} clock: returns the current time, in
+        seconds, to space out attempts to connect.
+        '''
+
+        self.path = path
+        self.session = os.getpid() if session is None else session
+        self.max_buffered = max_buffered
+        self.clock = clock
+        self.sock = None
+        self._buffer = bytearray()
+        self._last_attempt = None
+
+    @property
+    def fd(self):
+        '''
+        Returns {int}: the socket's file descriptor, or None, if it
+        isn't connected.
+        '''
+
+        return None if self.sock is None else self.sock.fileno()
+
+    def connect(self):
+        '''
+        Connects to the listener, unless connected, or an attempt was
+        made within the last CONNECT_INTERVAL seconds.
+
+        Returns {bool}: True if connected.
+        '''
+
+        if self.sock is not None:
+            return True
+
+        now = self.clock()
+
+        if self._last_attempt is not None and \
+                now - self._last_attempt < CONNECT_INTERVAL:
+            return False
+
+        self._last_attempt = now
+
+        try:
+            sock = connect(self.path)
+        except OSError as error:
+            if error.errno not in NOT_LISTENING:
+                raise
+
+            return False
+
+        sock.setblocking(False)
+        self.sock = sock
+
+        return True
+
+    def write(self, lines, timestamp=None):
+        '''
+        Queues lines to be sent, as one frame. The frame is dropped if
+        it doesn't fit, or no listener is listening.
+
+        Parameter {list} lines: the lines, as bytes.
+        Parameter {float} timestamp: the time the lines were captured,
+        in seconds since the epoch, by default now.
+        '''
+
+        if not lines or not self.connect():
+            return
+
+        frame = pack_frame(
+            OUTPUT,
+            self.session,
+            time.time() if timestamp is None else timestamp,
+            b''.join(lines)
+        )
+
+        if len(self._buffer) + len(frame) <= self.max_buffered:
+            self._buffer += frame
+
+    def pending(self):
+        '''
+        Returns {bool}: True if bytes are waiting to be sent.
+        '''
+
+        return bool(self._buffer)
+
+    def flush(self):
+        '''
+        Sends as much of the queued bytes as the socket takes without
+        blocking.
+        '''
+
+        while self._buffer and self.sock is not None:
+            try:
+                sent = self.sock.send(self._buffer)
+            except BlockingIOError:
+                return
+            except (BrokenPipeError, ConnectionResetError):
+                # The listener went away, so what it didn't receive is
+                # lost.
+                self.close()
+                return
+
+            del self._buffer[:sent]
+
+    def close(self):
+        '''
+        Closes the socket, if it's open, dropping what wasn't sent.
+        '''
+
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+        self._buffer = bytearray()
+
+
+class Listener:
+    '''
+    Listens on a Unix domain socket for capture sessions, and
+    de-multiplexes their output.
+
+    Iterating over a listener yields (session, timestamp, line) for
+    each line of output received, and (session, None, None) when a
+    session ends.
+
+    e.g.:
+        with Listener(SOCKET_PATH) as listener:
+            for session, timestamp, line in listener:
+                ...
+    '''
+
+    def __init__(self, path, until_idle=False):
+        '''
+        Initializes a listener, and starts listening.
+
+        Parameter {str} path: the path to the socket.
+        Parameter {bool} until_idle: whether to stop once every session
+        has ended, instead of listening forever.
+        Raises {FileExistsError}: if a listener is already listening on
+        the socket.
+        '''
+
+        self.path = path
+        self.until_idle = until_idle
+        self._server = bind(path)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server, selectors.EVENT_READ)
+
+        # The frame reader, and the sessions seen, of each connection.
+        self._connections = {}
+        self._was_busy = False
+
+    def __enter__(self):
+        '''
+        Returns {Listener}: the listener.
+        '''
+
+        return self
+
+    def __exit__(self, *args):
+        '''
+        Closes the listener.
+        '''
+
+        self.close()
+
+    def __iter__(self):
+        '''
+        Yields {tuple}: (session, timestamp, line), for each line of
+        output received, or (session, None, None) when a session ends.
+        '''
+
+        while self._selector.get_map():
+            for key, _ in self._selector.select():
+                if key.fileobj is self._server:
+                    self._accept()
+                    continue
+
+                for item in self._receive(key.fileobj):
+                    yield item
+
+            if self.until_idle and self._was_busy and \
+                    not self._connections:
+                return
+
+    def _accept(self):
+        '''
+        Accepts a capture session's connection.
+        '''
+
+        try:
+            connection, _ = self._server.accept()
+        except BlockingIOError:
+            return
+
+        connection.setblocking(False)
+        self._selector.register(connection, selectors.EVENT_READ)
+        self._connections[connection] = (FrameReader(), set())
+
+    def _receive(self, connection):
+        '''
+        Receives from a connection.
+
+        Parameter {socket.socket} connection: the connection.
+        Returns {list}: the (session, timestamp, line) of each line
+        received, and (session, None, None) for the connection's sessions
+        if it closed.
+        '''
+
+        reader, sessions = self._connections[connection]
+
+        try:
+            data = connection.recv(RECV_SIZE)
+            frames = reader.feed(data)
+        except (ConnectionResetError, ValueError):
+            data = b''
+            frames = []
+
+        items = []
+
+        for kind, session, timestamp, payload in frames:
+            if kind != OUTPUT:
+                continue
+
+            # Only a connection that sends output is a session; others,
+            # e.g. bind probing whether the socket is live, don't keep
+            # an until_idle listener listening, or end it.
+            sessions.add(session)
+            self._was_busy = True
+            items.extend(
+                (session, timestamp, line)
+                for line in payload.splitlines(True)
+            )
+
+        if not data:
+            self._disconnect(connection)
+            items.extend((session, None, None) for session in sessions)
+
+        return items
+
+    def _disconnect(self, connection):
+        '''
+        Closes a connection.
+
+        Parameter {socket.socket} connection: the connection.
+        '''
+
+        self._selector.unregister(connection)
+        del self._connections[connection]
+        connection.close()
+
+    def close(self):
+        '''
+        Stops listening, closing every connection, and removes the
+        socket.
+        '''
+
+        for connection in list(self._connections):
+            self._disconnect(connection)
+
+        if self._server is not None:
+            self._selector.unregister(self._server)
+            self._server.close()
+            self._server = None
+
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+        self._selector.close()
+
+
+def bind(path):
+    '''
+    Binds a listening socket, removing the socket of a listener that
+    didn't exit cleanly, if any.
+
+    Parameter {str} path: the path to the socket.
+    Returns {socket.socket}: the socket, listening, and non-blocking.
+    Raises {FileExistsError}: if a listener is already listening on the
+    socket.
+    '''
+
+    directory = os.path.dirname(path)
+
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            probe.connect(path)
+        except OSError as error:
+            if error.errno not in NOT_LISTENING:
+                raise
+
+            os.unlink(path)
+        else:
+            raise FileExistsError(
+                'A listener is already listening on {}.'.format(path)
+            )
+        finally:
+            probe.close()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    server.setblocking(False)
+
+    return server
@@ -0,0 +1,159 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Tests for the transport package.
+'''
+
+import socket
+import threading
+
+import pytest
+
+from autostack.transport import (
+    FRAME_HEADER,
+    OUTPUT,
+    FrameReader,
+    Listener,
+    Sender,
+    pack_frame,
+)
+
+
+def test_frame_reader_partial_frames():
+    '''
+    Ensures that frames received in parts are unpacked once complete.
+    '''
+
+    # 1. Given.
+    reader = FrameReader()
+    data = pack_frame(OUTPUT, 7, 1.5, b'first\n') + \
+        pack_frame(OUTPUT, 8, 2.5, b'second\n')
+
+    # 2. When.
+    frames = [reader.feed(data[:i]) for i in (FRAME_HEADER.size, 0)]
+    frames.append(reader.feed(data[FRAME_HEADER.size:-1]))
+    frames.append(reader.feed(data[-1:]))
+
+    # 3. Then.
+    assert frames == [
+        [],
+        [],
+        [(OUTPUT, 7, 1.5, b'first\n')],
+        [(OUTPUT, 8, 2.5, b'second\n')],
+    ]
+
+
+def test_frame_reader_frame_too_long():
+    '''
+    Ensures that a frame that's too long is a protocol error.
+    '''
+
+    # 1. Given.
+    reader = FrameReader(max_frame_size=4)
+
+    # 2. When.
+    data = pack_frame(OUTPUT, 1, 0.0, b'too long')
+
+    # 3. Then.
+    with pytest.raises(ValueError):
+        reader.feed(data)
+
+
+def test_sender_not_listening(tmp_path):
+    '''
+    Ensures that output is dropped while no listener is listening.
+    '''
+
+    # 1. Given.
+    sender = Sender(str(tmp_path / 'autostack.sock'))
+
+    # 2. When.
+    sender.write([b'SyntaxError: invalid syntax\n'])
+
+    # 3. Then.
+    assert not sender.pending()
+    assert sender.fd is None
+
+
+def test_listener_sessions(tmp_path):
+    '''
+    Ensures that the output of several sessions is told apart, that the
+    end of each session is yielded, and that the listener stops once
+    every session has ended.
+    '''
+
+    # 1. Given.
+    path = str(tmp_path / 'autostack.sock')
+    listener = Listener(path, until_idle=True)
+    senders = [Sender(path, session) for session in (1, 2)]
+
+    # 2. When.
+    for sender in senders:
+        sender.write([b'Traceback (most recent call last):\n'], 10.0)
+        sender.write([b'KeyError: 1\n', b'\n'], 11.0)
+        sender.flush()
+        sender.close()
+
+    with listener:
+        items = list(listener)
+
+    # 3. Then.
+    for session in (1, 2):
+        assert [item for item in items if item[0] == session] == [
+            (session, 10.0, b'Traceback (most recent call last):\n'),
+            (session, 11.0, b'KeyError: 1\n'),
+            (session, 11.0, b'\n'),
+            (session, None, None),
+        ]
+
+
+def test_listener_already_listening(tmp_path):
+    '''
+    Ensures that a second listener can't take over the socket of one
+    that's listening, but can replace the socket of one that's gone.
+    '''
+
+    # 1. Given.
+    path = str(tmp_path / 'autostack.sock')
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    # 2. When.
+    listener = Listener(path)
+
+    # 3. Then.
+    with listener, pytest.raises(FileExistsError):
+        Listener(path)
+
+
+def test_listener_probed(tmp_path):
+    '''
+    Ensures that a second listener probing the socket doesn't end an
+    until_idle listener before any session has.
+    '''
+
+    # 1. Given.
+    path = str(tmp_path / 'autostack.sock')
+    listener = Listener(path, until_idle=True)
+    items = []
+    thread = threading.Thread(target=lambda: items.extend(listener))
+    thread.start()
+
+    # 2. When.
+    with pytest.raises(FileExistsError):
+        Listener(path)
+
+    thread.join(0.2)
+    probed_alive = thread.is_alive()
+    sender = Sender(path, 1)
+    sender.write([b'KeyError: 1\n'], 10.0)
+    sender.flush()
+    sender.close()
+    thread.join(5)
+    listener.close()
+
+    # 3. Then.
+    assert probed_alive
+    assert items == [(1, 10.0, b'KeyError: 1\n'), (1, None, None)]
@@ -0,0 +1,94 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Benchmarks the capture prefilter on a noisy terminal session
+(test runner output, and editor redraws, with a traceback now and then),
+comparing the bytes forwarded to the fifo, which script forwarded all
+of, and the time the prefilter takes.
+
+Usage: python -m benchmarks.bench_capture
+'''
+
+import random
+import time
+
+from autostack.capture import READ_SIZE, Prefilter
+
+SESSION_SIZE = 32 * 1024 * 1024
+ROUNDS = 3
+
+# One line in this many starts a traceback.
+TRACEBACK_EVERY = 5000
+
+OUTPUT_LINES = (
+    b'\x1b[32mPASSED\x1b[0m tests/test_models.py::test_create_user\r\n',
+    b'tests/test_views.py::test_index \x1b[32mPASSED\x1b[0m [ 42%]\r\n',
+    b'\x1b[2J\x1b[H\x1b[1;1Hdef save(self):\x1b[K\r\n',
+    b'\x1b[?25l\x1b[24;1H-- INSERT --\x1b[K\x1b[1;5H\x1b[?25h\r\n',
+    b'user@host:~/project$ \r\n',
+)
+
+TRACEBACK_LINES = (
+    b'Traceback (most recent call last):\r\n',
+    b'  File "app/models.py", line 42, in save\r\n',
+    b'    self.validate()\r\n',
+    b"\x1b[31mKeyError\x1b[0m: 'user_id'\r\n",
+)
+
+
+def build_session():
+    '''
+    Builds the output of a terminal session, in the chunks it's read in.
+    '''
+
+    generator = random.Random(0)
+    lines = []
+    size = 0
+
+    while size < SESSION_SIZE:
+        if generator.randrange(TRACEBACK_EVERY) == 0:
+            lines.extend(TRACEBACK_LINES)
+            size += sum(len(line) for line in TRACEBACK_LINES)
+        else:
+            lines.append(generator.choice(OUTPUT_LINES))
+            size += len(lines[-1])
+
+    session = b''.join(lines)
+
+    return [
+        session[start:start + READ_SIZE]
+        for start in range(0, len(session), READ_SIZE)
+    ]
+
+
+def main():
+    '''
+    Runs the benchmark, and prints the bytes forwarded, and the
+    prefilter's throughput.
+    '''
+
+    chunks = build_session()
+    size = sum(len(chunk) for chunk in chunks)
+    best = float('inf')
+
+    for _ in range(ROUNDS):
+        prefilter = Prefilter()
+        forwarded = 0
+        start = time.perf_counter()
+
+        for chunk in chunks:
+            forwarded += sum(len(line) for line in prefilter.feed(chunk))
+
+        best = min(best, time.perf_counter() - start)
+
+    print('session   {:10} bytes'.format(size))
+    print('forwarded {:10} bytes ({:.3%})'.format(forwarded, forwarded / size))
+    print('prefilter {:7.1f} ms {:6.1f} MB/s'.format(
+        best * 1000,
+        size / best / 1024 / 1024
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Benchmarks classifying the lines of a large captured terminal
+log (test runner output, colored with ANSI escape codes, with a
+traceback now and then), comparing the split() based checks errors used
+to be found with, and classify_line.
+
+Their throughput is close: classify_line measured 1.0 to 1.5 times as
+fast as split(), at 1.9M to 2.4M lines/s, depending on the load of the
+machine. Most of the time of either is the per line call overhead of
+Python, not the matching. classify_line is there for what it recognizes
+(ANSI escape codes, blank lines, bare exception names), not its speed.
+The rounds of the two are interleaved, so that load affects both alike.
+
+Usage: python -m benchmarks.bench_detect
+'''
+
+import random
+import time
+
+from autostack.error.detector import SYNTAX_ERRORS, classify_line
+
+LINE_COUNT = 200000
+ROUNDS = 9
+
+# One line in this many starts a traceback.
+TRACEBACK_EVERY = 500
+
+OUTPUT_LINES = (
+    b'\x1b[32mPASSED\x1b[0m tests/test_models.py::test_create_user\r\n',
+    b'tests/test_views.py::test_index \x1b[32mPASSED\x1b[0m [ 42%]\r\n',
+    b'collecting ... collected 1284 items\r\n',
+    b'  warnings.warn("deprecated", DeprecationWarning)\r\n',
+    b'\x1b[1m============ 1284 passed in 12.31s ============\x1b[0m\r\n',
+    b'$ python manage.py runserver\r\n',
+    b'\r\n',
+)
+
+TRACEBACK_LINES = (
+    b'Traceback (most recent call last):\r\n',
+    b'  File "app/models.py", line 42, in save\r\n',
+    b'    self.validate()\r\n',
+    b"\x1b[31mKeyError\x1b[0m: 'user_id'\r\n",
+)
+
+
+def build_log():
+    '''
+    Builds the lines of a captured terminal log.
+    '''
+
+    generator = random.Random(0)
+    lines = []
+
+    while len(lines) < LINE_COUNT:
+        if generator.randrange(TRACEBACK_EVERY) == 0:
+            lines.extend(TRACEBACK_LINES)
+        else:
+            lines.append(generator.choice(OUTPUT_LINES))
+
+    return lines
+
+
+def classify_split(line):
+    '''
+    Classifies a line as errors used to be found: decoded, and split
+    up to three times.
+    '''
+
+    output = line.decode('utf-8', 'replace')
+
+    try:
+        if output.split()[0][:-1] in SYNTAX_ERRORS:
+            return output.split()[0][:-1]
+        if 'Traceback' in output.split():
+            return 'Traceback'
+        if output.split()[0][-1] == ':':
+            return output.split()[0][:-1]
+    except IndexError:
+        pass
+
+    return None
+
+
+def measure(classify, lines):
+    '''
+    Measures a classify function, once.
+
+    Returns {float}: the time, in seconds, to classify every line.
+    '''
+
+    start = time.perf_counter()
+
+    for line in lines:
+        classify(line)
+
+    return time.perf_counter() - start
+
+
+def main():
+    '''
+    Runs the benchmark, and prints the throughput of each classifier,
+    and how many times as fast classify_line is.
+    '''
+
+    lines = build_log()
+    size = sum(len(line) for line in lines)
+    classifiers = (
+        ('split', classify_split),
+        ('classify_line', classify_line),
+    )
+    best = {name: float('inf') for name, _ in classifiers}
+
+    print('{} lines, {} KB'.format(len(lines), size // 1024))
+
+    for _ in range(ROUNDS):
+        for name, classify in classifiers:
+            best[name] = min(best[name], measure(classify, lines))
+
+    for name, _ in classifiers:
+        print('{:14} {:7.1f} ms {:6.2f} M lines/s {:6.1f} MB/s'.format(
+            name,
+            best[name] * 1000,
+            len(lines) / best[name] / 1e6,
+            size / best[name] / 1024 / 1024
+        ))
+
+    print('classify_line is {:.2f}x as fast as split'.format(
+        best['split'] / best['classify_line']
+    ))
+
+
+if __name__ == '__main__':
+    main()
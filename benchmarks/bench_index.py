@@ -0,0 +1,102 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Benchmarks searching the local index of posts, filled with
+synthetic posts, with queries built from errors. One post in
+ERROR_EVERY is about one of the errors queried.
+
+Usage: python -m benchmarks.bench_index
+'''
+
+import os
+import random
+import tempfile
+import time
+
+from autostack.index import PostIndex
+from autostack.post import CODE, TEXT, Post, Segment
+
+POST_COUNT = 20000
+ROUNDS = 200
+ERROR_EVERY = 20
+
+ERRORS = (
+    'TypeError NoneType object is not subscriptable',
+    'IndexError list index out of range',
+    'KeyError',
+    'AttributeError NoneType object has no attribute',
+    'ValueError invalid literal for int with base',
+    'ModuleNotFoundError No module named',
+    'UnicodeDecodeError utf codec can t decode byte in position',
+)
+
+WORDS = (
+    'python', 'list', 'dict', 'loop', 'function', 'class', 'import',
+    'string', 'file', 'json', 'request', 'pandas', 'numpy', 'django',
+    'flask', 'value', 'return', 'object', 'method', 'thread', 'error',
+)
+
+
+def build_posts():
+    '''
+    Builds synthetic posts, some about one of the errors.
+    '''
+
+    generator = random.Random(0)
+
+    for post_id in range(1, POST_COUNT + 1):
+        words = ' '.join(generator.choice(WORDS) for _ in range(60))
+
+        if generator.randrange(ERROR_EVERY) == 0:
+            title = generator.choice(ERRORS)
+        else:
+            title = ' '.join(generator.choice(WORDS) for _ in range(8))
+
+        yield Post(
+            post_id=post_id,
+            url=None,
+            title=title,
+            score=generator.randrange(1000),
+            question=(Segment(TEXT, words), Segment(CODE, words)),
+            answer=(Segment(TEXT, words),),
+            tags=('python', generator.choice(WORDS))
+        )
+
+
+def main():
+    '''
+    Runs the benchmark, and prints the search latency.
+    '''
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = PostIndex(os.path.join(directory, 'index.sqlite3'))
+
+        start = time.perf_counter()
+        index.add_many(build_posts())
+        print('indexed {} posts in {:.1f} s'.format(
+            len(index),
+            time.perf_counter() - start
+        ))
+
+        for query in ERRORS:
+            timings = []
+
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                posts = index.search(query)
+                timings.append(time.perf_counter() - start)
+
+            timings.sort()
+            print('{:60} {:2} posts, median {:5.2f} ms, p99 {:5.2f} ms'.format(
+                query,
+                len(posts),
+                timings[len(timings) // 2] * 1000,
+                timings[len(timings) * 99 // 100] * 1000
+            ))
+
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
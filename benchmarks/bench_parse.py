@@ -0,0 +1,93 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Benchmarks parsing a saved post page with BeautifulSoup,
+BeautifulSoup with a SoupStrainer, and parse_post_page, comparing
+parse time and peak memory.
+
+Usage: python -m benchmarks.bench_parse
+'''
+
+import re
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from autostack.so_web_scraper import parse_post_page
+
+POST_PATH = 'autostack/so_web_scraper/__tests__/data/post_accepted_answer.html'
+ROUNDS = 50
+
+POST_STRAINER = SoupStrainer(
+    'div',
+    class_=re.compile(r'(^|\s)(question|accepted-answer)(\s|$)')
+)
+
+
+def parse_full(html):
+    '''
+    Parses the whole page, as the scraper used to.
+    '''
+
+    return BeautifulSoup(html, 'lxml')
+
+
+def parse_strained(html):
+    '''
+    Parses only the question and accepted answer with a SoupStrainer.
+    '''
+
+    return BeautifulSoup(html, 'lxml', parse_only=POST_STRAINER)
+
+
+def measure(parse, html):
+    '''
+    Measures a parse function.
+
+    Returns {tuple}: the best time, in seconds, and the peak memory
+    of a single parse, in bytes.
+    '''
+
+    best = float('inf')
+
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        parse(html)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    post = parse(html)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    del post
+
+    return best, peak
+
+
+def main():
+    '''
+    Runs the benchmark, and prints the results of each parser.
+    '''
+
+    html = open(POST_PATH).read()
+
+    print('{} KB post page'.format(len(html) // 1024))
+
+    for name, parse in (
+            ('BeautifulSoup', parse_full),
+            ('SoupStrainer', parse_strained),
+            ('parse_post_page', parse_post_page),
+    ):
+        best, peak = measure(parse, html)
+        print('{:16} {:6.1f} ms {:8.0f} KB peak'.format(
+            name,
+            best * 1000,
+            peak / 1024
+        ))
+
+
+if __name__ == '__main__':
+    main()
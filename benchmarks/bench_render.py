@@ -0,0 +1,194 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Benchmarks rendering the saved post page, and a large post
+made of its answer repeated, comparing a write per token (as posts used
+to be printed) with a single buffered write, and with a cached render.
+Output goes to a line buffered stream, as it does to a terminal.
+
+Usage: python -m benchmarks.bench_render
+'''
+
+from collections import OrderedDict
+from contextlib import redirect_stdout
+import os
+import time
+
+import pygments
+from pygments.lexers import PythonLexer  # pylint: disable=no-name-in-module
+from termcolor import colored
+
+import autostack.so_web_scraper as so_web_scraper
+from autostack.post import CODE, LIST, Post
+from autostack.so_web_scraper import (
+    RULE,
+    SEGMENT_COLORS,
+    parse_post_page,
+    print_accepted_post,
+)
+
+POST_PATH = 'autostack/so_web_scraper/__tests__/data/post_accepted_answer.html'
+ROUNDS = 20
+
+# The colors of tokens, as posts used to be printed in.
+TOKEN_COLORS = {
+    'Token.Keyword': 'blue',
+    'Token.Name.Builtin.Pseudo': 'blue',
+    'Token.Literal.Number.Integer': 'green',
+    'Token.Literal.Number.Float': 'green',
+    'Token.Comment.Single': 'green',
+    'Token.Comment.Hashbang': 'green',
+    'Token.Literal.String.Single': 'yellow',
+    'Token.Literal.String.Double': 'yellow',
+    'Token.Literal.String.Doc': 'yellow'
+}
+
+# The number of times the answer is repeated in the large post.
+LARGE_POST_REPEAT = 200
+
+
+class CountingStream:
+    '''
+    Wraps a stream, counting writes.
+    '''
+
+    def __init__(self, stream):
+        '''
+        Initializes a counting stream.
+        '''
+
+        self.stream = stream
+        self.writes = 0
+
+    def write(self, text):
+        '''
+        Counts, and forwards, a write.
+        '''
+
+        self.writes += 1
+
+        return self.stream.write(text)
+
+    def flush(self):
+        '''
+        Flushes the stream.
+        '''
+
+        self.stream.flush()
+
+
+def print_per_token(post):
+    '''
+    Prints a post with a write per element and token, as posts used to
+    be printed.
+    '''
+
+    print(RULE)
+    print(colored('Question:', 'red'))
+    print_segments(post.question)
+    print(RULE)
+    print(colored('Answer:', 'red'))
+    print_segments(post.answer)
+    print(RULE)
+
+
+def print_segments(segments):
+    '''
+    Prints segments with a write per element and token.
+    '''
+
+    for segment in segments:
+        if segment.kind in SEGMENT_COLORS:
+            print(colored(segment.content, SEGMENT_COLORS[segment.kind]))
+        elif segment.kind == LIST:
+            for item in segment.content:
+                print(colored('    - ' + item, 'green', attrs=['bold']))
+        elif segment.kind == CODE:
+            print('')
+
+            for token, content in pygments.lex(
+                    segment.content,
+                    PythonLexer()
+            ):
+                if str(token) in TOKEN_COLORS:
+                    print(colored(content, TOKEN_COLORS[str(token)]), end='')
+                else:
+                    print(content, end='')
+
+            print('')
+
+
+def print_uncached(post):
+    '''
+    Prints a post with a single write, rendering it every time.
+    '''
+
+    so_web_scraper._RENDERED.clear()  # pylint: disable=protected-access
+    print_accepted_post(post)
+
+
+def measure(render, post, stream):
+    '''
+    Measures a render function.
+
+    Returns {tuple}: the best time, in seconds, and the number of
+    writes of a single render.
+    '''
+
+    best = float('inf')
+
+    for _ in range(ROUNDS):
+        stream.writes = 0
+
+        with redirect_stdout(stream):
+            start = time.perf_counter()
+            render(post)
+            stream.flush()
+            best = min(best, time.perf_counter() - start)
+
+    return best, stream.writes
+
+
+def main():
+    '''
+    Runs the benchmark, and prints the results of each renderer.
+    '''
+
+    post = parse_post_page(open(POST_PATH).read())
+    large_post = Post(
+        post.post_id,
+        post.url,
+        post.title,
+        post.score,
+        post.question,
+        post.answer * LARGE_POST_REPEAT
+    )
+
+    # pylint: disable=protected-access
+    so_web_scraper._RENDERED = OrderedDict()
+
+    with open(os.devnull, 'w', buffering=1) as devnull:
+        stream = CountingStream(devnull)
+
+        for name, rendered_post in (
+                ('fixture post', post),
+                ('large post', large_post),
+        ):
+            print(name)
+
+            for renderer, render in (
+                    ('per token', print_per_token),
+                    ('single write', print_uncached),
+                    ('cached', print_accepted_post),
+            ):
+                best, writes = measure(render, rendered_post, stream)
+                print('  {:12} {:8.2f} ms {:6} writes'.format(
+                    renderer,
+                    best * 1000,
+                    writes
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Benchmarks fetching a query's post pages with bare requests.get
+against a pooled session, from a local stand-in for Stack Overflow.
+
+Usage: python -m benchmarks.bench_session [connection latency in seconds]
+'''
+
+import sys
+import time
+
+import requests
+
+from autostack.so_web_scraper import PooledSession
+from autostack.so_web_scraper.__tests__.mock_server import MockServer
+
+POST_PATH = 'autostack/so_web_scraper/__tests__/data/post_accepted_answer.html'
+POST_COUNT = 15
+ROUNDS = 5
+
+
+def fetch_posts(get, url):
+    '''
+    Fetches every post page with a get function.
+
+    Parameter {function} get: requests.get, or a session's get.
+    Parameter {str} url: the url of the mock server.
+    Returns {float}: the elapsed time, in seconds.
+    '''
+
+    start = time.perf_counter()
+
+    for i in range(POST_COUNT):
+        get('{}/questions/{}'.format(url, i)).raise_for_status()
+
+    return time.perf_counter() - start
+
+
+def main():
+    '''
+    Runs the benchmark, and prints the best time of each approach.
+    '''
+
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.02
+    html = open(POST_PATH).read()
+    routes = {
+        '/questions/{}'.format(i): (200, html)
+        for i in range(POST_COUNT)
+    }
+
+    with MockServer(routes, connection_latency=latency) as server:
+        bare_time = min(
+            fetch_posts(requests.get, server.url) for _ in range(ROUNDS)
+        )
+        bare_connections = server.connection_count
+
+        server.connection_count = 0
+        pooled_time = min(
+            fetch_posts(PooledSession().get, server.url)
+            for _ in range(ROUNDS)
+        )
+        pooled_connections = server.connection_count
+
+    print('{} post pages, {:.0f} ms connection latency'.format(
+        POST_COUNT,
+        latency * 1000
+    ))
+    print('requests.get:  {:8.1f} ms, {} connections'.format(
+        bare_time * 1000,
+        bare_connections
+    ))
+    print('PooledSession: {:8.1f} ms, {} connections'.format(
+        pooled_time * 1000,
+        pooled_connections
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Benchmarks get_src_code on code blocks of thousands of lines,
+built from the code in the saved post page, with every token in its own
+span (as syntax highlighted code is), comparing the recursive version
+that concatenated strings with the iterative one.
+
+Usage: python -m benchmarks.bench_src_code
+'''
+
+import html
+import time
+
+from bs4 import BeautifulSoup
+import pygments
+from pygments.lexers import PythonLexer  # pylint: disable=no-name-in-module
+
+from autostack.post import CODE
+from autostack.so_web_scraper import get_src_code, parse_post_page
+
+POST_PATH = 'autostack/so_web_scraper/__tests__/data/post_accepted_answer.html'
+ROUNDS = 5
+LINE_COUNTS = (1000, 5000, 20000)
+
+
+def get_src_code_recursive(code_block):
+    '''
+    Gets the source code of a code block, as get_src_code used to.
+    '''
+
+    code = ''
+
+    for token in code_block:
+        try:
+            code += token
+        except TypeError:
+            code += get_src_code_recursive(token.contents)
+
+    return code
+
+
+def build_code_block(code, line_count):
+    '''
+    Builds a code block, with every token in a span, of at least
+    line_count lines, by repeating code.
+    '''
+
+    lines = code.count('\n')
+    code = code * (line_count // lines + 1)
+    spans = ''.join(
+        '<span class="{}">{}</span>'.format(
+            str(token).replace('.', '-'),
+            html.escape(content)
+        )
+        for token, content in pygments.lex(code, PythonLexer())
+    )
+
+    return BeautifulSoup(
+        '<pre><code>{}</code></pre>'.format(spans),
+        'lxml'
+    ).find('code')
+
+
+def measure(extract, code_block):
+    '''
+    Measures an extract function.
+
+    Returns {float}: the best time, in seconds.
+    '''
+
+    best = float('inf')
+
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        extract(code_block)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    '''
+    Runs the benchmark, and prints the results of each extractor.
+    '''
+
+    post = parse_post_page(open(POST_PATH).read())
+    code = ''.join(
+        segment.content
+        for segment in post.question + post.answer
+        if segment.kind == CODE
+    )
+
+    for line_count in LINE_COUNTS:
+        code_block = build_code_block(code, line_count)
+
+        assert get_src_code(code_block) == \
+            get_src_code_recursive(code_block)
+
+        print('{} lines'.format(line_count))
+
+        for name, extract in (
+                ('recursive', get_src_code_recursive),
+                ('iterative', get_src_code),
+        ):
+            print('  {:10} {:8.2f} ms'.format(
+                name,
+                measure(extract, code_block) * 1000
+            ))
+
+
+if __name__ == '__main__':
+    main()
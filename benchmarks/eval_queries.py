@@ -0,0 +1,203 @@
+'''
+Authors: Elijah Sawyers, Benjamin Sanders
+Emails: elijahsawyers@gmail.com, ben.sanders97@gmail.com
+Date: 10/18/2026
+Overview: Evaluates queries offline. Recorded tracebacks are fed through
+the error detector, and the posts about them are searched for in a local
+stand-in for Stack Overflow's search, comparing queries of the error's
+name alone, as errors used to be queried, with build_query's. Reported
+is the number of posts fetched until the post about the error.
+
+The posts searched are the results of a real search, for IndexError,
+saved with the scraper's tests: their titles are as their authors wrote
+them, not the errors' messages. Each traceback is one of the errors a
+question among them is about. The stand-in ranks posts by the number of
+the query's words in their title, and then by score, as the relevance
+tab roughly does.
+
+The error's name alone only finds the 2 questions, of 5, whose titles
+mention IndexError, and build_query finds 4, after 4.5 posts on
+average for both. Neither finds the question about two-dimensional
+arrays, whose title shares no word with the error's message.
+
+Usage: python -m benchmarks.eval_queries
+'''
+
+import os
+import re
+
+from autostack.error.detector import ErrorDetector
+from autostack.error.query import build_query
+import autostack.so_web_scraper
+from autostack.so_web_scraper import find_post_summaries, parse_search_page
+
+# Posts that are fetched before the search is given up on.
+MAX_POSTS = 50
+
+# A saved page of search results for IndexError.
+SEARCH_PAGE = os.path.join(
+    os.path.dirname(autostack.so_web_scraper.__file__),
+    '__tests__',
+    'data',
+    'query_post_summaries.html'
+)
+
+QUESTION_ID = re.compile(r'/questions/(\d+)/')
+
+# Recorded tracebacks, and the id of the question about each.
+TRACEBACKS = (
+    ('''Traceback (most recent call last):
+  File "setup.py", line 5, in <module>
+    setup(console=['app.py'])
+  File "C:\\Python36\\lib\\site-packages\\py2exe\\mf3.py", line 454, in \
+scan_opcodes
+    yield "store", (names[oparg],)
+  File "C:\\Python36\\lib\\dis.py", line 191, in _get_const_info
+    argval = const_list[const_index]
+IndexError: tuple index out of range
+''', 41578808),
+    ('''Traceback (most recent call last):
+  File "grid.py", line 3, in <module>
+    matrix[0][6] = 5
+IndexError: list assignment index out of range
+''', 6667201),
+    ('''Traceback (most recent call last):
+  File "queue.py", line 12, in <module>
+    task = tasks.pop(3)
+IndexError: pop index out of range
+''', 11520492),
+    ('''Traceback (most recent call last):
+  File "history.py", line 8, in <module>
+    latest = entries[len(entries)]
+IndexError: list index out of range
+''', 930397),
+    ('''Traceback (most recent call last):
+  File "scrape.py", line 14, in <module>
+    price = soup.find_all('td', class_='price')[0].text
+IndexError: list index out of range
+''', 44535752),
+)
+
+WORD = re.compile(r'\w+')
+
+
+def words(text):
+    '''
+    Returns {set}: the lowercase words of text.
+    '''
+
+    return set(WORD.findall(text.lower()))
+
+
+def load_posts():
+    '''
+    Loads the posts searched, from the saved page of search results.
+
+    Returns {list}: the (id, score, title) of each post, where the id is
+    the question's, even for results that are answers.
+    '''
+
+    with open(SEARCH_PAGE, encoding='utf-8') as page:
+        query_soup = parse_search_page(page.read())
+
+    posts = []
+
+    for post_summary in find_post_summaries(query_soup):
+        link = post_summary.find(attrs={'class': 'question-hyperlink'})
+        score = post_summary.find(attrs={'class': 'vote-count-post'})
+        posts.append((
+            int(QUESTION_ID.search(link['href']).group(1)),
+            int(score.get_text(strip=True)),
+            link['title']
+        ))
+
+    return posts
+
+
+def search(query):
+    '''
+    Searches the posts, as the local stand-in for Stack Overflow.
+
+    Parameter {str} query: the query.
+    Returns {list}: the ids of the posts that match any word of the
+    query, most relevant first.
+    '''
+
+    query_words = words(query)
+    ranked = []
+
+    for post_id, score, title in load_posts():
+        matches = len(query_words & words(title))
+
+        if matches:
+            ranked.append((-matches, -score, post_id))
+
+    return [post_id for _, _, post_id in sorted(ranked)]
+
+
+def detect(traceback):
+    '''
+    Feeds a recorded traceback to the error detector.
+
+    Returns {autostack.error.detector.DetectedError}: the error.
+    '''
+
+    detector = ErrorDetector()
+    error = None
+
+    for line in traceback.encode('utf-8').splitlines(True):
+        error = detector.feed(line) or error
+
+    return error
+
+
+def posts_fetched(query, post_id):
+    '''
+    Returns {int}: the number of posts fetched until the post with the
+    given id, or None, if it isn't found.
+    '''
+
+    results = search(query)[:MAX_POSTS]
+
+    if post_id not in results:
+        return None
+
+    return results.index(post_id) + 1
+
+
+def main():
+    '''
+    Runs the evaluation, and prints the posts fetched with each query.
+    '''
+
+    strategies = (
+        ('name', lambda error: error.name),
+        ('build_query', build_query),
+    )
+    totals = {name: [] for name, _ in strategies}
+
+    for traceback, post_id in TRACEBACKS:
+        error = detect(traceback)
+        row = []
+
+        for name, strategy in strategies:
+            fetched = posts_fetched(strategy(error), post_id)
+            totals[name].append(fetched)
+            row.append('-' if fetched is None else str(fetched))
+
+        print('{:40.40} {:>5} {:>12}'.format(error.message, *row))
+
+    print()
+
+    for name, fetched in totals.items():
+        hits = [count for count in fetched if count is not None]
+        print('{:12} hits {:2}/{}, mean posts fetched {:5.2f}'.format(
+            name,
+            len(hits),
+            len(fetched),
+            sum(hits) / len(hits) if hits else float('nan')
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,9 @@ setuptools.setup(
         'PyInquirer',
     ],
     extras_require={ 
+        'async': [
+            'aiohttp',
+        ],
         'development': [
             'pytest',
             'pytest-pep8',